@@ -4,6 +4,8 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import get_user_model
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError as DjangoValidationError
 
 User = get_user_model()
 
@@ -17,6 +19,14 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ('id', 'username', 'password', 'created_at')
         read_only_fields = ('id', 'created_at')
 
+    def validate(self, attrs):
+        # AUTH_PASSWORD_VALIDATORS (instanciados una vez por proceso)
+        try:
+            validate_password(attrs['password'], User(username=attrs['username']))
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError({'password': list(exc.messages)})
+        return attrs
+
     def create(self, validated_data):
         user = User.objects.create_user(
             username=validated_data['username'],
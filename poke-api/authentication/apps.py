@@ -3,4 +3,13 @@ from django.apps import AppConfig
 
 class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'authentication'
\ No newline at end of file
+    name = 'authentication'
+
+    def ready(self):
+        from django.contrib.auth.password_validation import get_default_password_validators
+
+        from authentication import signals  # noqa: F401
+
+        # Django guarda los validadores en caché; instanciarlos aquí carga la
+        # lista de contraseñas comunes al arrancar y no en el primer registro
+        get_default_password_validators()
@@ -0,0 +1,38 @@
+"""
+hashers.py
+----------
+Hashers de Django con el coste de ``settings.PASSWORD_HASHER_COSTS`` en
+lugar de los valores fijos de la clase (ver
+``poke_api/settings/passwords.py``).
+
+Usan el mismo ``algorithm`` que los originales: verifican cualquier hash
+argon2/bcrypt existente, y ``must_update`` marca para recalcular los que
+se crearon con otro coste.
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, BCryptSHA256PasswordHasher
+
+
+def _cost(name):
+    return settings.PASSWORD_HASHER_COSTS[name]
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return _cost('ARGON2_TIME_COST')
+
+    @property
+    def memory_cost(self):
+        return _cost('ARGON2_MEMORY_COST')
+
+    @property
+    def parallelism(self):
+        return _cost('ARGON2_PARALLELISM')
+
+
+class TunedBCryptSHA256PasswordHasher(BCryptSHA256PasswordHasher):
+    @property
+    def rounds(self):
+        return _cost('BCRYPT_ROUNDS')
@@ -5,6 +5,8 @@ from django.db import models
 class User(AbstractUser):
     username = models.CharField(max_length=150, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Contador de pokemon.Captura, mantenido por pokemon.services.capturas
+    capturas_count = models.PositiveSmallIntegerField(default=0)
 
     class Meta:
         db_table = 'users'
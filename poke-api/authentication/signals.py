@@ -0,0 +1,22 @@
+"""
+signals.py
+----------
+Receptores de señales del módulo de autenticación. Se conectan en
+``AuthenticationConfig.ready()``.
+"""
+
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.token_auth import user_status
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="user_status_save")
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid="user_status_delete")
+def invalidate_user_status(sender, instance, **kwargs):
+    # Al confirmar: antes, otra conexión aún leería (y guardaría) el estado anterior
+    transaction.on_commit(partial(user_status.invalidate, instance.pk))
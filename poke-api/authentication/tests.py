@@ -1,3 +1,113 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.models import TokenUser
 
-# Create your tests here.
+from authentication.api.auth_viewset import CustomTokenObtainPairSerializer
+from authentication.token_auth import user_status
+from poke_api.settings.passwords import HASHERS, hasher_costs, password_hashers
+from pokemon.models import Pokemon, Tipo
+
+User = get_user_model()
+
+
+# ============================================================
+# 🔹 PERFILES DE HASH
+# ============================================================
+class PasswordHasherProfileTests(TestCase):
+    def setUp(self):
+        self.api = APIClient()
+
+    def login(self, username, password):
+        return self.api.post("/api/auth/login/", {"username": username, "password": password}, format="json")
+
+    def test_profile_goes_first_and_keeps_the_others_for_verification(self):
+        hashers = password_hashers("bcrypt")
+        self.assertEqual(hashers[0], HASHERS["bcrypt"])
+        self.assertTrue(set(HASHERS.values()) <= set(hashers))
+        self.assertEqual(hasher_costs({"POKE_API_BCRYPT_ROUNDS": "12"})["BCRYPT_ROUNDS"], 12)
+        with self.assertRaises(ImproperlyConfigured):
+            password_hashers("md5")
+
+    @override_settings(PASSWORD_HASHERS=password_hashers("argon2"))
+    def test_login_upgrades_pbkdf2_hashes(self):
+        User.objects.create(username="ash", password=make_password("pikachu-thunder", hasher="pbkdf2_sha256"))
+
+        self.assertEqual(self.login("ash", "pikachu-thunder").status_code, 200)
+
+        self.assertTrue(User.objects.get(username="ash").password.startswith("argon2$"))
+        self.assertEqual(self.login("ash", "pikachu-thunder").status_code, 200)
+
+    @override_settings(PASSWORD_HASHERS=password_hashers("argon2"))
+    def test_login_rehashes_when_the_cost_changes(self):
+        with override_settings(PASSWORD_HASHER_COSTS={**hasher_costs({}), "ARGON2_TIME_COST": 1}):
+            User.objects.create_user(username="misty", password="starmie-water")
+        self.assertIn("t=1", User.objects.get(username="misty").password)
+
+        self.assertEqual(self.login("misty", "starmie-water").status_code, 200)
+        self.assertIn("t=2", User.objects.get(username="misty").password)
+
+
+# ============================================================
+# 🔹 REGISTRO
+# ============================================================
+class RegisterTests(TestCase):
+    def setUp(self):
+        self.api = APIClient()
+
+    def test_register_applies_password_validators(self):
+        for password in ("password123", "12345678901", "corta", "brock123"):
+            response = self.api.post("/api/auth/register/", {"username": "brock", "password": password}, format="json")
+            self.assertEqual(response.status_code, 400, password)
+            self.assertIn("password", response.json())
+        self.assertFalse(User.objects.exists())
+
+        response = self.api.post("/api/auth/register/", {"username": "brock", "password": "onix-rock-solid"}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(User.objects.get(username="brock").check_password("onix-rock-solid"))
+
+
+# ============================================================
+# 🔹 JWT SIN CONSULTA DEL USUARIO
+# ============================================================
+class StatelessJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        user_status.cache.clear()
+        tipo = Tipo.objects.create(name="electric")
+        Pokemon.objects.create(name="pikachu", hp=35, attack=55, defense=40, tipo=tipo)
+        self.user = User.objects.create_user(username="ash", password=None)
+        self.api = APIClient()
+        token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+        self.api.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_reads_skip_the_user_query_once_the_status_is_cached(self):
+        with CaptureQueriesContext(connection) as first:
+            self.assertEqual(self.api.get("/api/pokemon/capturas/").status_code, 200)
+        with CaptureQueriesContext(connection) as second:
+            response = self.api.get("/api/pokemon/capturas/")
+        self.assertEqual(len(first.captured_queries), 2)
+        self.assertEqual(len(second.captured_queries), 1)
+        self.assertIsInstance(response.wsgi_request.user, TokenUser)
+        self.assertEqual(response.wsgi_request.user.username, "ash")
+
+    def test_writes_load_the_user(self):
+        response = self.api.post("/api/pokemon/capturar/", {"name": "pikachu"}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertIsInstance(response.wsgi_request.user, User)
+        self.assertEqual([c["pokemon"]["name"] for c in self.api.get("/api/pokemon/capturas/").data], ["pikachu"])
+
+    def test_disabled_or_deleted_users_are_rejected_after_commit(self):
+        self.assertEqual(self.api.get("/api/pokemon/capturas/").status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.api.get("/api/pokemon/capturas/").status_code, 401)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.assertEqual(self.api.get("/api/pokemon/capturas/").status_code, 401)
@@ -0,0 +1,88 @@
+"""
+token_auth.py
+-------------
+Autenticación JWT sin leer la tabla ``users`` en las lecturas.
+
+``StatelessJWTAuthentication`` valida el token igual que
+``JWTAuthentication``. En los métodos seguros (GET, HEAD, OPTIONS)
+``request.user`` es un ``TokenUser`` construido con los claims
+(``user_id`` y el ``username`` que añade ``CustomTokenObtainPairSerializer``),
+sin consultar la base. Las escrituras cargan el usuario completo, como
+hasta ahora.
+
+Para no aceptar tokens de usuarios desactivados o borrados durante toda
+su vida útil, ``user_status`` guarda el estado de cada ``user_id`` en el
+backend de ``settings.AUTH_USER_STATUS_CACHE["ALIAS"]`` durante
+``TIMEOUT`` segundos (una consulta por usuario y TTL). Guardar o borrar
+un usuario invalida su entrada al confirmar la transacción (ver
+``authentication/signals.py``); con locmem, los demás procesos lo ven al
+vencer el TTL.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+
+DEFAULTS = {
+    "ALIAS": "default",
+    "TIMEOUT": 60,
+}
+
+
+class UserStatusCache:
+    """``user_id`` → activo (existe y ``is_active``), con TTL."""
+
+    def __init__(self):
+        self._configure()
+
+    def _configure(self):
+        config = {**DEFAULTS, **getattr(settings, "AUTH_USER_STATUS_CACHE", {})}
+        self.alias = config["ALIAS"]
+        self.timeout = config["TIMEOUT"]
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @staticmethod
+    def key(user_id):
+        return f"auth:user-status:{user_id}"
+
+    def is_active(self, user_id):
+        active = self.cache.get(self.key(user_id))
+        if active is None:
+            active = get_user_model().objects.filter(pk=user_id, is_active=True).exists()
+            self.cache.set(self.key(user_id), active, self.timeout)
+        return active
+
+    def invalidate(self, user_id):
+        self.cache.delete(self.key(user_id))
+
+
+user_status = UserStatusCache()
+
+
+@receiver(setting_changed)
+def _reconfigure_on_setting_change(sender, setting, **kwargs):
+    if setting in ("AUTH_USER_STATUS_CACHE", "CACHES"):
+        user_status._configure()
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        # DRF crea los autenticadores en cada petición
+        self.stateless = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        if not self.stateless:
+            return super().get_user(validated_token)
+        user = JWTStatelessUserAuthentication.get_user(self, validated_token)
+        if not user_status.is_active(user.id):
+            raise AuthenticationFailed("El usuario está inactivo o no existe.", code="user_inactive")
+        return user
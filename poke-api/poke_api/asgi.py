@@ -11,6 +11,16 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'poke_api.settings')
+os.environ.setdefault(
+    'DJANGO_SETTINGS_MODULE',
+    'poke_api.settings.production' if os.environ.get('DJANGO_ENV', '').lower() == 'production' else 'poke_api.settings',
+)
+# GET de Pokémon/Tipos/Movimientos con descarga asíncrona de la PokeAPI
+os.environ.setdefault('POKE_API_ASYNC_READS', '1')
 
 application = get_asgi_application()
+
+# Índice de búsqueda de nombres construido antes de la primera petición
+from pokemon.services.name_index import warm_name_index  # noqa: E402
+
+warm_name_index()
@@ -0,0 +1,32 @@
+"""
+Backend SQLite con PRAGMAs por conexión.
+
+Igual que ``django.db.backends.sqlite3`` más dos claves opcionales en
+``DATABASES``:
+
+ - ``PRAGMAS``: ``{"journal_mode": "WAL", ...}``, aplicados a cada conexión
+   nueva.
+ - ``TRANSACTION_MODE``: ``"IMMEDIATE"`` o ``"EXCLUSIVE"`` para el ``BEGIN``
+   de ``transaction.atomic`` (por defecto ``DEFERRED``).
+
+Ver ``poke_api/settings/database.py``.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+TRANSACTION_MODES = ("DEFERRED", "IMMEDIATE", "EXCLUSIVE")
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for pragma, value in self.settings_dict.get("PRAGMAS", {}).items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        mode = self.settings_dict.get("TRANSACTION_MODE", "DEFERRED").upper()
+        if mode not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(f"TRANSACTION_MODE debe ser uno de {TRANSACTION_MODES}.")
+        self.cursor().execute(f"BEGIN {mode}")
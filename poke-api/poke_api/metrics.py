@@ -0,0 +1,291 @@
+"""
+metrics.py
+----------
+Métricas del proceso en formato de texto de Prometheus (``/api/metrics/``).
+
+ - ``Counter``, ``Gauge`` y ``Histogram`` con etiquetas, en memoria y protegidos por
+   un lock; los histogramas usan cubetas fijas (una suma por observación).
+ - ``MetricsMiddleware`` registra por ruta (``view_name`` resuelto, nunca
+   la URL cruda) la latencia, el estado y las consultas SQL de cada
+   petición. Las consultas se cuentan con un ``execute_wrapper`` instalado
+   en cada conexión que acumula en la petición activa (``ContextVar``, así
+   que también cubre el ORM dentro de ``sync_to_async``).
+ - ``pokemon/clients.py`` registra las llamadas a la PokeAPI.
+
+Como la caché de lecturas, los valores son de este proceso: con varios
+workers, Prometheus debe consultar cada uno.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE = "unmatched"
+
+
+# ============================================================
+# 🔹 TIPOS DE MÉTRICA
+# ============================================================
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set(self, *labels, value):
+        """Fija el valor (contadores calculados al vuelo, ver ``add_collector``)."""
+        with self._lock:
+            self._values[labels] = value
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+    def total(self):
+        """Suma de todas las series (todas las etiquetas)."""
+        with self._lock:
+            return sum(self._values.values())
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # etiquetas → [conteo por cubeta (no acumulado, +Inf al final), suma]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, *labels):
+        entry = self._values.get(labels)
+        return sum(entry[0]) if entry else 0
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self):
+        with self._lock:
+            values = {labels: (list(counts), total) for labels, (counts, total) in self._values.items()}
+        for labels, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = (("le", bound if bound == "+Inf" else _format_value(float(bound))),)
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+            label_text = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(total)}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collect):
+        """``collect()`` se ejecuta en cada exposición (métricas calculadas al vuelo)."""
+        self._collectors.append(collect)
+
+    def clear(self):
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def render(self):
+        for collect in self._collectors:
+            collect()
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "poke_api_http_requests_total", "Peticiones HTTP atendidas.", ("route", "method", "status"),
+)
+http_latency = registry.histogram(
+    "poke_api_http_request_duration_seconds", "Latencia de las peticiones HTTP.", ("route", "method"),
+)
+db_queries = registry.counter(
+    "poke_api_db_queries_total", "Consultas SQL ejecutadas.", ("route",),
+)
+db_query_seconds = registry.counter(
+    "poke_api_db_query_duration_seconds_total", "Tiempo total en consultas SQL.", ("route",),
+)
+db_queries_per_request = registry.histogram(
+    "poke_api_db_queries_per_request", "Consultas SQL por petición.", ("route",), QUERY_COUNT_BUCKETS,
+)
+upstream_requests = registry.counter(
+    "poke_api_upstream_requests_total", "Llamadas a la PokeAPI.", ("resource", "outcome"),
+)
+upstream_latency = registry.histogram(
+    "poke_api_upstream_request_duration_seconds", "Latencia de las llamadas a la PokeAPI.", ("resource",),
+)
+
+
+def observe_upstream(resource, outcome, seconds):
+    """Registra una llamada de red a la PokeAPI (``outcome``: ok, not_found o error)."""
+    upstream_requests.inc(resource, outcome)
+    upstream_latency.observe(seconds, resource)
+
+
+# ============================================================
+# 🔹 CONSULTAS SQL POR PETICIÓN
+# ============================================================
+class QueryStats:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+_current_queries = ContextVar("poke_api_request_queries", default=None)
+
+
+def count_queries(execute, sql, params, many, context):
+    stats = _current_queries.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started
+
+
+def install_query_counter(conn):
+    if count_queries not in conn.execute_wrappers:
+        conn.execute_wrappers.append(count_queries)
+
+
+@receiver(connection_created)
+def _install_on_new_connection(sender, connection, **kwargs):
+    install_query_counter(connection)
+
+
+# ============================================================
+# 🔹 MIDDLEWARE
+# ============================================================
+class MetricsMiddleware:
+    """Latencia, estado y consultas SQL por ruta. Funciona bajo WSGI y ASGI."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        # La conexión pudo abrirse antes de importar este módulo
+        install_query_counter(connection)
+        stats = QueryStats()
+        token = _current_queries.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_queries.reset(token)
+        self._record(request, response, time.perf_counter() - started, stats)
+        return response
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        token = _current_queries.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_queries.reset(token)
+        self._record(request, response, time.perf_counter() - started, stats)
+        return response
+
+    @staticmethod
+    def _record(request, response, elapsed, stats):
+        match = getattr(request, "resolver_match", None)
+        route = (match.view_name or match.route) if match else UNMATCHED_ROUTE
+        method = request.method
+        http_requests.inc(route, method, str(response.status_code))
+        http_latency.observe(elapsed, route, method)
+        db_queries_per_request.observe(stats.count, route)
+        if stats.count:
+            db_queries.inc(route, amount=stats.count)
+            db_query_seconds.inc(route, amount=stats.seconds)
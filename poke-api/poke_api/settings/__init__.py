@@ -0,0 +1,11 @@
+"""
+Configuración de Django del proyecto.
+
+ - ``poke_api.settings``: desarrollo (``base.py``).
+ - ``poke_api.settings.production``: producción, seleccionada con
+   ``DJANGO_ENV=production`` (``manage.py``, ``wsgi.py``, ``asgi.py``).
+
+La base de datos de ambos perfiles se elige por entorno: ``database.py``.
+"""
+
+from .base import *  # noqa: F401,F403
@@ -0,0 +1,253 @@
+"""
+Django settings for poke_api project (configuración común y de desarrollo).
+
+``poke_api.settings`` carga este módulo; ``poke_api.settings.production``
+lo extiende para producción (``DJANGO_ENV=production``).
+
+Generated by 'django-admin startproject' using Django 5.2.7.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.2/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/5.2/ref/settings/
+"""
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from .database import database_from_env
+from .passwords import hasher_costs, password_hashers
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = 'django-insecure-jibb@+l3*)82ebcg$9+cv)^%&=b+-j9teie1920b4x&*xfx4j1'
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = True
+
+ALLOWED_HOSTS = []
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'rest_framework',
+    'rest_framework_simplejwt',
+    'corsheaders',
+    'authentication',
+    'pokemon'
+]
+
+MIDDLEWARE = [
+    # Primero: mide la petición completa (latencia, consultas SQL), ver poke_api/metrics.py
+    'poke_api.metrics.MetricsMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'poke_api.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [BASE_DIR / 'templates']
+        ,
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'poke_api.wsgi.application'
+
+# Database
+# https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# Perfil por variables de entorno (POKE_API_DB_*), ver settings/database.py
+
+DATABASES = {
+    'default': database_from_env(BASE_DIR),
+}
+
+# Hash de contraseñas: perfil y coste por variables de entorno (ver passwords.py)
+PASSWORD_HASHERS = password_hashers(os.environ.get('POKE_API_PASSWORD_HASHER', 'argon2'))
+PASSWORD_HASHER_COSTS = hasher_costs(os.environ)
+
+# Password validation
+# https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
+# Los validadores se instancian una vez por proceso, al arrancar
+# (authentication/apps.py): la lista de CommonPasswordValidator no se
+# vuelve a leer en cada registro.
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+# Internationalization
+# https://docs.djangoproject.com/en/5.2/topics/i18n/
+
+LANGUAGE_CODE = 'en-us'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_TZ = True
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/5.2/howto/static-files/
+
+STATIC_URL = 'static/'
+
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        # JWT; en lecturas, usuario desde los claims (authentication/token_auth.py)
+        'authentication.token_auth.StatelessJWTAuthentication',
+    ],
+    'DEFAULT_PERMISSION_CLASSES': [
+        'rest_framework.permissions.AllowAny',
+    ],
+    # Paginación por página con modo keyset opcional (?pagination=cursor)
+    'DEFAULT_PAGINATION_CLASS': 'pokemon.pagination.CatalogPagination',
+    'PAGE_SIZE': 50,
+    # Simulaciones de batalla (pokemon/api/battle_viewset.py), por usuario o IP;
+    # los contadores viven en la caché 'default'
+    'DEFAULT_THROTTLE_RATES': {
+        'battles': '120/min',
+        'battle_record': '30/min',
+    },
+}
+
+SIMPLE_JWT = {
+    'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
+}
+
+# Estado (activo/borrado) de los usuarios de tokens en lecturas sin consultar
+# la tabla users: un usuario desactivado deja de autenticar en TIMEOUT
+# segundos como mucho (al instante en el proceso que lo desactiva)
+AUTH_USER_STATUS_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 60,
+}
+
+# Cliente compartido de la PokeAPI (pokemon/clients.py)
+POKEAPI_CLIENT = {
+    # POKEAPI_REMOTE_FALLBACK=0: sin red; el catálogo viene de load_snapshot
+    'ENABLED': os.environ.get('POKEAPI_REMOTE_FALLBACK', '1') != '0',
+    'BASE_URL': os.environ.get('POKEAPI_BASE_URL', 'https://pokeapi.co/api/v2/'),
+    # (connect, read) en segundos, por endpoint de la PokeAPI
+    'TIMEOUTS': {
+        'default': (3.05, 8),
+        'pokemon': (3.05, 8),
+        'type': (3.05, 5),
+        'move': (3.05, 5),
+    },
+    'RETRIES': 3,
+    'BACKOFF_FACTOR': 0.3,
+    'POOL_SIZE': 20,
+    'CACHE_TTL': 60 * 60 * 24,
+    'CACHE_MAX_ENTRIES': 2048,
+    # POKEAPI_CACHE_DIR='' desactiva la caché en disco
+    'CACHE_DIR': os.environ.get('POKEAPI_CACHE_DIR', BASE_DIR / '.pokeapi_cache') or None,
+    # Conexiones simultáneas del cliente asíncrono (vistas ASGI)
+    'ASYNC_MAX_CONNECTIONS': 200,
+}
+
+# Vistas asíncronas para los GET con respaldo en la PokeAPI (pokemon/api/async_views.py).
+# poke_api/asgi.py las activa por defecto; bajo WSGI no aportan nada.
+POKEMON_ASYNC_READS = os.environ.get('POKE_API_ASYNC_READS') == '1'
+
+# Cachés de Django. 'catalog' guarda las lecturas del catálogo (pokemon/cache.py);
+# para compartirla entre procesos basta con cambiar el backend, p. ej.:
+#   'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+#   'LOCATION': BASE_DIR / '.catalog_cache',
+# o
+#   'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+#   'LOCATION': 'redis://127.0.0.1:6379/1',
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'poke-api-default',
+    },
+    'catalog': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'poke-api-catalog',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+# Caché de lecturas del catálogo (invalidación por señales, ver pokemon/signals.py)
+CATALOG_CACHE = {
+    'ALIAS': 'catalog',
+    'ENABLED': True,
+    # Red de seguridad: las entradas se invalidan al escribir, no por TTL
+    'TIMEOUT': 60 * 60,
+}
+
+# Búsqueda aproximada de nombres (GET /api/pokemon/search/, pokemon/services/name_index.py).
+# 'memory': índice de trigramas en cada proceso; 'pg_trgm': similarity() de
+# PostgreSQL (requiere la extensión pg_trgm)
+NAME_SEARCH = {
+    'BACKEND': os.environ.get('POKE_API_SEARCH_BACKEND', 'memory'),
+    # Construir el índice en memoria al arrancar (wsgi.py / asgi.py)
+    'WARM_ON_STARTUP': True,
+    'MIN_SIMILARITY': 0.3,
+    'DEFAULT_LIMIT': 10,
+    'MAX_LIMIT': 50,
+}
+
+# Rankings (GET /api/pokemon/rankings/, pokemon/services/rankings.py)
+RANKINGS = {
+    'DEFAULT_LIMIT': 100,
+    'MAX_LIMIT': 100,
+    # Batallas mínimas para entrar en el ranking por tasa de victorias
+    'MIN_BATTLES': 5,
+}
+
+CORS_ALLOWED_ORIGINS = [
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+]
+
+CORS_ALLOW_CREDENTIALS = True
+
+# User model personalizado
+AUTH_USER_MODEL = 'authentication.User'
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
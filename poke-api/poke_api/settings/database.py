@@ -0,0 +1,77 @@
+"""
+Perfiles de base de datos, elegidos por variables de entorno.
+
+``POKE_API_DB_ENGINE``:
+ - ``sqlite`` (por defecto): archivo ``POKE_API_DB_NAME`` (``db.sqlite3``).
+   Con ``tuned`` usa ``poke_api.backends.sqlite3``, que al abrir cada
+   conexión activa WAL, ``synchronous=NORMAL``, ``mmap_size`` y
+   ``busy_timeout``, y abre las transacciones con ``BEGIN IMMEDIATE``.
+ - ``postgres``: ``POKE_API_DB_NAME``, ``POKE_API_DB_USER``,
+   ``POKE_API_DB_PASSWORD``, ``POKE_API_DB_HOST``, ``POKE_API_DB_PORT``.
+   Conexiones persistentes (``POKE_API_DB_CONN_MAX_AGE`` segundos, con
+   health checks). ``POKE_API_DB_POOLER=pgbouncer`` cuando HOST/PORT
+   apuntan a un PgBouncer en modo transacción.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+POOLERS = ("", "pgbouncer")
+
+SQLITE_PRAGMAS = {
+    # Lectores y escritor en paralelo; el WAL se sincroniza en cada checkpoint
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    # Espera (ms) antes de devolver "database is locked"
+    'busy_timeout': 5000,
+}
+
+
+def sqlite_database(name, tuned=False):
+    if not tuned:
+        return {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': name,
+        }
+    return {
+        'ENGINE': 'poke_api.backends.sqlite3',
+        'NAME': name,
+        'PRAGMAS': dict(SQLITE_PRAGMAS),
+        # Toma el lock de escritura al empezar: sin esto, dos transacciones
+        # que leen y luego escriben fallan en lugar de esperar su turno.
+        # Cualquier atomic() bloquea así a los demás escritores: nada de red
+        # dentro (ver pokemon.services.fetch_pokemon).
+        'TRANSACTION_MODE': 'IMMEDIATE',
+    }
+
+
+def postgres_database(env):
+    pooler = env.get('POKE_API_DB_POOLER', '')
+    if pooler not in POOLERS:
+        raise ImproperlyConfigured(f"POKE_API_DB_POOLER debe ser uno de {POOLERS}, no '{pooler}'.")
+    return {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': env.get('POKE_API_DB_NAME', 'poke_api'),
+        'USER': env.get('POKE_API_DB_USER', 'poke_api'),
+        'PASSWORD': env.get('POKE_API_DB_PASSWORD', ''),
+        'HOST': env.get('POKE_API_DB_HOST', 'localhost'),
+        'PORT': env.get('POKE_API_DB_PORT', '6432' if pooler else '5432'),
+        'CONN_MAX_AGE': int(env.get('POKE_API_DB_CONN_MAX_AGE', 600)),
+        # Descarta la conexión persistente si el servidor la cerró
+        'CONN_HEALTH_CHECKS': True,
+        # PgBouncer en modo transacción no conserva cursores entre transacciones
+        'DISABLE_SERVER_SIDE_CURSORS': bool(pooler),
+        'OPTIONS': {'connect_timeout': 5},
+    }
+
+
+def database_from_env(base_dir, tuned=False, env=os.environ):
+    """Configuración de ``DATABASES['default']`` según ``POKE_API_DB_ENGINE``."""
+    engine = env.get('POKE_API_DB_ENGINE', 'sqlite')
+    if engine == 'sqlite':
+        return sqlite_database(env.get('POKE_API_DB_NAME', base_dir / 'db.sqlite3'), tuned=tuned)
+    if engine == 'postgres':
+        return postgres_database(env)
+    raise ImproperlyConfigured(f"POKE_API_DB_ENGINE debe ser 'sqlite' o 'postgres', no '{engine}'.")
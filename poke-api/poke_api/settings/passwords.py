@@ -0,0 +1,48 @@
+"""
+Perfiles de hash de contraseñas, elegidos por variables de entorno.
+
+``POKE_API_PASSWORD_HASHER``:
+ - ``argon2`` (por defecto): argon2id con el coste mínimo que recomienda
+   OWASP (19 MiB, 2 pasadas, 1 hilo) en lugar del de Django (100 MiB,
+   8 hilos). ``POKE_API_ARGON2_TIME_COST``, ``POKE_API_ARGON2_MEMORY_KIB``
+   y ``POKE_API_ARGON2_PARALLELISM`` lo ajustan.
+ - ``bcrypt``: bcrypt-sha256 con ``POKE_API_BCRYPT_ROUNDS`` rondas (10).
+ - ``pbkdf2``: el de Django, sin dependencias nativas.
+
+Los demás hashers siguen en la lista para verificar contraseñas antiguas:
+al iniciar sesión, Django vuelve a calcular el hash con el perfil activo
+(también cuando solo cambió el coste). Ver ``authentication/hashers.py``.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+HASHERS = {
+    'argon2': 'authentication.hashers.TunedArgon2PasswordHasher',
+    'bcrypt': 'authentication.hashers.TunedBCryptSHA256PasswordHasher',
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+}
+
+# Solo para verificar (y actualizar) hashes creados con versiones antiguas de Django
+LEGACY_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+
+def password_hashers(profile):
+    """``PASSWORD_HASHERS`` con el hasher de ``profile`` primero."""
+    if profile not in HASHERS:
+        raise ImproperlyConfigured(f"POKE_API_PASSWORD_HASHER debe ser uno de {tuple(HASHERS)}, no '{profile}'.")
+    others = [hasher for name, hasher in HASHERS.items() if name != profile]
+    return [HASHERS[profile], *others, *LEGACY_HASHERS]
+
+
+def hasher_costs(env=os.environ):
+    """Coste de los hashers ajustados (``settings.PASSWORD_HASHER_COSTS``)."""
+    return {
+        'ARGON2_TIME_COST': int(env.get('POKE_API_ARGON2_TIME_COST', 2)),
+        'ARGON2_MEMORY_COST': int(env.get('POKE_API_ARGON2_MEMORY_KIB', 19 * 1024)),
+        'ARGON2_PARALLELISM': int(env.get('POKE_API_ARGON2_PARALLELISM', 1)),
+        'BCRYPT_ROUNDS': int(env.get('POKE_API_BCRYPT_ROUNDS', 10)),
+    }
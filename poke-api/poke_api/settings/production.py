@@ -0,0 +1,38 @@
+"""
+Configuración de producción (``DJANGO_ENV=production``).
+
+Variables de entorno:
+ - ``DJANGO_SECRET_KEY`` (obligatoria) y ``DJANGO_ALLOWED_HOSTS`` (separados por comas).
+ - ``DJANGO_CORS_ALLOWED_ORIGINS`` (separados por comas).
+ - Base de datos: ``POKE_API_DB_ENGINE`` y ``POKE_API_DB_*`` (ver ``database.py``).
+   SQLite usa el perfil ajustado (WAL, ``synchronous=NORMAL``, mmap,
+   ``busy_timeout`` y ``BEGIN IMMEDIATE``); PostgreSQL, conexiones
+   persistentes con health checks y PgBouncer opcional.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *  # noqa: F401,F403
+from .base import BASE_DIR
+from .database import database_from_env
+
+
+def env_list(name, default=""):
+    return [item.strip() for item in os.environ.get(name, default).split(",") if item.strip()]
+
+
+DEBUG = os.environ.get('DJANGO_DEBUG') == '1'
+
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY', '')
+if not SECRET_KEY:
+    raise ImproperlyConfigured("DJANGO_SECRET_KEY es obligatoria en producción.")
+
+ALLOWED_HOSTS = env_list('DJANGO_ALLOWED_HOSTS', 'localhost,127.0.0.1')
+
+CORS_ALLOWED_ORIGINS = env_list('DJANGO_CORS_ALLOWED_ORIGINS')
+
+DATABASES = {
+    'default': database_from_env(BASE_DIR, tuned=True),
+}
@@ -7,7 +7,8 @@ Centraliza y documenta todas las rutas principales del proyecto Pokémon.
   - /admin/         → Panel administrativo de Django
   - /api/auth/      → Módulo de autenticación JWT (Login, Registro)
   - /api/pokemon/   → Endpoints de Pokémon, Tipos y Movimientos
-  - /api/health/    → Verificación del estado del backend
+  - /api/health/    → Estado real de la base de datos y las cachés (503 si fallan)
+  - /api/metrics/   → Métricas en formato Prometheus
   - /api/swagger/   → Documentación interactiva (Swagger UI)
   - /api/redoc/     → Documentación alternativa (Redoc UI)
 
@@ -20,27 +21,11 @@ Fecha: 2025-10-23
 # ============================================================
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
-# ============================================================
-# 🩺 HEALTH CHECK (para monitoreo rápido)
-# ============================================================
-def health_check(request):
-    """
-    Devuelve una respuesta rápida para confirmar que el backend está activo.
-    Ideal para monitoreo, despliegues o integración con frontend.
-    """
-    return JsonResponse({
-        "status": "ok",
-        "service": "PokeAPI Backend",
-        "version": "1.0.0",
-        "framework": "Django REST Framework",
-        "author": "Equipo Pokémon Project",
-    })
-
+from poke_api.views import health_check, metrics_view
 
 # ============================================================
 # 📘 CONFIGURACIÓN SWAGGER Y REDOC
@@ -81,6 +66,9 @@ urlpatterns = [
     # 🩺 Health check del backend
     path("api/health/", health_check, name="api-health"),
 
+    # 📈 Métricas (Prometheus)
+    path("api/metrics/", metrics_view, name="api-metrics"),
+
     # 📘 Swagger (interactivo) y Redoc (lectura)
     path(
         "api/swagger/",
@@ -107,6 +95,7 @@ def _startup_banner():
     print("   • Auth:           /api/auth/")
     print("   • Pokémon:        /api/pokemon/")
     print("   • Health:         /api/health/")
+    print("   • Métricas:       /api/metrics/")
     print("   • Swagger UI:     /api/swagger/")
     print("   • Redoc UI:       /api/redoc/")
     print("=" * 60 + "\n")
@@ -0,0 +1,111 @@
+"""
+views.py
+--------
+Vistas operativas del proyecto:
+
+ - ``health_check`` (``/api/health/``): comprueba de verdad la base de datos
+   y las cachés; responde 503 si alguna falla.
+ - ``metrics_view`` (``/api/metrics/``): métricas en formato Prometheus
+   (ver ``poke_api/metrics.py``), más los aciertos de la caché de lecturas.
+"""
+
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connection
+from django.http import HttpResponse, JsonResponse
+
+from poke_api.metrics import registry
+from pokemon.cache import HIT, MISS, catalog_cache
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+catalog_cache_requests = registry.counter(
+    "poke_api_catalog_cache_requests_total",
+    "Lecturas de la caché del catálogo.",
+    ("resource", "kind", "outcome"),
+)
+catalog_cache_hit_ratio = registry.gauge(
+    "poke_api_catalog_cache_hit_ratio",
+    "Proporción de aciertos de la caché del catálogo.",
+    ("resource", "kind"),
+)
+
+
+# ============================================================
+# 🩺 HEALTH CHECK
+# ============================================================
+def _timed_check(check):
+    started = time.perf_counter()
+    try:
+        detail = check()
+        result = {"status": "ok", **(detail or {})}
+    except Exception as exc:  # cualquier fallo del backend cuenta como caído
+        result = {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+    result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def _check_database():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        if cursor.fetchone() != (1,):
+            raise DatabaseError("SELECT 1 devolvió un resultado inesperado")
+    return {"vendor": connection.vendor}
+
+
+def _check_cache(alias):
+    def check():
+        cache = caches[alias]
+        key = f"health:{uuid.uuid4().hex}"
+        cache.set(key, "1", timeout=10)
+        try:
+            if cache.get(key) != "1":
+                raise RuntimeError("la escritura no se pudo leer")
+        finally:
+            cache.delete(key)
+        return {"backend": type(cache).__name__}
+
+    return check
+
+
+def health_check(request):
+    """
+    Estado real del backend: base de datos (``SELECT 1``) y cada caché de
+    ``settings.CACHES`` (escritura + lectura). 200 si todo responde, 503 si no.
+    """
+    checks = {"database": _timed_check(_check_database)}
+    for alias in settings.CACHES:
+        checks[f"cache:{alias}"] = _timed_check(_check_cache(alias))
+
+    healthy = all(check["status"] == "ok" for check in checks.values())
+    return JsonResponse(
+        {
+            "status": "ok" if healthy else "error",
+            "service": "PokeAPI Backend",
+            "version": "1.0.0",
+            "checks": checks,
+        },
+        status=200 if healthy else 503,
+    )
+
+
+# ============================================================
+# 📈 MÉTRICAS
+# ============================================================
+def _collect_catalog_cache():
+    for resource, kinds in catalog_cache.stats().items():
+        for kind, entry in kinds.items():
+            for outcome in (HIT, MISS):
+                catalog_cache_requests.set(resource, kind, outcome, value=entry[outcome])
+            catalog_cache_hit_ratio.set(resource, kind, value=entry["hit_rate"])
+
+
+registry.add_collector(_collect_catalog_cache)
+
+
+def metrics_view(request):
+    """Métricas de este proceso en formato de texto de Prometheus."""
+    return HttpResponse(registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -11,6 +11,14 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'poke_api.settings')
+os.environ.setdefault(
+    'DJANGO_SETTINGS_MODULE',
+    'poke_api.settings.production' if os.environ.get('DJANGO_ENV', '').lower() == 'production' else 'poke_api.settings',
+)
 
 application = get_wsgi_application()
+
+# Índice de búsqueda de nombres construido antes de la primera petición
+from pokemon.services.name_index import warm_name_index  # noqa: E402
+
+warm_name_index()
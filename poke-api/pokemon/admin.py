@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Tipo, Movimiento
+from .models import Batalla, Captura, Tipo, Movimiento, Efectividad
 
 @admin.register(Tipo)
 class TipoAdmin(admin.ModelAdmin):
@@ -10,4 +10,24 @@ class TipoAdmin(admin.ModelAdmin):
 class MovimientoAdmin(admin.ModelAdmin):
     list_display = ['id', 'name', 'power', 'pp', 'accuracy', 'tipo']
     list_filter = ['tipo']
+    list_select_related = ['tipo']
     search_fields = ['name']
+
+@admin.register(Efectividad)
+class EfectividadAdmin(admin.ModelAdmin):
+    list_display = ['id', 'atacante', 'defensor', 'multiplicador']
+    list_filter = ['atacante']
+    list_select_related = ['atacante', 'defensor']
+
+@admin.register(Captura)
+class CapturaAdmin(admin.ModelAdmin):
+    list_display = ['id', 'user', 'pokemon', 'created_at']
+    list_filter = ['user']
+    list_select_related = ['user', 'pokemon']
+    search_fields = ['user__username', 'pokemon__name']
+
+@admin.register(Batalla)
+class BatallaAdmin(admin.ModelAdmin):
+    list_display = ['id', 'atacante', 'defensor', 'ganador', 'turnos', 'created_at']
+    list_select_related = ['atacante', 'defensor', 'ganador']
+    search_fields = ['atacante__name', 'defensor__name']
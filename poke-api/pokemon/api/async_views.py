@@ -0,0 +1,186 @@
+"""
+async_views.py
+--------------
+Variantes asíncronas (ASGI) de los GET con respaldo en la PokeAPI:
+
+ - ``GET /api/pokemon/pokemons/<id|nombre>/``
+ - ``GET /api/pokemon/tipos/<id|nombre>/``
+ - ``GET /api/pokemon/movimientos/<id|nombre>/``
+ - ``GET /api/pokemon/random/`` (y ``pokemons/random/``)
+
+Solo el camino lento es asíncrono: si el recurso existe localmente (o el
+método no es GET), la petición se delega al viewset síncrono en un hilo,
+que conserva la caché de lecturas, los ETag y ``?fields=``. Cuando falta,
+la descarga (httpx) y la inserción (ORM asíncrono) ocurren en el event
+loop, así que un solo worker ASGI puede esperar cientos de descargas a la
+vez sin ocupar un hilo por cada una.
+
+Se registran en ``pokemon/urls.py`` cuando ``settings.POKEMON_ASYNC_READS``
+está activo (por defecto bajo ``poke_api/asgi.py``).
+"""
+
+import random
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from rest_framework.request import Request
+
+from pokemon.api.movimiento_viewset import MovimientoViewSet
+from pokemon.api.pokenmon_viewset import PokemonViewSet
+from pokemon.api.tipo_viewset import TipoViewSet
+from pokemon.clients import PokeApiError, get_async_client
+from pokemon.models import Movimiento, Pokemon, Tipo
+from pokemon.serializers import (
+    FastMovimientoSerializer,
+    FastPokemonSerializer,
+    FastTipoSerializer,
+)
+from pokemon.services import (
+    afetch_pokemon,
+    aimport_movimiento,
+    aimport_tipo,
+    catalog_lookup,
+    suggest_names,
+)
+
+DETAIL_ACTIONS = {
+    "get": "retrieve",
+    "put": "update",
+    "patch": "partial_update",
+    "delete": "destroy",
+}
+
+pokemon_detail_sync = PokemonViewSet.as_view(DETAIL_ACTIONS)
+tipo_detail_sync = TipoViewSet.as_view(DETAIL_ACTIONS)
+movimiento_detail_sync = MovimientoViewSet.as_view(DETAIL_ACTIONS)
+random_pokemon_sync = PokemonViewSet.as_view({"get": "random_pokemon"})
+
+UPSTREAM_ERROR = {"error": "Error al conectar con la PokeAPI."}
+
+
+# ============================================================
+# 🔹 UTILIDADES
+# ============================================================
+def async_csrf_exempt(view):
+    """
+    ``csrf_exempt`` para vistas ``async def``: el decorador de Django 4.2 las
+    envuelve en una función síncrona. Las escrituras delegan en DRF, que
+    aplica su propia autenticación.
+    """
+    view.csrf_exempt = True
+    return view
+
+
+async def _delegate(view, request, **kwargs):
+    response = await sync_to_async(view)(request, **kwargs)
+    # Las respuestas de DRF se renderizan de forma perezosa
+    if hasattr(response, "render"):
+        response = await sync_to_async(response.render)()
+    return response
+
+
+def _is_read(request):
+    return request.method in ("GET", "HEAD")
+
+
+async def _represent(request, fast_serializer, queryset):
+    """Misma representación que las lecturas síncronas (incluido ``?fields=``)."""
+    row = await fast_serializer.values(queryset).afirst()
+    serializer = fast_serializer(row, context={"request": Request(request)})
+    return serializer.data
+
+
+# ============================================================
+# 🔹 DETALLE
+# ============================================================
+@async_csrf_exempt
+async def pokemon_detail(request, pk):
+    lookup = catalog_lookup(pk)
+    if not _is_read(request) or await Pokemon.objects.filter(**lookup).aexists():
+        return await _delegate(pokemon_detail_sync, request, pk=pk)
+
+    try:
+        pokemon, created = await afetch_pokemon(pk)
+    except PokeApiError:
+        return JsonResponse(UPSTREAM_ERROR, status=503)
+    if pokemon is None:
+        suggestions = await sync_to_async(suggest_names)(pk, "pokemon")
+        return JsonResponse(
+            {"error": f"El Pokémon '{pk}' no existe en la PokeAPI.", "suggestions": suggestions}, status=404,
+        )
+
+    # Misma forma que el detalle síncrono: fila + movimientos (ver ``detail_representation``)
+    row = await FastPokemonSerializer.values(Pokemon.objects.filter(pk=pokemon.pk)).afirst()
+    item = FastPokemonSerializer.with_movimientos(
+        FastPokemonSerializer(row).to_representation(row),
+        [move async for move in FastPokemonSerializer.movimientos(pokemon.pk)],
+    )
+    data = FastPokemonSerializer(item, context={"request": Request(request)}).trim(item)
+    return JsonResponse(data, status=201 if created else 200)
+
+
+@async_csrf_exempt
+async def tipo_detail(request, pk):
+    if not _is_read(request) or await Tipo.objects.filter(**catalog_lookup(pk)).aexists():
+        return await _delegate(tipo_detail_sync, request, pk=pk)
+
+    try:
+        data = await get_async_client().tipo(pk)
+    except PokeApiError:
+        return JsonResponse(UPSTREAM_ERROR, status=503)
+    if data is None:
+        return JsonResponse({"error": "Tipo no encontrado"}, status=404)
+
+    tipo = await aimport_tipo(data)
+    return JsonResponse(
+        await _represent(request, FastTipoSerializer, Tipo.objects.filter(pk=tipo.pk)), status=201,
+    )
+
+
+@async_csrf_exempt
+async def movimiento_detail(request, pk):
+    if not _is_read(request) or await Movimiento.objects.filter(**catalog_lookup(pk)).aexists():
+        return await _delegate(movimiento_detail_sync, request, pk=pk)
+
+    try:
+        data = await get_async_client().movimiento(pk)
+    except PokeApiError:
+        return JsonResponse(UPSTREAM_ERROR, status=503)
+    if data is None:
+        return JsonResponse({"error": "Movimiento no encontrado"}, status=404)
+
+    movimiento = await aimport_movimiento(data)
+    queryset = Movimiento.objects.select_related("tipo").filter(pk=movimiento.pk)
+    return JsonResponse(await _represent(request, FastMovimientoSerializer, queryset), status=201)
+
+
+# ============================================================
+# 🔹 ALEATORIO
+# ============================================================
+async def random_pokemon(request):
+    """
+    Con catálogo local, delega en ``PokemonViewSet.random_pokemon`` (índice
+    en memoria, sin red). Con la base vacía, importa uno al azar sin
+    bloquear un hilo.
+    """
+    if not _is_read(request) or await Pokemon.objects.aexists():
+        return await _delegate(random_pokemon_sync, request)
+
+    count = request.GET.get("count")
+    # isascii(): isdigit() también acepta "²", que int() rechaza
+    digits = count is not None and count.isascii() and count.isdigit()
+    if count is not None and not (digits and 1 <= int(count) <= PokemonViewSet.RANDOM_MAX_COUNT):
+        # La validación (400) la resuelve la vista síncrona sin tocar la red
+        return await _delegate(random_pokemon_sync, request)
+
+    try:
+        pokemon, _ = await afetch_pokemon(random.randint(1, 151))
+    except PokeApiError:
+        pokemon = None
+    if pokemon is None:
+        return JsonResponse({"error": "No se pudo obtener un Pokémon aleatorio."}, status=503)
+
+    data = await _represent(
+        request, FastPokemonSerializer, Pokemon.objects.select_related("tipo").filter(pk=pokemon.pk),
+    )
+    return JsonResponse([data] if count is not None else data, status=201, safe=False)
@@ -0,0 +1,124 @@
+"""
+battle_viewset.py
+-----------------
+Simulación de batallas del lado del servidor.
+
+Incluye:
+ - POST /api/pokemon/battles/simulate/ → una batalla con registro por turnos
+   o, con ``runs > 1``, una estimación Monte Carlo de la tasa de victoria.
+   Con ``record: true`` (usuarios autenticados, una sola corrida y semilla
+   del servidor) la batalla se registra para los rankings
+   (``/api/pokemon/rankings/?by=win_rate``).
+
+Limitado por ``DEFAULT_THROTTLE_RATES``: ``battles`` para todas las
+simulaciones (por usuario o IP) y ``battle_record`` para las registradas.
+"""
+
+import random
+
+from rest_framework import serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotAuthenticated
+from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle, UserRateThrottle
+
+from pokemon.battle import Combatant, simulate, simulate_many
+from pokemon.services import find_local_pokemon, record_battle
+
+MAX_RUNS = 1_000_000
+
+
+# ============================================================
+# 🔹 SERIALIZADORES
+# ============================================================
+class BattleSimulationSerializer(serializers.Serializer):
+    """Parámetros de la simulación: Pokémon por ID o nombre y número de corridas."""
+
+    attacker = serializers.CharField()
+    defender = serializers.CharField()
+    runs = serializers.IntegerField(min_value=1, max_value=MAX_RUNS, default=1)
+    seed = serializers.IntegerField(required=False, allow_null=True, default=None)
+    record = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if attrs["record"]:
+            # Las estimaciones Monte Carlo no son batallas
+            if attrs["runs"] != 1:
+                raise serializers.ValidationError({"record": "Solo se registran batallas individuales (runs=1)."})
+            # Con semilla elegida por el cliente se podría repetir una victoria conocida
+            if attrs["seed"] is not None:
+                raise serializers.ValidationError(
+                    {"seed": "Las batallas registradas usan una semilla elegida por el servidor."}
+                )
+        return attrs
+
+
+class RecordedBattleThrottle(UserRateThrottle):
+    """Batallas registradas por usuario (``DEFAULT_THROTTLE_RATES["battle_record"]``)."""
+
+    scope = "battle_record"
+
+
+# ============================================================
+# 🔹 VIEWSET
+# ============================================================
+class BattleViewSet(viewsets.ViewSet):
+    """Endpoints de simulación de batallas."""
+
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "battles"
+
+    @action(detail=False, methods=["post"], url_path="simulate")
+    def simulate(self, request):
+        """
+        Simula una batalla entre dos Pokémon locales.
+
+        Ejemplo:
+        -------
+        POST /api/pokemon/battles/simulate/
+        {
+            "attacker": "charizard",
+            "defender": "venusaur",
+            "runs": 10000
+        }
+
+        Con ``"record": true`` (sin ``runs`` ni ``seed``) la respuesta
+        incluye ``battle_id``.
+        """
+        params = BattleSimulationSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+        if data["record"]:
+            if not request.user.is_authenticated:
+                raise NotAuthenticated("Registrar batallas requiere autenticación.")
+            throttle = RecordedBattleThrottle()
+            if not throttle.allow_request(request, self):
+                self.throttled(request, throttle.wait())
+
+        pokemons, combatants = {}, {}
+        for role in ("attacker", "defender"):
+            pokemon = find_local_pokemon(data[role])
+            if pokemon is None:
+                return Response(
+                    {"error": f"El Pokémon '{data[role]}' no existe en la base local."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            pokemons[role] = pokemon
+            combatants[role] = Combatant.from_pokemon(pokemon)
+
+        attacker, defender = combatants["attacker"], combatants["defender"]
+        summary = {
+            "attacker": {"name": attacker.name, "tipo": attacker.tipo, "max_hp": attacker.max_hp},
+            "defender": {"name": defender.name, "tipo": defender.tipo, "max_hp": defender.max_hp},
+        }
+
+        if data["runs"] == 1:
+            result = simulate(attacker, defender, random.Random(data["seed"]))
+            winner = combatants[result["winner"]].name if result["winner"] else None
+            battle_id = None
+            if data["record"]:
+                battle_id = record_battle(pokemons["attacker"], pokemons["defender"], result["winner"], result["turns"]).pk
+            return Response({**summary, **result, "winner": winner, "battle_id": battle_id})
+
+        stats = simulate_many(attacker, defender, data["runs"], seed=data["seed"])
+        return Response({**summary, **stats})
@@ -0,0 +1,21 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from pokemon.cache import catalog_cache
+
+
+@api_view(["GET"])
+def cache_stats(request):
+    """
+    Aciertos y fallos de la caché de lecturas del catálogo en este proceso.
+
+    Ejemplo de respuesta::
+
+        {"enabled": true, "backend": "LocMemCache",
+         "resources": {"pokemon": {"detail": {"hit": 90, "miss": 10, "hit_rate": 0.9}}}}
+    """
+    return Response({
+        "enabled": catalog_cache.enabled,
+        "backend": type(catalog_cache.backend).__name__,
+        "resources": catalog_cache.stats(),
+    })
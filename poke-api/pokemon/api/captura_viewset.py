@@ -0,0 +1,100 @@
+"""
+captura_viewset.py
+------------------
+Capturas del usuario autenticado.
+
+ - ``GET    /api/pokemon/capturas/``      → equipo del usuario (una consulta)
+ - ``POST   /api/pokemon/capturas/``      → captura por nombre (también ``/capturar/``)
+ - ``DELETE /api/pokemon/capturas/<id>/`` → libera una captura
+"""
+
+from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from pokemon.api.pokenmon_viewset import PokemonSerializer
+from pokemon.models import MAX_CAPTURAS, Captura, Pokemon, normalize_name
+from pokemon.services import (
+    CapturaDuplicadaError,
+    LimiteCapturasError,
+    capturar,
+)
+
+
+# ============================================================
+# 🔹 SERIALIZADORES
+# ============================================================
+class CapturaSerializer(serializers.ModelSerializer):
+    pokemon = PokemonSerializer(read_only=True)
+
+    class Meta:
+        model = Captura
+        fields = ["id", "pokemon", "created_at"]
+
+
+# ============================================================
+# 🔹 VIEWSET
+# ============================================================
+class CapturaViewSet(
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    """Equipo de Pokémon capturados, limitado a ``MAX_CAPTURAS`` por usuario."""
+
+    serializer_class = CapturaSerializer
+    permission_classes = [IsAuthenticated]
+    # El equipo está acotado por MAX_CAPTURAS: sin paginación (ni COUNT)
+    pagination_class = None
+
+    def get_queryset(self):
+        return (
+            # En lecturas request.user es un TokenUser (sin fila cargada)
+            Captura.objects.filter(user_id=self.request.user.id)
+            .select_related("pokemon__tipo")
+        )
+
+    def create(self, request, *args, **kwargs):
+        """
+        Captura un Pokémon existente en la base local.
+
+        Ejemplo:
+        -------
+        POST /api/pokemon/capturar/
+        {
+            "name": "Pikachu"
+        }
+        """
+        name = (request.data.get("name") or "").strip()
+        if not name:
+            return Response(
+                {"error": "Debes especificar el nombre del Pokémon."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            pokemon = Pokemon.objects.select_related("tipo").get(name_key=normalize_name(name))
+        except Pokemon.DoesNotExist:
+            return Response(
+                {"error": f"El Pokémon '{name}' no existe en la base local."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            captura, count = capturar(request.user, pokemon)
+        except LimiteCapturasError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_403_FORBIDDEN)
+        except CapturaDuplicadaError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_409_CONFLICT)
+
+        return Response(
+            {
+                "message": f"🎯 ¡Has capturado a {pokemon.name.title()}!",
+                "pokemon": PokemonSerializer(pokemon).data,
+                "captura": captura.id,
+                "capturas": count,
+                "restantes": MAX_CAPTURAS - count,
+            },
+            status=status.HTTP_201_CREATED,
+        )
@@ -0,0 +1,186 @@
+"""
+mixins.py
+---------
+Mixins compartidos por los viewsets del módulo Pokémon.
+"""
+
+import hashlib
+
+from django.db.models import Count, Func, Max, Subquery
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from pokemon.cache import HIT, MISS, catalog_cache
+
+
+class FastReadMixin:
+    """
+    Atiende ``list`` y las lecturas de detalle con un ``ValuesSerializer``
+    (filas de ``.values()`` → ``dict``) en lugar del ``ModelSerializer``,
+    que se sigue usando para crear y actualizar.
+    """
+
+    fast_serializer_class = None
+
+    def get_fast_serializer(self, rows, many=False):
+        return self.fast_serializer_class(rows, many=many, context=self.get_serializer_context())
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.fast_serializer_class.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_fast_serializer(page, many=True).data)
+        return Response(self.get_fast_serializer(queryset, many=True).data)
+
+    def fast_item(self, **lookup):
+        """Representación completa (sin ``?fields=``) del objeto que cumple ``lookup``."""
+        row = self.fast_serializer_class.values(self.get_queryset().filter(**lookup)).first()
+        return None if row is None else self.detail_representation(row)
+
+    def detail_representation(self, row):
+        """Detalle de una fila; los viewsets añaden aquí lo que el listado omite."""
+        return self.fast_serializer_class(row).to_representation(row)
+
+    def fast_detail(self, **lookup):
+        """Representación del objeto que cumple ``lookup`` o ``None`` si no existe."""
+        item = self.fast_item(**lookup)
+        return None if item is None else self.get_fast_serializer(item).trim(item)
+
+
+class CachedReadMixin:
+    """
+    Cachea ``list`` y las lecturas de detalle de ``FastReadMixin`` en
+    ``pokemon.cache.catalog_cache`` y marca cada respuesta con
+    ``X-Cache: hit|miss``. Debe ir antes de ``FastReadMixin``.
+    """
+
+    cache_resource = None
+
+    def list(self, request, *args, **kwargs):
+        key = catalog_cache.list_key(self.cache_resource, request)
+        data = catalog_cache.get_list(self.cache_resource, key)
+        if data is not None:
+            self.cache_outcome = HIT
+            return Response(data)
+
+        self.cache_outcome = MISS
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            catalog_cache.set_list(key, response.data)
+        return response
+
+    def fast_item(self, **lookup):
+        item = catalog_cache.get_detail(
+            self.cache_resource, pk=lookup.get("pk"), name_key=lookup.get("name_key"),
+        )
+        if item is not None:
+            self.cache_outcome = HIT
+            return item
+
+        self.cache_outcome = MISS
+        item = super().fast_item(**lookup)
+        if item is not None:
+            catalog_cache.set_detail(self.cache_resource, item)
+        return item
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        outcome = getattr(self, "cache_outcome", None)
+        if outcome and catalog_cache.enabled:
+            response["X-Cache"] = outcome
+        return response
+
+
+class ConditionalReadMixin:
+    """
+    ``ETag`` fuerte en las lecturas (y ``Last-Modified`` en las de detalle),
+    con respuesta 304 ante ``If-None-Match``/``If-Modified-Since`` sin
+    ejecutar el serializador ni consultar la caché. Debe ir antes de
+    ``CachedReadMixin``.
+
+    La versión se calcula sin tocar el cuerpo:
+
+     - ``etag_timestamp_field``: ``max(<campo>)`` y ``count()`` del queryset
+       en una sola consulta (en el detalle, el máximo es el ``Last-Modified``).
+       En ``list`` el máximo es el de toda la tabla (subconsulta por su
+       índice) y solo el conteo se filtra: cualquier escritura cambia el
+       máximo y cualquier borrado el conteo, y la consulta se resuelve con
+       índices aunque el filtro abarque miles de filas. El conteo se
+       reutiliza como total de la paginación (``list_count``). Los listados
+       no llevan ``Last-Modified``: un borrado no mueve el máximo (o lo hace
+       retroceder) y ``If-Modified-Since`` daría 304 con el listado cambiado.
+     - ``etag_versions``: contadores de generación de ``catalog_cache``
+       (incrementados en cada escritura) para modelos sin marcas de tiempo o
+       incrustados en la respuesta. Con varios procesos, el backend de la
+       caché debe ser compartido para que el contador lo sea.
+
+    ``list`` se cubre aquí; los ``retrieve`` propios llaman a
+    ``not_modified(request, queryset)`` antes de buscar el objeto.
+    """
+
+    etag_timestamp_field = None
+    etag_versions = ()
+
+    def read_validators(self, queryset, table_wide=False):
+        """
+        ``(versión, última modificación o None)`` de las filas de ``queryset``.
+
+        Con ``table_wide`` la última modificación es la de toda la tabla.
+        """
+        parts = [str(catalog_cache.generation(resource)) for resource in self.etag_versions]
+        last_modified = None
+        if self.etag_timestamp_field:
+            field = self.etag_timestamp_field
+            if table_wide:
+                # La fila más reciente de la tabla (por índice) con el conteo
+                # filtrado como subconsulta: sin agregar ``field`` fila a fila.
+                # Una tabla vacía no devuelve filas.
+                total = queryset.order_by().annotate(total=Func("pk", function="COUNT")).values("total")
+                latest = (
+                    queryset.model._default_manager.order_by(f"-{field}")
+                    .values_list(field, Subquery(total))[:1]
+                )
+                last_modified, total = next(iter(latest), (None, 0))
+                self.list_count = total
+            else:
+                summary = queryset.order_by().aggregate(last_modified=Max(field), total=Count("pk"))
+                last_modified, total = summary["last_modified"], summary["total"]
+            parts += [last_modified.isoformat() if last_modified else "", str(total)]
+        return ":".join(parts), last_modified
+
+    def not_modified(self, request, queryset, table_wide=False):
+        """Respuesta 304 si el cliente ya tiene esta versión; si no, ``None``."""
+        version, last_modified = self.read_validators(queryset, table_wide)
+        if table_wide:
+            # Solo ETag: la fecha no refleja los borrados (ver docstring)
+            last_modified = None
+        # El cuerpo depende también de la URL, el host (enlaces de paginación)
+        # y el formato negociado.
+        digest = hashlib.sha1("|".join([
+            version,
+            request.get_host(),
+            request.get_full_path(),
+            request.accepted_media_type or "",
+        ]).encode("utf-8")).hexdigest()
+
+        self.etag = quote_etag(digest)
+        self.last_modified = int(last_modified.timestamp()) if last_modified else None
+        return get_conditional_response(request, etag=self.etag, last_modified=self.last_modified)
+
+    def list(self, request, *args, **kwargs):
+        response = self.not_modified(request, self.filter_queryset(self.get_queryset()), table_wide=True)
+        if response is not None:
+            return response
+        return super().list(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        etag = getattr(self, "etag", None)
+        if etag and response.status_code in (200, 304):
+            response["ETag"] = etag
+            if self.last_modified:
+                response["Last-Modified"] = http_date(self.last_modified)
+            # Revalidar siempre: sin esto el navegador aplica frescura heurística
+            patch_cache_control(response, no_cache=True)
+        return response
@@ -1,8 +1,12 @@
-import requests
 from rest_framework import viewsets, status, serializers
 from rest_framework.response import Response
+from pokemon.clients import PokeApiError, get_client
 from pokemon.models.movimiento import Movimiento
 from pokemon.models.tipo import Tipo
+from pokemon.api.mixins import CachedReadMixin, ConditionalReadMixin, FastReadMixin
+from pokemon.filters import CatalogFilter, CatalogOrderingFilter
+from pokemon.serializers import FastMovimientoSerializer, SparseFieldsetMixin, UniqueNameKeyMixin
+from pokemon.services import catalog_lookup, import_movimiento
 
 
 class TipoSerializer(serializers.ModelSerializer):
@@ -11,7 +15,7 @@ class TipoSerializer(serializers.ModelSerializer):
         fields = ['id', 'name']
 
 
-class MovimientoSerializer(serializers.ModelSerializer):
+class MovimientoSerializer(SparseFieldsetMixin, UniqueNameKeyMixin, serializers.ModelSerializer):
     tipo = TipoSerializer(read_only=True)
 
     class Meta:
@@ -19,39 +23,40 @@ class MovimientoSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'power', 'pp', 'accuracy', 'tipo']
 
 
-class MovimientoViewSet(viewsets.ModelViewSet):
-    queryset = Movimiento.objects.all()
+class MovimientoViewSet(ConditionalReadMixin, CachedReadMixin, FastReadMixin, viewsets.ModelViewSet):
+    queryset = Movimiento.objects.select_related("tipo").order_by("id")
     serializer_class = MovimientoSerializer
+    fast_serializer_class = FastMovimientoSerializer
+    cache_resource = "movimiento"
+    etag_versions = ("movimiento",)
+    filter_backends = [CatalogFilter, CatalogOrderingFilter]
+    tipo_field = "tipo"
+    range_fields = ("power", "pp", "accuracy")
+    ordering_fields = ("id", "name", "power", "pp", "accuracy")
 
     def retrieve(self, request, pk=None):
         """
         Obtiene un movimiento por ID o nombre desde la base de datos o desde la PokeAPI v2.
         Si no existe localmente, lo crea automáticamente junto con su tipo si es necesario.
         """
+        lookup = catalog_lookup(pk)
+        not_modified = self.not_modified(request, self.get_queryset().filter(**lookup))
+        if not_modified is not None:
+            return not_modified
+
+        data = self.fast_detail(**lookup)
+        if data is not None:
+            return Response(data)
+
+        # Buscar en la PokeAPI
         try:
-            movimiento = Movimiento.objects.get(pk=pk) if pk.isdigit() else Movimiento.objects.get(name=pk)
+            data = get_client().movimiento(pk)
+        except PokeApiError:
+            return Response({"error": "Error al conectar con la PokeAPI."}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        if data is not None:
+            # Crear el movimiento (y su tipo si es necesario)
+            movimiento = import_movimiento(data)
             serializer = self.get_serializer(movimiento)
-            return Response(serializer.data)
-        except Movimiento.DoesNotExist:
-            # Buscar en la PokeAPI
-            url = f"https://pokeapi.co/api/v2/move/{pk.lower()}/"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-
-                # Buscar o crear tipo asociado
-                tipo_name = data["type"]["name"]
-                tipo, _ = Tipo.objects.get_or_create(name=tipo_name)
-
-                # Crear el movimiento
-                movimiento = Movimiento.objects.create(
-                    name=data["name"],
-                    power=data["power"],
-                    pp=data["pp"],
-                    accuracy=data["accuracy"],
-                    tipo=tipo
-                )
-                serializer = self.get_serializer(movimiento)
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-
-            return Response({"error": "Movimiento no encontrado"}, status=status.HTTP_404_NOT_FOUND)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+        return Response({"error": "Movimiento no encontrado"}, status=status.HTTP_404_NOT_FOUND)
@@ -7,16 +7,37 @@ Incluye:
  - CRUD completo de Pokémon locales
  - Integración con la PokeAPI oficial (si no existe localmente)
  - Obtención de Pokémon aleatorios
- - Captura simulada con límite máximo de 10
+ - Lectura en lote por ID o nombre (``pokemons/batch/``)
+
+Las capturas viven en ``pokemon/api/captura_viewset.py``.
 """
 
 import random
-import requests
+from django.db.models import Q
 from rest_framework import viewsets, status, serializers
-from rest_framework.decorators import action, api_view
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from pokemon.models import is_numeric_id
 from pokemon.models.pokemon import Pokemon
 from pokemon.models.tipo import Tipo
+from pokemon.battle.type_chart import mask_types
+from pokemon.clients import PokeApiError
+from pokemon.filters import CatalogFilter, CatalogOrderingFilter, MoveSummaryFilter
+from pokemon.api.mixins import CachedReadMixin, ConditionalReadMixin, FastReadMixin
+from pokemon.serializers import FastPokemonSerializer, SparseFieldsetMixin, UniqueNameKeyMixin
+from pokemon.services import (
+    LockTimeout,
+    bulk_import_pokemon,
+    fetch_pokemon,
+    fetch_pokemon_payloads,
+    get_or_create_tipo,
+    normalize_key,
+    pokemon_lookup,
+    random_index,
+    suggest_names,
+)
+
+BATCH_MAX_ITEMS = 300
 
 
 # ============================================================
@@ -30,27 +51,60 @@ class TipoSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
 
 
-class PokemonSerializer(serializers.ModelSerializer):
-    """Serializador principal del modelo Pokémon."""
+class PokemonSerializer(SparseFieldsetMixin, UniqueNameKeyMixin, serializers.ModelSerializer):
+    """
+    Serializador principal del modelo Pokémon. El resumen de movimientos es
+    de solo lectura (se recalcula al cambiar ``movimientos``).
+    """
 
     tipo = TipoSerializer(read_only=True)
+    move_types = serializers.SerializerMethodField()
 
     class Meta:
         model = Pokemon
-        fields = ["id", "name", "hp", "attack", "defense", "image", "tipo"]
+        fields = [
+            "id", "name", "hp", "attack", "defense", "total_stats", "image", "tipo",
+            "move_count", "max_move_power", "move_types",
+        ]
+
+    def get_move_types(self, pokemon):
+        return mask_types(pokemon.move_types)
+
+
+class PokemonBatchSerializer(serializers.Serializer):
+    """Entrada de ``pokemons/batch/``: lista de IDs o nombres."""
+
+    ids = serializers.ListField(
+        child=serializers.CharField(max_length=100),
+        allow_empty=False,
+        max_length=BATCH_MAX_ITEMS,
+    )
 
 
 # ============================================================
 # 🔹 VIEWSET PRINCIPAL
 # ============================================================
-class PokemonViewSet(viewsets.ModelViewSet):
+class PokemonViewSet(ConditionalReadMixin, CachedReadMixin, FastReadMixin, viewsets.ModelViewSet):
     """
     ViewSet para manejar los Pokémon locales e integrarlos con la PokeAPI.
     Soporta CRUD completo y obtiene datos desde la API externa cuando falta.
+    Las lecturas (list/retrieve) usan ``FastPokemonSerializer``. El listado
+    admite los filtros de ``pokemon/filters.py``, p. ej.
+    ``?tipo=fire&attack_min=80&ordering=-total_stats``.
     """
 
-    queryset = Pokemon.objects.all()
+    queryset = Pokemon.objects.select_related("tipo")
     serializer_class = PokemonSerializer
+    fast_serializer_class = FastPokemonSerializer
+    filter_backends = [CatalogFilter, MoveSummaryFilter, CatalogOrderingFilter]
+    tipo_field = "tipo"
+    range_fields = ("hp", "attack", "defense", "total_stats")
+    ordering_fields = ("id", "name", "hp", "attack", "defense", "total_stats")
+    cache_resource = "pokemon"
+    etag_timestamp_field = "updated_at"
+    etag_versions = ("tipo",)
+
+    RANDOM_MAX_COUNT = 50
 
     # --------------------------------------------------------
     # 🔸 Obtener Pokémon por ID o nombre (local o remoto)
@@ -58,47 +112,146 @@ class PokemonViewSet(viewsets.ModelViewSet):
     def retrieve(self, request, pk=None):
         """
         Devuelve un Pokémon según ID o nombre.
-        Si no existe en la BD local, lo busca en la PokeAPI y lo guarda.
+        Si no existe en la BD local, lo busca en la PokeAPI y lo guarda; si
+        tampoco existe allí, el 404 incluye ``suggestions`` con los nombres
+        locales más parecidos (``"charzard"`` → ``["charizard"]``).
+        Las peticiones simultáneas del mismo Pokémon comparten una sola
+        importación (ver ``pokemon.services.fetch_pokemon``).
+
+        El detalle incluye ``movimientos`` (una consulta más, cacheada con
+        el resto del detalle).
         """
-        try:
-            # Buscar en base local
-            pokemon = (
-                Pokemon.objects.get(pk=pk)
-                if pk.isdigit()
-                else Pokemon.objects.get(name__iexact=pk)
-            )
-            return Response(self.get_serializer(pokemon).data)
+        lookup = pokemon_lookup(pk)
+        not_modified = self.not_modified(request, self.get_queryset().filter(**lookup))
+        if not_modified is not None:
+            return not_modified
 
-        except Pokemon.DoesNotExist:
-            # Si no está localmente, buscar en la PokeAPI
-            url = f"https://pokeapi.co/api/v2/pokemon/{pk.lower()}/"
-            try:
-                response = requests.get(url, timeout=8)
-                response.raise_for_status()
-            except requests.RequestException:
-                return Response(
-                    {"error": "Error al conectar con la PokeAPI."},
-                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
-                )
+        # Buscar en base local
+        data = self.fast_detail(**lookup)
+        if data is not None:
+            return Response(data)
 
-            data = response.json()
-            tipo_name = data["types"][0]["type"]["name"]
-            tipo, _ = Tipo.objects.get_or_create(name=tipo_name)
-
-            pokemon = Pokemon.objects.create(
-                name=data["name"],
-                hp=data["stats"][0]["base_stat"],
-                attack=data["stats"][1]["base_stat"],
-                defense=data["stats"][2]["base_stat"],
-                image=data["sprites"]["front_default"],
-                tipo=tipo,
+        # Si no está localmente, buscar en la PokeAPI
+        try:
+            pokemon, created = fetch_pokemon(pk)
+        except (PokeApiError, LockTimeout):
+            return Response(
+                {"error": "Error al conectar con la PokeAPI."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
 
+        if pokemon is None:
             return Response(
-                self.get_serializer(pokemon).data,
-                status=status.HTTP_201_CREATED,
+                {
+                    "error": f"El Pokémon '{pk}' no existe en la PokeAPI.",
+                    "suggestions": suggest_names(pk, "pokemon"),
+                },
+                status=status.HTTP_404_NOT_FOUND,
             )
 
+        return Response(
+            self.fast_detail(pk=pokemon.pk),
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+    def detail_representation(self, row):
+        item = super().detail_representation(row)
+        return self.fast_serializer_class.with_movimientos(item, self.fast_serializer_class.movimientos(row["id"]))
+
+    # --------------------------------------------------------
+    # 🔸 /api/pokemon/pokemons/batch/
+    # --------------------------------------------------------
+    @action(detail=False, methods=["post"], url_path="batch")
+    def batch(self, request):
+        """
+        Devuelve hasta ``BATCH_MAX_ITEMS`` Pokémon por ID o nombre en una
+        sola petición, en el orden pedido.
+
+        Los locales se resuelven en una consulta ``IN`` (nombres por
+        ``name_key``, sin distinguir mayúsculas); los que faltan se descargan de la PokeAPI en
+        paralelo y se insertan con un solo ``bulk_create``.
+
+        Ejemplo:
+        -------
+        POST /api/pokemon/pokemons/batch/
+        {"ids": [25, "Bulbasaur", "missingno"]}
+
+        → {"results": [
+              {"query": "25", "status": "found", "pokemon": {...}},
+              {"query": "Bulbasaur", "status": "created", "pokemon": {...}},
+              {"query": "missingno", "status": "not_found", "pokemon": null}
+           ]}
+
+        ``status``: ``found`` (local), ``created`` (importado), ``not_found``
+        o ``error`` (la PokeAPI no respondió o no se pudo guardar).
+        """
+        serializer = PokemonBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        queries = serializer.validated_data["ids"]
+        keys = [self._batch_key(query) for query in queries]
+
+        found = self._batch_rows(keys)
+        statuses = {key: "found" for key in found}
+
+        misses = [key for key in dict.fromkeys(keys) if key not in found]
+        if misses:
+            payloads = fetch_pokemon_payloads(misses)
+            for key, payload in payloads.items():
+                if payload is None:
+                    statuses[key] = "not_found"
+                elif isinstance(payload, PokeApiError):
+                    statuses[key] = "error"
+
+            fetched = {key: payload for key, payload in payloads.items() if isinstance(payload, dict)}
+            if fetched:
+                names = {normalize_key(payload["name"]) for payload in fetched.values()}
+                existing = self._batch_rows(names)
+                new = {
+                    payload["name"]: payload
+                    for payload in fetched.values()
+                    if normalize_key(payload["name"]) not in existing
+                }
+                bulk_import_pokemon(list(new.values()))
+                imported = self._batch_rows(names - existing.keys())
+                rows = {**existing, **imported}
+
+                for key, payload in fetched.items():
+                    name = normalize_key(payload["name"])
+                    found[key] = rows.get(name)
+                    if found[key] is None:
+                        # La PokeAPI respondió pero la fila no quedó guardada
+                        statuses[key] = "error"
+                    else:
+                        statuses[key] = "found" if name in existing else "created"
+
+        fast = self.get_fast_serializer(None)
+        return Response({
+            "results": [
+                {
+                    "query": query,
+                    "status": statuses[key],
+                    "pokemon": fast.trim(fast.to_representation(found[key])) if found.get(key) else None,
+                }
+                for query, key in zip(queries, keys)
+            ],
+        })
+
+    @staticmethod
+    def _batch_key(query):
+        key = normalize_key(query)
+        return str(int(key)) if is_numeric_id(key) else key
+
+    def _batch_rows(self, keys):
+        """Filas locales (``values()``) por clave: ``str(pk)`` o ``name_key``."""
+        pks = [key for key in keys if is_numeric_id(key)]
+        names = [key for key in keys if not is_numeric_id(key)]
+        queryset = self.get_queryset().filter(Q(pk__in=pks) | Q(name_key__in=names))
+        rows = {}
+        for row in self.fast_serializer_class.values(queryset):
+            rows[str(row["id"])] = row
+            rows[normalize_key(row["name"])] = row
+        return {key: rows[key] for key in keys if key in rows}
+
     # --------------------------------------------------------
     # 🔸 /api/pokemon/random/
     # --------------------------------------------------------
@@ -107,41 +260,49 @@ class PokemonViewSet(viewsets.ModelViewSet):
         """
         Devuelve un Pokémon aleatorio local.
         Si la base está vacía, obtiene uno nuevo desde la PokeAPI.
+
+        Con ``?count=N`` devuelve una lista de hasta N Pokémon distintos
+        (máximo ``RANDOM_MAX_COUNT``) en una sola consulta; la pantalla de
+        batalla usa ``?count=2``.
         """
-        pokemons = Pokemon.objects.all()
+        count = request.query_params.get("count")
+        if count is not None:
+            try:
+                count = int(count)
+            except ValueError:
+                count = 0
+            if not 1 <= count <= self.RANDOM_MAX_COUNT:
+                return Response(
+                    {"error": f"'count' debe estar entre 1 y {self.RANDOM_MAX_COUNT}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        # Elegir al azar desde el índice en memoria (sin recorrer la tabla)
+        pokemons = random_index.sample(count or 1)
 
         # Si no hay registros, importar uno aleatorio desde la API
-        if not pokemons.exists():
+        if not pokemons:
             random_id = random.randint(1, 151)
-            response = requests.get(f"https://pokeapi.co/api/v2/pokemon/{random_id}/")
+            try:
+                pokemon, _ = fetch_pokemon(random_id)
+            except (PokeApiError, LockTimeout):
+                pokemon = None
 
-            if response.status_code != 200:
+            if pokemon is None:
                 return Response(
                     {"error": "No se pudo obtener un Pokémon aleatorio."},
                     status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 )
 
-            data = response.json()
-            tipo_name = data["types"][0]["type"]["name"]
-            tipo, _ = Tipo.objects.get_or_create(name=tipo_name)
-
-            pokemon = Pokemon.objects.create(
-                name=data["name"],
-                hp=data["stats"][0]["base_stat"],
-                attack=data["stats"][1]["base_stat"],
-                defense=data["stats"][2]["base_stat"],
-                image=data["sprites"]["front_default"],
-                tipo=tipo,
-            )
-
+            data = self.get_serializer(pokemon).data
             return Response(
-                self.get_serializer(pokemon).data,
+                [data] if count is not None else data,
                 status=status.HTTP_201_CREATED,
             )
 
-        # Elegir uno aleatorio ya existente
-        pokemon = random.choice(pokemons)
-        return Response(self.get_serializer(pokemon).data, status=status.HTTP_200_OK)
+        if count is None:
+            return Response(self.get_serializer(pokemons[0]).data, status=status.HTTP_200_OK)
+        return Response(self.get_serializer(pokemons, many=True).data, status=status.HTTP_200_OK)
 
     # --------------------------------------------------------
     # 🔸 Crear Pokémon manualmente
@@ -157,57 +318,10 @@ class PokemonViewSet(viewsets.ModelViewSet):
         tipo_data = request.data.get("tipo")
         tipo = None
         if tipo_data:
-            tipo, _ = Tipo.objects.get_or_create(name=tipo_data)
+            tipo = get_or_create_tipo(tipo_data)
 
         pokemon = serializer.save(tipo=tipo)
         return Response(
             self.get_serializer(pokemon).data,
             status=status.HTTP_201_CREATED,
         )
-
-
-# ============================================================
-# 🔹 ENDPOINT PERSONALIZADO: CAPTURAR POKÉMON
-# ============================================================
-@api_view(["POST"])
-def capturar_pokemon(request):
-    """
-    Permite 'capturar' un Pokémon existente (simulación con límite de 10).
-
-    Ejemplo:
-    -------
-    POST /api/pokemon/capturar/
-    {
-        "name": "Pikachu"
-    }
-    """
-    name = request.data.get("name")
-    if not name:
-        return Response(
-            {"error": "Debes especificar el nombre del Pokémon."},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    try:
-        pokemon = Pokemon.objects.get(name__iexact=name)
-    except Pokemon.DoesNotExist:
-        return Response(
-            {"error": f"El Pokémon '{name}' no existe en la base local."},
-            status=status.HTTP_404_NOT_FOUND,
-        )
-
-    # Simular límite de 10 capturas
-    if Pokemon.objects.count() >= 10:
-        return Response(
-            {"error": "Has alcanzado el máximo de 10 Pokémon capturados."},
-            status=status.HTTP_403_FORBIDDEN,
-        )
-
-    serializer = PokemonSerializer(pokemon)
-    return Response(
-        {
-            "message": f"🎯 ¡Has capturado a {pokemon.name.title()}!",
-            "pokemon": serializer.data,
-        },
-        status=status.HTTP_201_CREATED,
-    )
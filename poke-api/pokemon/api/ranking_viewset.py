@@ -0,0 +1,70 @@
+"""
+ranking_viewset.py
+------------------
+Rankings del catálogo (ver ``pokemon/services/rankings.py``).
+
+Incluye:
+ - GET /api/pokemon/rankings/ → top por estadísticas totales o por tasa de
+   victorias, global o de un tipo.
+"""
+
+from django.conf import settings
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from pokemon.filters import CatalogFilter, int_param, list_param
+from pokemon.services.rankings import RANKINGS, top_pokemon
+
+
+class RankingViewSet(viewsets.ViewSet):
+    """Top de Pokémon servido desde columnas e índices materializados."""
+
+    def list(self, request):
+        """
+        Parámetros:
+         - ``by``: ``total_stats`` (por defecto) o ``win_rate`` (batallas
+           registradas con ``POST /api/pokemon/battles/simulate/``).
+         - ``tipo``: nombre o ID de un tipo (opcional).
+         - ``limit``: hasta ``RANKINGS["MAX_LIMIT"]``.
+         - ``min_battles``: batallas mínimas para entrar en ``win_rate``
+           (por defecto ``RANKINGS["MIN_BATTLES"]``).
+
+        Ejemplo:
+        -------
+        GET /api/pokemon/rankings/?by=win_rate&tipo=fire&limit=3
+
+        → {"by": "win_rate", "tipo": "fire", "results": [
+              {"rank": 1, "id": 6, "name": "charizard", "image": "...",
+               "tipo": {"id": 10, "name": "fire"},
+               "batallas": 40, "victorias": 31, "win_rate": 0.775},
+              ...]}
+        """
+        config = settings.RANKINGS
+        by = request.query_params.get("by", "total_stats")
+        if by not in RANKINGS:
+            raise ValidationError({"by": f"Debe ser uno de: {', '.join(RANKINGS)}."})
+
+        tipos = list_param(request, "tipo")
+        if len(tipos) > 1:
+            raise ValidationError({"tipo": "Solo se admite un tipo."})
+        tipo_id = None
+        if tipos:
+            # Un tipo inexistente da un ranking vacío, como en los filtros del catálogo
+            tipo_id = next(iter(CatalogFilter.tipo_ids(tipos)), 0)
+
+        limit = int_param(request, "limit")
+        if limit is None:
+            limit = config["DEFAULT_LIMIT"]
+        if not 1 <= limit <= config["MAX_LIMIT"]:
+            raise ValidationError({"limit": f"Debe estar entre 1 y {config['MAX_LIMIT']}."})
+
+        min_battles = int_param(request, "min_battles")
+        if min_battles is None:
+            min_battles = config["MIN_BATTLES"]
+
+        return Response({
+            "by": by,
+            "tipo": tipos[0] if tipos else None,
+            "results": top_pokemon(by, tipo_id, limit, max(min_battles, 1)),
+        })
@@ -0,0 +1,47 @@
+from django.conf import settings
+from rest_framework.decorators import api_view
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from pokemon.filters import int_param, list_param
+from pokemon.services.name_index import NAME_MODELS, search_backend, search_names
+
+
+@api_view(["GET"])
+def name_search(request):
+    """
+    Sugerencias de nombres de Pokémon, tipos y movimientos, tolerando
+    errores de escritura (ver ``pokemon/services/name_index.py``).
+
+    Parámetros: ``q`` (obligatorio), ``kind=pokemon,tipo,movimiento``
+    (por defecto, todos) y ``limit`` (hasta ``NAME_SEARCH["MAX_LIMIT"]``).
+
+    Ejemplo::
+
+        GET /api/pokemon/search/?q=charzard&kind=pokemon
+
+        {"query": "charzard", "backend": "memory", "results": [
+            {"kind": "pokemon", "id": 6, "name": "charizard", "score": 0.583, "prefix": false}]}
+
+    Primero van los nombres que empiezan por ``q`` (en orden alfabético) y
+    luego los parecidos, de mayor a menor ``score`` (similitud de trigramas).
+    """
+    query = request.query_params.get("q", "").strip()
+    if not query:
+        raise ValidationError({"q": "Este parámetro es obligatorio."})
+
+    kinds = list_param(request, "kind") or list(NAME_MODELS)
+    unknown = [kind for kind in kinds if kind not in NAME_MODELS]
+    if unknown:
+        raise ValidationError({"kind": f"Valores desconocidos: {', '.join(unknown)}."})
+
+    max_limit = settings.NAME_SEARCH["MAX_LIMIT"]
+    limit = int_param(request, "limit")
+    if limit is not None and not 1 <= limit <= max_limit:
+        raise ValidationError({"limit": f"Debe estar entre 1 y {max_limit}."})
+
+    return Response({
+        "query": query,
+        "backend": search_backend(),
+        "results": search_names(query, kinds, limit),
+    })
@@ -1,35 +1,59 @@
-import requests
 from rest_framework import viewsets, status, serializers
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from pokemon.battle.type_chart import get_type_chart
+from pokemon.clients import PokeApiError, get_client
 from pokemon.models.tipo import Tipo
+from pokemon.api.mixins import CachedReadMixin, ConditionalReadMixin, FastReadMixin
+from pokemon.filters import CatalogFilter, CatalogOrderingFilter
+from pokemon.serializers import FastTipoSerializer, SparseFieldsetMixin, UniqueNameKeyMixin
+from pokemon.services import catalog_lookup, import_tipo
 
 
-class TipoSerializer(serializers.ModelSerializer):
+class TipoSerializer(SparseFieldsetMixin, UniqueNameKeyMixin, serializers.ModelSerializer):
     class Meta:
         model = Tipo
         fields = ['id', 'name']
 
 
-class TipoViewSet(viewsets.ModelViewSet):
-    queryset = Tipo.objects.all()
+class TipoViewSet(ConditionalReadMixin, CachedReadMixin, FastReadMixin, viewsets.ModelViewSet):
+    queryset = Tipo.objects.order_by("id")
     serializer_class = TipoSerializer
+    fast_serializer_class = FastTipoSerializer
+    cache_resource = "tipo"
+    etag_versions = ("tipo",)
+    filter_backends = [CatalogFilter, CatalogOrderingFilter]
+    ordering_fields = ("id", "name")
 
     def retrieve(self, request, pk=None):
         """
         Obtiene un tipo por ID o nombre desde la base de datos o desde la PokeAPI v2.
         Si no existe localmente, lo crea automáticamente.
         """
+        lookup = catalog_lookup(pk)
+        not_modified = self.not_modified(request, self.get_queryset().filter(**lookup))
+        if not_modified is not None:
+            return not_modified
+
+        data = self.fast_detail(**lookup)
+        if data is not None:
+            return Response(data)
+
+        # Buscar el tipo en la PokeAPI
         try:
-            tipo = Tipo.objects.get(pk=pk) if pk.isdigit() else Tipo.objects.get(name=pk)
+            data = get_client().tipo(pk)
+        except PokeApiError:
+            return Response({"error": "Error al conectar con la PokeAPI."}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        if data is not None:
+            tipo = import_tipo(data)
             serializer = self.get_serializer(tipo)
-            return Response(serializer.data)
-        except Tipo.DoesNotExist:
-            # Buscar el tipo en la PokeAPI
-            url = f"https://pokeapi.co/api/v2/type/{pk.lower()}/"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                tipo = Tipo.objects.create(name=data["name"])
-                serializer = self.get_serializer(tipo)
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            return Response({"error": "Tipo no encontrado"}, status=status.HTTP_404_NOT_FOUND)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response({"error": "Tipo no encontrado"}, status=status.HTTP_404_NOT_FOUND)
+
+    @action(detail=False, methods=["get"], url_path="matrix")
+    def matrix(self, request):
+        """
+        Devuelve la tabla de efectividad completa (atacante × defensor).
+        ``matrix[i][j]`` es el multiplicador de ``tipos[i]`` sobre ``tipos[j]``.
+        """
+        return Response(get_type_chart().as_dict())
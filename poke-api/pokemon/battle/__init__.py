@@ -0,0 +1,27 @@
+from .engine import Combatant, simulate, simulate_many
+from .type_chart import (
+    EFFECTIVENESS,
+    TYPE_BITS,
+    TYPE_NAMES,
+    TypeChart,
+    effectiveness,
+    get_type_chart,
+    invalidate_type_chart,
+    mask_types,
+    type_mask,
+)
+
+__all__ = [
+    "Combatant",
+    "simulate",
+    "simulate_many",
+    "EFFECTIVENESS",
+    "TYPE_BITS",
+    "TYPE_NAMES",
+    "TypeChart",
+    "effectiveness",
+    "get_type_chart",
+    "invalidate_type_chart",
+    "mask_types",
+    "type_mask",
+]
@@ -0,0 +1,161 @@
+"""
+engine.py
+---------
+Motor de simulación de batallas del lado del servidor.
+
+Reproduce las reglas de ``Battle.jsx``:
+
+ - Vida de combate = ``hp × HP_MULTIPLIER``.
+ - Daño base = ``floor(U · attack / 2) + 5`` con ``U ~ Uniforme[0, 1)``.
+ - El atacante golpea primero y los turnos se alternan hasta un K.O.
+
+y añade lo que el cliente no modela:
+
+ - Multiplicador de tipo tomado de la matriz cacheada indexada por
+   ``Tipo.id`` (O(1) por turno).
+ - Mitigación por defensa: ``DEFENSE_SCALE / (DEFENSE_SCALE + defense)``.
+
+``simulate`` juega una batalla con registro turno a turno;
+``simulate_many`` juega N batallas a la vez vectorizadas con NumPy
+(estimación Monte Carlo de la probabilidad de victoria).
+"""
+
+import math
+import random
+
+import numpy as np
+
+from pokemon.battle.type_chart import get_type_chart
+
+HP_MULTIPLIER = 5
+BASE_DAMAGE = 5
+DEFENSE_SCALE = 100
+MAX_TURNS = 500
+
+ATTACKER = "attacker"
+DEFENDER = "defender"
+
+
+class Combatant:
+    """Estadísticas de combate de un Pokémon, desacopladas del ORM."""
+
+    __slots__ = ("name", "tipo", "type_index", "max_hp", "attack", "defense")
+
+    def __init__(self, name, tipo, hp, attack, defense, tipo_id=None):
+        self.name = name
+        self.tipo = tipo
+        self.type_index = get_type_chart().index(tipo_id, tipo)
+        self.max_hp = hp * HP_MULTIPLIER
+        self.attack = attack
+        self.defense = defense
+
+    @classmethod
+    def from_pokemon(cls, pokemon):
+        tipo = pokemon.tipo.name if pokemon.tipo_id else None
+        return cls(
+            pokemon.name, tipo, pokemon.hp, pokemon.attack, pokemon.defense,
+            tipo_id=pokemon.tipo_id,
+        )
+
+    def damage_factor(self, defender):
+        """Multiplicador constante (tipo × defensa) de este combatiente sobre ``defender``."""
+        multiplier = get_type_chart().matrix[self.type_index, defender.type_index]
+        return float(multiplier) * DEFENSE_SCALE / (DEFENSE_SCALE + defender.defense)
+
+
+# ============================================================
+# 🔹 BATALLA INDIVIDUAL
+# ============================================================
+def _hit(attacker, factor, rng):
+    base = math.floor(rng.random() * (attacker.attack / 2)) + BASE_DAMAGE
+    return round(base * factor)
+
+
+def simulate(attacker, defender, rng=None):
+    """
+    Simula una batalla y devuelve el ganador, los turnos y el registro.
+
+    ``winner`` es ``"attacker"``, ``"defender"`` o ``None`` (empate por
+    ``MAX_TURNS``, p. ej. dos tipos mutuamente inmunes).
+    """
+    rng = rng or random.Random()
+    factors = (attacker.damage_factor(defender), defender.damage_factor(attacker))
+    hp = {ATTACKER: attacker.max_hp, DEFENDER: defender.max_hp}
+    sides = (
+        (ATTACKER, attacker, DEFENDER, factors[0]),
+        (DEFENDER, defender, ATTACKER, factors[1]),
+    )
+    log = []
+
+    for turn in range(1, MAX_TURNS + 1):
+        for side, combatant, target, factor in sides:
+            damage = _hit(combatant, factor, rng)
+            hp[target] = max(0, hp[target] - damage)
+            log.append({
+                "turn": turn,
+                "attacker": combatant.name,
+                "damage": damage,
+                "target_hp": hp[target],
+            })
+            if hp[target] == 0:
+                return {"winner": side, "turns": turn, "log": log}
+
+    return {"winner": None, "turns": MAX_TURNS, "log": log}
+
+
+# ============================================================
+# 🔹 MONTE CARLO VECTORIZADO
+# ============================================================
+def _hits(attacker, factor, rng, size):
+    base = np.floor(rng.random(size) * (attacker.attack / 2)) + BASE_DAMAGE
+    return np.rint(base * factor).astype(np.int64)
+
+
+def simulate_many(attacker, defender, runs, seed=None):
+    """
+    Simula ``runs`` batallas independientes en paralelo.
+
+    Cada iteración del bucle es un turno completo para todas las batallas
+    aún activas; las terminadas se compactan fuera de los arreglos, así que
+    el costo es proporcional a la duración de las batallas, no a ``runs``.
+    """
+    rng = np.random.default_rng(seed)
+    factor_a = attacker.damage_factor(defender)
+    factor_b = defender.damage_factor(attacker)
+
+    hp_a = np.full(runs, attacker.max_hp, dtype=np.int64)
+    hp_b = np.full(runs, defender.max_hp, dtype=np.int64)
+    attacker_wins = defender_wins = 0
+    turns_total = 0
+
+    # Inmunidad mutua: ninguna batalla puede terminar
+    rounds = MAX_TURNS if factor_a or factor_b else 0
+
+    for turn in range(1, rounds + 1):
+        if hp_a.size == 0:
+            break
+
+        hp_b -= _hits(attacker, factor_a, rng, hp_b.size)
+        alive = hp_b > 0
+        knocked_out = hp_b.size - int(alive.sum())
+        attacker_wins += knocked_out
+        turns_total += knocked_out * turn
+        hp_a, hp_b = hp_a[alive], hp_b[alive]
+
+        hp_a -= _hits(defender, factor_b, rng, hp_a.size)
+        alive = hp_a > 0
+        knocked_out = hp_a.size - int(alive.sum())
+        defender_wins += knocked_out
+        turns_total += knocked_out * turn
+        hp_a, hp_b = hp_a[alive], hp_b[alive]
+
+    draws = int(hp_a.size)
+    turns_total += draws * MAX_TURNS
+    return {
+        "runs": runs,
+        "attacker_wins": attacker_wins,
+        "defender_wins": defender_wins,
+        "draws": draws,
+        "attacker_win_rate": attacker_wins / runs if runs else 0.0,
+        "avg_turns": turns_total / runs if runs else 0.0,
+    }
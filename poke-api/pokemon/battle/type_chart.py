@@ -0,0 +1,162 @@
+"""
+type_chart.py
+-------------
+Tabla de efectividad de tipos precalculada.
+
+La fuente de verdad es el modelo ``Efectividad`` (importado desde la PokeAPI
+con ``manage.py import_type_chart``). ``get_type_chart()`` lo carga una vez
+por proceso en una matriz densa de NumPy indexada por ``Tipo.id``
+(atacante × defensor), de modo que cada consulta durante la batalla es un
+acceso por índice en O(1). Las escrituras sobre ``Tipo``/``Efectividad``
+invalidan la matriz (ver ``pokemon/signals.py``).
+
+``EFFECTIVENESS`` es la tabla oficial (6.ª generación en adelante) y solo
+lista las relaciones distintas de ×1. Se usa para sembrar la base sin red
+(``import_type_chart --builtin``) y mientras la tabla persistida está vacía.
+
+La fila/columna 0 (ningún ``Tipo`` usa ese ID) corresponde a tipos
+desconocidos y vale ×1.
+
+``TYPE_BITS`` asigna un bit a cada tipo de ``TYPE_NAMES`` para guardar
+conjuntos de tipos en un entero (``Pokemon.move_types``) y filtrarlos con
+un ``AND`` de bits en SQL, sin joins.
+"""
+
+import threading
+
+import numpy as np
+
+TYPE_NAMES = (
+    "normal", "fire", "water", "electric", "grass", "ice",
+    "fighting", "poison", "ground", "flying", "psychic", "bug",
+    "rock", "ghost", "dragon", "dark", "steel", "fairy",
+)
+
+EFFECTIVENESS = {
+    "normal": {"rock": 0.5, "ghost": 0, "steel": 0.5},
+    "fire": {"fire": 0.5, "water": 0.5, "grass": 2, "ice": 2, "bug": 2, "rock": 0.5, "dragon": 0.5, "steel": 2},
+    "water": {"fire": 2, "water": 0.5, "grass": 0.5, "ground": 2, "rock": 2, "dragon": 0.5},
+    "electric": {"water": 2, "electric": 0.5, "grass": 0.5, "ground": 0, "flying": 2, "dragon": 0.5},
+    "grass": {"fire": 0.5, "water": 2, "grass": 0.5, "poison": 0.5, "ground": 2, "flying": 0.5, "bug": 0.5, "rock": 2, "dragon": 0.5, "steel": 0.5},
+    "ice": {"fire": 0.5, "water": 0.5, "grass": 2, "ice": 0.5, "ground": 2, "flying": 2, "dragon": 2, "steel": 0.5},
+    "fighting": {"normal": 2, "ice": 2, "poison": 0.5, "flying": 0.5, "psychic": 0.5, "bug": 0.5, "rock": 2, "ghost": 0, "dark": 2, "steel": 2, "fairy": 0.5},
+    "poison": {"grass": 2, "poison": 0.5, "ground": 0.5, "rock": 0.5, "ghost": 0.5, "steel": 0, "fairy": 2},
+    "ground": {"fire": 2, "electric": 2, "grass": 0.5, "poison": 2, "flying": 0, "bug": 0.5, "rock": 2, "steel": 2},
+    "flying": {"electric": 0.5, "grass": 2, "fighting": 2, "bug": 2, "rock": 0.5, "steel": 0.5},
+    "psychic": {"fighting": 2, "poison": 2, "psychic": 0.5, "dark": 0, "steel": 0.5},
+    "bug": {"fire": 0.5, "grass": 2, "fighting": 0.5, "poison": 0.5, "flying": 0.5, "psychic": 2, "ghost": 0.5, "dark": 2, "steel": 0.5, "fairy": 0.5},
+    "rock": {"fire": 2, "ice": 2, "fighting": 0.5, "ground": 0.5, "flying": 2, "bug": 2, "steel": 0.5},
+    "ghost": {"normal": 0, "psychic": 2, "ghost": 2, "dark": 0.5},
+    "dragon": {"dragon": 2, "steel": 0.5, "fairy": 0},
+    "dark": {"fighting": 0.5, "psychic": 2, "ghost": 2, "dark": 0.5, "fairy": 0.5},
+    "steel": {"fire": 0.5, "water": 0.5, "electric": 0.5, "ice": 2, "rock": 2, "steel": 0.5, "fairy": 2},
+    "fairy": {"fire": 0.5, "fighting": 2, "poison": 0.5, "dragon": 2, "dark": 2, "steel": 0.5},
+}
+
+UNKNOWN_TYPE = 0
+
+TYPE_BITS = {name: 1 << index for index, name in enumerate(TYPE_NAMES)}
+
+
+class TypeChart:
+    """Matriz densa atacante × defensor indexada por ``Tipo.id``."""
+
+    def __init__(self, tipos, relations):
+        tipos = sorted(tipos)
+        size = max((tipo_id for tipo_id, _ in tipos), default=0) + 1
+        matrix = np.ones((size, size), dtype=np.float64)
+        for attacker_id, defender_id, multiplier in relations:
+            matrix[attacker_id, defender_id] = multiplier
+        matrix.setflags(write=False)
+
+        self.matrix = matrix
+        self.tipos = tipos
+        self.ids = {name.lower(): tipo_id for tipo_id, name in tipos}
+
+    @classmethod
+    def from_db(cls):
+        """Carga la tabla persistida (o la oficial si aún no se importó)."""
+        from pokemon.models import Efectividad, Tipo
+
+        tipos = list(Tipo.objects.values_list("id", "name"))
+        relations = list(
+            Efectividad.objects.values_list("atacante_id", "defensor_id", "multiplicador")
+        )
+        if not relations:
+            relations = builtin_relations(tipos)
+        return cls(tipos, relations)
+
+    def index(self, tipo_id=None, name=None):
+        """Fila/columna de un tipo por ID o nombre (``UNKNOWN_TYPE`` si no existe)."""
+        if tipo_id is not None and 0 < tipo_id < len(self.matrix):
+            return tipo_id
+        if name:
+            return self.ids.get(name.strip().lower(), UNKNOWN_TYPE)
+        return UNKNOWN_TYPE
+
+    def multiplier(self, attacker, defender):
+        """Multiplicador entre dos tipos dados por nombre."""
+        return float(self.matrix[self.index(name=attacker), self.index(name=defender)])
+
+    def as_dict(self):
+        """Forma compacta para la API: lista de tipos y filas en ese orden."""
+        order = [tipo_id for tipo_id, _ in self.tipos]
+        rows = self.matrix[np.ix_(order, order)] if order else np.empty((0, 0))
+        return {
+            "tipos": [{"id": tipo_id, "name": name} for tipo_id, name in self.tipos],
+            "matrix": rows.tolist(),
+        }
+
+
+def builtin_relations(tipos):
+    """Relaciones de ``EFFECTIVENESS`` para los tipos ``(id, nombre)`` dados."""
+    ids = {name.lower(): tipo_id for tipo_id, name in tipos}
+    return [
+        (ids[attacker], ids[defender], multiplier)
+        for attacker, row in EFFECTIVENESS.items() if attacker in ids
+        for defender, multiplier in row.items() if defender in ids
+    ]
+
+
+def type_mask(names):
+    """Máscara de ``TYPE_BITS`` con los tipos dados por nombre (los desconocidos se ignoran)."""
+    mask = 0
+    for name in names:
+        mask |= TYPE_BITS.get((name or "").strip().lower(), 0)
+    return mask
+
+
+def mask_types(mask):
+    """Nombres de los tipos presentes en ``mask``, en el orden de ``TYPE_NAMES``."""
+    return [name for name, bit in TYPE_BITS.items() if mask & bit]
+
+
+# ============================================================
+# 🔹 INSTANCIA COMPARTIDA
+# ============================================================
+_chart = None
+_chart_lock = threading.Lock()
+
+
+def get_type_chart():
+    """Matriz del proceso, cargada desde la base en el primer uso."""
+    global _chart
+    chart = _chart
+    if chart is None:
+        with _chart_lock:
+            if _chart is None:
+                _chart = TypeChart.from_db()
+            chart = _chart
+    return chart
+
+
+def invalidate_type_chart():
+    """Descarta la matriz; se recarga en la siguiente consulta."""
+    global _chart
+    with _chart_lock:
+        _chart = None
+
+
+def effectiveness(attacker, defender):
+    """Multiplicador de daño de un tipo atacante sobre un tipo defensor (por nombre)."""
+    return get_type_chart().multiplier(attacker, defender)
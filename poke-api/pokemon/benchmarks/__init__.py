@@ -0,0 +1,21 @@
+"""
+Benchmarks del módulo Pokémon.
+
+Cada suite es un módulo con ``DEFAULT_SIZES`` y una función
+``run(sizes, repeat)`` que devuelve una lista de filas de resultados; ``python manage.py benchmark <suite>`` la
+ejecuta sobre datos sintéticos dentro de una transacción que se revierte.
+``KEY_COLUMNS`` (opcional) indica qué columnas identifican una fila al
+comparar con una ejecución anterior (``--compare``).
+"""
+
+SUITES = {
+    "serializers": "pokemon.benchmarks.serializers",
+    "lookups": "pokemon.benchmarks.lookups",
+    "databases": "pokemon.benchmarks.databases",
+    "endpoints": "pokemon.benchmarks.endpoints",
+    "auth": "pokemon.benchmarks.auth",
+    "tokens": "pokemon.benchmarks.tokens",
+    "filters": "pokemon.benchmarks.filters",
+    "search": "pokemon.benchmarks.search",
+    "rankings": "pokemon.benchmarks.rankings",
+}
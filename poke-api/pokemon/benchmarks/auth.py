@@ -0,0 +1,118 @@
+"""
+auth.py
+-------
+Inicios de sesión por segundo (y por núcleo) según el perfil de hash de
+contraseñas (``poke_api/settings/passwords.py``), para dimensionar el
+servicio de autenticación.
+
+Los tamaños son hilos simultáneos. Cada hilo repite durante ``DURATION``
+segundos el trabajo de CPU de ``/api/auth/login/``: verificar la
+contraseña y firmar el par de tokens JWT. argon2-cffi, bcrypt y hashlib
+liberan el GIL mientras calculan el hash, así que los hilos escalan como
+procesos hasta llegar al número de núcleos.
+
+Por perfil también se reporta el reparto de una sola petición (ms de
+verificación y de emisión de tokens) y la mediana de la petición completa
+con el cliente de pruebas. Los perfiles cuya librería no está instalada
+se omiten.
+"""
+
+import os
+import statistics
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.test import Client, modify_settings, override_settings
+
+from authentication.api.auth_viewset import CustomTokenObtainPairSerializer
+from poke_api.settings.passwords import HASHERS, password_hashers
+from pokemon.benchmarks.timing import measure
+
+DEFAULT_SIZES = tuple(sorted({1, os.cpu_count() or 1}))
+KEY_COLUMNS = ("profile", "threads")
+DURATION = 1.0
+REQUESTS = 10
+PASSWORD = "benchmark-password"
+
+
+def verify(user):
+    if not user.check_password(PASSWORD):
+        raise AssertionError("La contraseña del benchmark no coincide.")
+
+
+def issue_tokens(user):
+    refresh = CustomTokenObtainPairSerializer.get_token(user)
+    return str(refresh), str(refresh.access_token)
+
+
+def measure_throughput(user, threads):
+    """Inicios de sesión (verificación + tokens) por segundo con ``threads`` hilos."""
+    deadline = time.perf_counter() + DURATION
+    counts = [0] * threads
+
+    def target(index):
+        while time.perf_counter() < deadline:
+            verify(user)
+            issue_tokens(user)
+            counts[index] += 1
+
+    workers = [threading.Thread(target=target, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / DURATION
+
+
+def measure_requests(username):
+    client = Client()
+    samples = []
+    with modify_settings(ALLOWED_HOSTS={"append": "testserver"}):
+        for _ in range(REQUESTS):
+            started = time.perf_counter()
+            response = client.post(
+                "/api/auth/login/",
+                {"username": username, "password": PASSWORD},
+                content_type="application/json",
+            )
+            samples.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise AssertionError(f"Login fallido ({response.status_code}).")
+    return statistics.median(samples)
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Una fila por (perfil, hilos)."""
+    results = []
+    cores = os.cpu_count() or 1
+    for profile in HASHERS:
+        with override_settings(PASSWORD_HASHERS=password_hashers(profile)):
+            try:
+                encoded = make_password(PASSWORD)
+            except ValueError:
+                # "Couldn't load ... algorithm library": dependencia opcional
+                continue
+            user = get_user_model().objects.create(username=f"bench-{profile}", password=encoded)
+            # Calentamiento: carga las librerías y la clave de firma
+            verify(user)
+            issue_tokens(user)
+            verify_ms = measure(lambda: verify(user), repeat)["median_ms"]
+            token_ms = measure(lambda: issue_tokens(user), repeat)["median_ms"]
+            request_ms = measure_requests(user.username)
+
+            for threads in sorted(sizes):
+                logins = statistics.median(measure_throughput(user, threads) for _ in range(repeat))
+                results.append({
+                    "profile": profile,
+                    "hasher": settings.PASSWORD_HASHERS[0].rsplit(".", 1)[-1],
+                    "threads": threads,
+                    "logins_per_s": logins,
+                    "logins_per_s_per_core": logins / min(threads, cores),
+                    "verify_ms": verify_ms,
+                    "token_ms": token_ms,
+                    "request_p50_ms": request_ms,
+                })
+    return results
@@ -0,0 +1,204 @@
+"""
+databases.py
+------------
+Rendimiento de lecturas y escrituras simultáneas según el perfil de base
+de datos (``poke_api/settings/database.py``):
+
+ - ``sqlite-default``: SQLite tal como lo configura Django (journal DELETE).
+ - ``sqlite-tuned``: perfil de producción (WAL, ``synchronous=NORMAL``,
+   mmap, ``busy_timeout``, ``BEGIN IMMEDIATE``).
+ - ``postgres``: solo si ``POKE_API_DB_ENGINE=postgres``; usa los mismos
+   ``POKE_API_DB_*`` que producción (se crea una base ``test_<nombre>``).
+
+Los tamaños son hilos simultáneos. Cada hilo repite durante ``DURATION``
+segundos una mezcla de lecturas por ``name_key`` y transacciones que leen
+y actualizan un Pokémon (``WRITE_RATIO``). Cada perfil usa su propia base
+temporal, migrada desde cero; la base configurada no se toca.
+
+Cargas (columna ``workload``):
+ - ``local``: solo esa mezcla.
+ - ``remote-miss``: además, ``MISS_RATIO`` de las operaciones piden a
+   ``fetch_pokemon`` un Pokémon que no existe localmente; la PokeAPI es un
+   ``StubPokeApiServer`` con ``UPSTREAM_DELAY`` segundos de latencia. La
+   descarga ocurre fuera de toda transacción, así que con ``BEGIN
+   IMMEDIATE`` las escrituras no deberían esperar a la red ni fallar con
+   "database is locked" (``errors_per_s``).
+"""
+
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import OperationalError, connections, transaction
+from django.db.models import F
+from django.test import override_settings
+
+from poke_api.settings.database import postgres_database, sqlite_database
+from pokemon.benchmarks.dataset import seed_catalog
+from pokemon.cache import catalog_cache
+from pokemon.clients import PokeApiError
+from pokemon.models import Pokemon
+from pokemon.services import LockTimeout, fetch_pokemon, name_index, random_index
+from pokemon.testing import StubPokeApiServer, movimiento_payload, pokemon_payload
+
+DEFAULT_SIZES = (1, 4, 16)
+KEY_COLUMNS = ("profile", "workload", "threads")
+WORKLOADS = ("local", "remote-miss")
+DURATION = 1.0
+WRITE_RATIO = 0.2
+MISS_RATIO = 0.2
+UPSTREAM_DELAY = 0.05
+REMOTE_POKEMON = 10000
+REMOTE_MOVES = 40
+ROWS = 1000
+SEED = 0
+
+
+def profiles(directory):
+    found = {
+        "sqlite-default": sqlite_database(directory / "default.sqlite3"),
+        "sqlite-tuned": sqlite_database(directory / "tuned.sqlite3", tuned=True),
+    }
+    for config in found.values():
+        config["TEST"] = {"NAME": str(config["NAME"])}
+    if os.environ.get("POKE_API_DB_ENGINE") == "postgres":
+        found["postgres"] = postgres_database(os.environ)
+    return found
+
+
+@contextmanager
+def temporary_database(alias, config):
+    """Registra ``alias``, crea su base de pruebas (migrada) y la destruye al salir."""
+    # configure_settings completa las claves por defecto (AUTOCOMMIT, TEST...)
+    configured = connections.configure_settings({**connections.settings, alias: dict(config)})
+    connections.settings[alias] = configured[alias]
+    connection = connections[alias]
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield alias
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        del connections[alias]
+        del connections.settings[alias]
+
+
+@contextmanager
+def upstream_stub():
+    """PokeAPI simulada con ``REMOTE_POKEMON`` Pokémon que no están en el catálogo."""
+    routes = {
+        f"pokemon/remote-{i}": pokemon_payload(f"remote-{i}", 100_000 + i, moves=(f"remote-move-{i % REMOTE_MOVES}",))
+        for i in range(REMOTE_POKEMON)
+    }
+    routes.update({
+        f"move/remote-move-{i}": movimiento_payload(f"remote-move-{i}", move_id=100_000 + i)
+        for i in range(REMOTE_MOVES)
+    })
+    with StubPokeApiServer(routes, delay=UPSTREAM_DELAY) as stub, override_settings(POKEAPI_CLIENT={
+        **settings.POKEAPI_CLIENT,
+        "ENABLED": True,
+        "BASE_URL": stub.base_url,
+        "BACKOFF_FACTOR": 0,
+        "CACHE_DIR": None,
+    }):
+        yield stub
+
+
+@contextmanager
+def default_database(alias):
+    """
+    Los hilos creados dentro abren la base por defecto con la configuración
+    de ``alias``: ``fetch_pokemon`` no recibe ``using``.
+    """
+    original = connections.settings["default"]
+    connections.settings["default"] = connections.settings[alias]
+    try:
+        yield
+    finally:
+        connections.settings["default"] = original
+
+
+def workload(alias, names, pks, deadline, seed, misses=None):
+    rng = random.Random(seed)
+    counts = {"reads": 0, "writes": 0, "misses": 0, "errors": 0}
+    pokemons = Pokemon.objects.using(alias)
+    try:
+        while time.perf_counter() < deadline:
+            try:
+                if misses is not None and rng.random() < MISS_RATIO:
+                    # Importación bajo demanda, como un retrieve de un Pokémon ausente
+                    fetch_pokemon(f"remote-{next(misses)}")
+                    counts["misses"] += 1
+                elif rng.random() < WRITE_RATIO:
+                    pk = rng.choice(pks)
+                    with transaction.atomic(using=alias):
+                        pokemons.filter(pk=pk).values("hp").first()
+                        # update() no pasa por pre_save: el total se mantiene a mano
+                        pokemons.filter(pk=pk).update(
+                            hp=F("hp") % 255 + 1,
+                            total_stats=F("hp") % 255 + 1 + F("attack") + F("defense"),
+                        )
+                    counts["writes"] += 1
+                else:
+                    pokemons.filter(name_key=rng.choice(names)).values("id", "hp").first()
+                    counts["reads"] += 1
+            except (OperationalError, PokeApiError, LockTimeout):
+                # "database is locked": la transacción no esperó su turno
+                counts["errors"] += 1
+    finally:
+        # También la conexión por defecto que abre fetch_pokemon en este hilo
+        connections.close_all()
+    return counts
+
+
+def measure_throughput(alias, threads, misses=None):
+    names = list(Pokemon.objects.using(alias).values_list("name_key", flat=True))
+    pks = list(Pokemon.objects.using(alias).values_list("pk", flat=True))
+    deadline = time.perf_counter() + DURATION
+    results = [None] * threads
+
+    def target(index):
+        results[index] = workload(alias, names, pks, deadline, seed=index, misses=misses)
+
+    workers = [threading.Thread(target=target, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return {key: sum(result[key] for result in results) / DURATION for key in ("reads", "writes", "misses", "errors")}
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Una fila por perfil, carga y número de hilos con operaciones por segundo (mediana)."""
+    results = []
+    # Cada fallo pide un Pokémon distinto (next() sobre count es atómico con el GIL)
+    remote = itertools.count()
+    with tempfile.TemporaryDirectory() as tmp, upstream_stub():
+        for name, config in profiles(Path(tmp)).items():
+            with temporary_database(f"benchmark-{name}", config) as alias, default_database(alias):
+                seed_catalog(pokemons=ROWS, movimientos=0, seed=SEED, using=alias)
+                connections[alias].close()
+                for load in WORKLOADS:
+                    misses = remote if load == "remote-miss" else None
+                    for threads in sorted(sizes):
+                        samples = [measure_throughput(alias, threads, misses) for _ in range(repeat)]
+                        results.append({
+                            "profile": name,
+                            "workload": load,
+                            "threads": threads,
+                            "reads_per_s": statistics.median(sample["reads"] for sample in samples),
+                            "writes_per_s": statistics.median(sample["writes"] for sample in samples),
+                            "misses_per_s": statistics.median(sample["misses"] for sample in samples),
+                            "errors_per_s": statistics.median(sample["errors"] for sample in samples),
+                        })
+    # Los índices en memoria vieron Pokémon de las bases temporales
+    random_index.invalidate()
+    name_index.invalidate()
+    catalog_cache.clear()
+    return results
@@ -0,0 +1,54 @@
+"""
+dataset.py
+----------
+Generador de catálogos sintéticos reproducibles para los benchmarks.
+
+``seed_catalog(pokemons=1000, movimientos=200, seed=0)`` crea los 18 tipos
+oficiales, N Pokémon y M movimientos con estadísticas pseudoaleatorias
+derivadas de ``seed``: la misma semilla produce siempre los mismos datos.
+``using`` elige la base (alias de ``DATABASES``).
+"""
+
+import random
+
+from pokemon.battle.type_chart import TYPE_NAMES
+from pokemon.models import Movimiento, Pokemon, Tipo
+
+BATCH_SIZE = 1000
+
+
+def seed_catalog(pokemons=1000, movimientos=200, seed=0, using="default"):
+    """Crea el catálogo sintético y devuelve ``{"tipos": n, "pokemons": n, "movimientos": n}``."""
+    rng = random.Random(seed)
+
+    Tipo.objects.using(using).bulk_create([Tipo(name=name) for name in TYPE_NAMES], ignore_conflicts=True)
+    tipo_ids = list(Tipo.objects.using(using).filter(name__in=TYPE_NAMES).values_list("id", flat=True))
+
+    Pokemon.objects.using(using).bulk_create(
+        (
+            Pokemon(
+                name=f"synthetic-{seed}-{i}",
+                hp=rng.randint(20, 255),
+                attack=rng.randint(5, 190),
+                defense=rng.randint(5, 230),
+                image=f"https://img.pokeapi.local/synthetic/{i}.png",
+                tipo_id=rng.choice(tipo_ids),
+            )
+            for i in range(pokemons)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    Movimiento.objects.using(using).bulk_create(
+        (
+            Movimiento(
+                name=f"synthetic-move-{seed}-{i}",
+                power=rng.choice([None, *range(10, 151, 5)]),
+                pp=rng.choice([5, 10, 15, 20, 25, 30, 35, 40]),
+                accuracy=rng.choice([None, 50, 70, 75, 80, 85, 90, 95, 100]),
+                tipo_id=rng.choice(tipo_ids),
+            )
+            for i in range(movimientos)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    return {"tipos": len(tipo_ids), "pokemons": pokemons, "movimientos": movimientos}
@@ -0,0 +1,285 @@
+"""
+endpoints.py
+------------
+Latencia de extremo a extremo de los endpoints de la API sobre un catálogo
+sintético (``seed_catalog``: N Pokémon, los 18 tipos y N/5 movimientos),
+con la PokeAPI sustituida por ``StubPokeApiServer``.
+
+Escenarios: ``list``, ``retrieve-hit``, ``retrieve-miss`` (cada petición
+importa un Pokémon nuevo desde el stub), ``random``, ``capturar``,
+``register`` y ``login``.
+
+Transportes:
+ - ``client``: ``django.test.Client``, en el mismo hilo y sin red.
+ - ``http``: servidor WSGI real en un hilo, peticiones con ``httpx``. Como
+   ``LiveServerTestCase``, el servidor usa la conexión de este hilo, así
+   que ve los datos de la transacción del benchmark (que se revierte).
+
+Cada fila reporta p50/p99 (ms), consultas SQL por petición (contadas por
+``poke_api.metrics``) y KiB asignados por petición (pico de
+``tracemalloc``, medido en una pasada aparte para no inflar la latencia).
+Los tamaños son Pokémon del catálogo (al menos ``MAX_CAPTURAS``).
+"""
+
+import json
+import random
+import statistics
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import count
+
+import httpx
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.signals import request_finished, request_started
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.test import Client, modify_settings, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from poke_api import metrics
+from pokemon.battle.type_chart import TYPE_NAMES
+from pokemon.benchmarks.dataset import seed_catalog
+from pokemon.cache import catalog_cache
+from pokemon.models import MAX_CAPTURAS, Pokemon
+from pokemon.services import random_index, summarize
+from pokemon.testing import StubPokeApiServer, pokemon_payload
+
+DEFAULT_SIZES = (100, 10000)
+KEY_COLUMNS = ("transport", "scenario", "rows")
+ALLOC_REQUESTS = 5
+PASSWORD = "benchmark-password"
+
+Call = namedtuple("Call", "method path body token expected", defaults=(None, None, (200,)))
+
+
+# ============================================================
+# 🔹 ESCENARIOS
+# ============================================================
+class Workload:
+    """
+    Estado compartido por los escenarios. Lo que no se mide (usuarios,
+    tokens, rutas del stub) se prepara al construir cada ``Call``, fuera
+    del tiempo de la petición.
+    """
+
+    def __init__(self, stub, seed):
+        self.stub = stub
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.names = list(Pokemon.objects.order_by("id").values_list("name", flat=True))
+        self.sequence = count()
+        self.captures = 0
+        self.capture_token = None
+        self.login_user = self.new_user(PASSWORD)
+
+    def unique(self, prefix):
+        return f"{prefix}-{self.seed}-{next(self.sequence)}"
+
+    def new_user(self, password=None):
+        # Sin contraseña no se calcula ningún hash
+        return get_user_model().objects.create_user(username=self.unique("bench"), password=password)
+
+
+def list_pokemons(workload):
+    return Call("GET", "/api/pokemon/pokemons/")
+
+
+def retrieve_hit(workload):
+    return Call("GET", f"/api/pokemon/pokemons/{workload.rng.choice(workload.names)}/")
+
+
+def retrieve_miss(workload):
+    name = workload.unique("remote")
+    workload.stub.routes[f"pokemon/{name}"] = pokemon_payload(name, tipo=workload.rng.choice(TYPE_NAMES))
+    return Call("GET", f"/api/pokemon/pokemons/{name}/", expected=(201,))
+
+
+def random_pokemon(workload):
+    return Call("GET", "/api/pokemon/random/")
+
+
+def capturar(workload):
+    # Un usuario nuevo cada MAX_CAPTURAS capturas, con Pokémon distintos
+    if workload.captures % MAX_CAPTURAS == 0:
+        workload.capture_token = str(AccessToken.for_user(workload.new_user()))
+    name = workload.names[workload.captures % len(workload.names)]
+    workload.captures += 1
+    return Call("POST", "/api/pokemon/capturar/", {"name": name}, workload.capture_token, (201,))
+
+
+def register(workload):
+    return Call("POST", "/api/auth/register/", {"username": workload.unique("new"), "password": PASSWORD}, expected=(201,))
+
+
+def login(workload):
+    return Call("POST", "/api/auth/login/", {"username": workload.login_user.username, "password": PASSWORD})
+
+
+# (nombre, escenario, peticiones por repetición). El hash de la contraseña
+# domina register y login: con menos peticiones basta.
+SCENARIOS = (
+    ("list", list_pokemons, 50),
+    ("retrieve-hit", retrieve_hit, 50),
+    ("retrieve-miss", retrieve_miss, 20),
+    ("random", random_pokemon, 50),
+    ("capturar", capturar, 20),
+    ("register", register, 5),
+    ("login", login, 5),
+)
+
+
+# ============================================================
+# 🔹 TRANSPORTES
+# ============================================================
+class QuietRequestHandler(WSGIRequestHandler):
+    # Sin Nagle: las cabeceras y el cuerpo van en escrituras separadas y el
+    # ACK retrasado del cliente sumaría ~40 ms a cada respuesta
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+
+class SharedConnectionServer(ThreadedWSGIServer):
+    def _close_connections(self):
+        # La conexión es la del benchmark y sigue dentro de su transacción
+        pass
+
+
+@contextmanager
+def live_server():
+    """Servidor WSGI en un hilo que atiende con la conexión de este hilo; devuelve su URL."""
+    connection = connections[DEFAULT_DB_ALIAS]
+    server = SharedConnectionServer(
+        ("127.0.0.1", 0),
+        QuietRequestHandler,
+        allow_reuse_address=False,
+        connections_override={DEFAULT_DB_ALIAS: connection},
+    )
+    server.set_app(WSGIHandler())
+    host, port = server.server_address[:2]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+
+    connection.inc_thread_sharing()
+    # Igual que el cliente de pruebas: la conexión no se cierra entre peticiones
+    request_started.disconnect(close_old_connections)
+    request_finished.disconnect(close_old_connections)
+    try:
+        with modify_settings(ALLOWED_HOSTS={"append": host}):
+            thread.start()
+            yield f"http://{host}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        request_started.connect(close_old_connections)
+        request_finished.connect(close_old_connections)
+        connection.dec_thread_sharing()
+
+
+def auth_headers(call):
+    return {"Authorization": f"Bearer {call.token}"} if call.token else {}
+
+
+@contextmanager
+def django_client():
+    client = Client()
+
+    def send(call):
+        body = json.dumps(call.body) if call.body is not None else ""
+        response = client.generic(call.method, call.path, body, content_type="application/json", headers=auth_headers(call))
+        return response.status_code
+
+    # Fuera de ``manage.py test`` nadie añade el host del cliente de pruebas
+    with modify_settings(ALLOWED_HOSTS={"append": "testserver"}):
+        yield send
+
+
+@contextmanager
+def http_client():
+    with live_server() as base_url, httpx.Client(base_url=base_url, timeout=30) as client:
+
+        def send(call):
+            return client.request(call.method, call.path, json=call.body, headers=auth_headers(call)).status_code
+
+        yield send
+
+
+TRANSPORTS = (("client", django_client), ("http", http_client))
+
+
+# ============================================================
+# 🔹 MEDICIÓN
+# ============================================================
+def measure_latency(send, scenario, workload, requests):
+    """Latencias (ms), consultas SQL por petición y respuestas con un estado inesperado."""
+    latencies = []
+    errors = 0
+    queries_before = metrics.db_queries.total()
+    for _ in range(requests):
+        call = scenario(workload)
+        started = time.perf_counter()
+        status = send(call)
+        latencies.append((time.perf_counter() - started) * 1000)
+        errors += status not in call.expected
+    return latencies, (metrics.db_queries.total() - queries_before) / requests, errors
+
+
+def measure_allocations(send, scenario, workload, requests=ALLOC_REQUESTS):
+    """Mediana del pico de memoria asignada por petición (KiB, todos los hilos)."""
+    samples = []
+    tracemalloc.start()
+    try:
+        for _ in range(requests):
+            call = scenario(workload)
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            send(call)
+            samples.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return statistics.median(samples) / 1024
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Una fila por (transporte, escenario, tamaño del catálogo)."""
+    results = []
+    seeded = 0
+    with StubPokeApiServer() as stub, override_settings(POKEAPI_CLIENT={
+        **settings.POKEAPI_CLIENT,
+        "ENABLED": True,
+        "BASE_URL": stub.base_url,
+        "BACKOFF_FACTOR": 0,
+        "CACHE_DIR": None,
+    }):
+        for size in sorted(sizes):
+            seed_catalog(pokemons=size - seeded, movimientos=(size - seeded) // 5, seed=size)
+            seeded = size
+            # Las invalidaciones esperan a on_commit, que no llega dentro del benchmark
+            catalog_cache.clear()
+            random_index.reload()
+
+            workload = Workload(stub, seed=size)
+            for transport, connect in TRANSPORTS:
+                with connect() as send:
+                    for name, scenario, requests in SCENARIOS:
+                        total = requests * repeat
+                        latencies, queries, errors = measure_latency(send, scenario, workload, total)
+                        summary = summarize(latencies)
+                        results.append({
+                            "transport": transport,
+                            "scenario": name,
+                            "rows": size,
+                            "requests": total,
+                            "p50_ms": summary["p50"],
+                            "p99_ms": summary["p99"],
+                            "queries_per_request": queries,
+                            "alloc_kib": measure_allocations(send, scenario, workload),
+                            "errors": errors,
+                        })
+    return results
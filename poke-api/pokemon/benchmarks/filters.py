@@ -0,0 +1,96 @@
+"""
+filters.py
+----------
+Filtros y orden de ``/api/pokemon/pokemons/`` según el tamaño del
+catálogo (ver ``pokemon/filters.py``).
+
+Por cada consulta de ``QUERIES`` se mide la vista completa (filtros,
+``ETag``, conteo del paginador y página de ``PAGE_SIZE``) con la caché de
+lecturas desactivada, y se inspecciona el plan de la consulta de la
+página con ``QuerySet.explain()``:
+
+ - ``full_scan``: recorre la tabla de Pokémon sin índice (``SCAN`` sin
+   ``USING`` en SQLite, ``Seq Scan`` en PostgreSQL).
+ - ``sorts``: ordena en memoria (``USE TEMP B-TREE`` / nodo ``Sort``).
+
+Con los índices de ``Pokemon.Meta`` ambas columnas deben salir ``False``
+para cualquier tamaño, salvo ``sorts`` con varios tipos (``tipo=a,b``):
+cada tipo es un tramo distinto del índice y se mezclan en memoria.
+"""
+
+import re
+
+from django.test import modify_settings, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from pokemon.api.pokenmon_viewset import PokemonViewSet
+from pokemon.benchmarks.dataset import seed_catalog
+from pokemon.benchmarks.timing import measure
+from pokemon.models import Pokemon
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+KEY_COLUMNS = ("query", "rows")
+PAGE_SIZE = 50
+URL = "/api/pokemon/pokemons/"
+
+QUERIES = {
+    "tipo+attack": "tipo=fire&attack_min=100&ordering=-attack",
+    "tipo+total": "tipo=water,grass&ordering=-total_stats",
+    "total_range": "total_stats_min=450&ordering=-total_stats",
+    "hp_range": "hp_min=100&hp_max=120&ordering=hp",
+    "top_defense": "ordering=-defense",
+    "name_prefix": "name_prefix=synthetic-1000-12",
+}
+
+
+def page_queryset(query):
+    """Consulta de la primera página del listado con ``query`` (sin ejecutarla)."""
+    request = Request(APIRequestFactory().get(URL, dict(pair.split("=") for pair in query.split("&"))))
+    view = PokemonViewSet(request=request, format_kwarg=None, action="list")
+    queryset = view.filter_queryset(view.get_queryset())
+    return view.fast_serializer_class.values(queryset)[:PAGE_SIZE]
+
+
+def plan_flags(queryset, model=Pokemon):
+    """``{"full_scan", "sorts"}`` del plan de ``queryset`` sobre ``model`` (SQLite o PostgreSQL)."""
+    plan = queryset.explain()
+    table = model._meta.db_table
+    return {
+        "full_scan": bool(
+            re.search(rf"\bSCAN {table}\b(?! USING)", plan) or f"Seq Scan on {table}" in plan
+        ),
+        "sorts": "USE TEMP B-TREE" in plan or bool(re.search(r"(?<!Incremental )\bSort\b", plan)),
+    }
+
+
+@modify_settings(ALLOWED_HOSTS={"append": "testserver"})
+@override_settings(CATALOG_CACHE={"ENABLED": False})
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Una fila por (consulta, tamaño)."""
+    view = PokemonViewSet.as_view({"get": "list"})
+    factory = APIRequestFactory()
+    results = []
+    seeded = 0
+    for size in sorted(sizes):
+        seed_catalog(pokemons=size - seeded, movimientos=0, seed=size)
+        seeded = size
+
+        for name, query in QUERIES.items():
+            def call():
+                response = view(factory.get(f"{URL}?{query}&page_size={PAGE_SIZE}"))
+                if response.status_code != 200:
+                    raise AssertionError(f"{query}: {response.status_code}")
+                return response
+
+            matched = call().data["count"]
+            timing = measure(call, repeat)
+            results.append({
+                "query": name,
+                "rows": size,
+                "matched": matched,
+                **plan_flags(page_queryset(query)),
+                "best_ms": timing["best_ms"],
+                "median_ms": timing["median_ms"],
+            })
+    return results
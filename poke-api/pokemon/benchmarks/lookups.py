@@ -0,0 +1,45 @@
+"""
+lookups.py
+----------
+Latencia de la búsqueda de un Pokémon por nombre según el tamaño del
+catálogo: ``name_key`` (columna normalizada con índice único) frente a
+``name__iexact`` (no puede usar el índice de ``name``).
+"""
+
+import random
+
+from pokemon.benchmarks.dataset import seed_catalog
+from pokemon.benchmarks.timing import measure
+from pokemon.models import Pokemon, normalize_name
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+LOOKUPS = 200
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Una fila por tamaño con la latencia media por búsqueda (µs)."""
+    rng = random.Random(0)
+    results = []
+    seeded = 0
+    for size in sorted(sizes):
+        seed_catalog(pokemons=size - seeded, movimientos=0, seed=size)
+        seeded = size
+
+        names = [name.upper() for name in rng.sample(list(Pokemon.objects.values_list("name", flat=True)), min(LOOKUPS, size))]
+
+        def by_name_key():
+            for name in names:
+                Pokemon.objects.filter(name_key=normalize_name(name)).values("id").first()
+
+        def by_iexact():
+            for name in names:
+                Pokemon.objects.filter(name__iexact=name).values("id").first()
+
+        name_key = measure(by_name_key, repeat)
+        iexact = measure(by_iexact, repeat)
+        results.append({
+            "rows": size,
+            "name_key_us": name_key["median_ms"] * 1000 / len(names),
+            "iexact_us": iexact["median_ms"] * 1000 / len(names),
+        })
+    return results
@@ -0,0 +1,82 @@
+"""
+rankings.py
+-----------
+Coste de leer un top-100 de ``/api/pokemon/rankings/`` según el tamaño del
+catálogo (ver ``pokemon/services/rankings.py``).
+
+Por cada ranking se mide la lectura del top (``top_pokemon``) y se
+inspecciona su plan (``full_scan`` / ``sorts``, como en la suite
+``filters``). Como referencia, ``python_ms`` es el mismo top de
+``total_stats`` calculado como antes: cargando todos los Pokémon y
+ordenando por ``full_stats`` en Python.
+
+Las filas de ``RankingBatalla`` se generan directamente (batallas y
+victorias pseudoaleatorias); ``record_us`` es el coste de registrar una
+batalla con ``record_battle`` sobre esa tabla.
+"""
+
+import random
+import time
+
+from pokemon.benchmarks.dataset import seed_catalog
+from pokemon.benchmarks.filters import plan_flags
+from pokemon.benchmarks.timing import measure
+from pokemon.models import Pokemon, RankingBatalla, Tipo
+from pokemon.services import record_battle, top_pokemon
+from pokemon.services.rankings import ranking_queryset
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+KEY_COLUMNS = ("ranking", "rows")
+TOP = 100
+RECORDS = 200
+
+
+def seed_rankings(pokemon_ids, rng):
+    rows = []
+    for pokemon_id, tipo_id in pokemon_ids:
+        battles = rng.randint(0, 60)
+        wins = rng.randint(0, battles)
+        rows.append(RankingBatalla(
+            pokemon_id=pokemon_id, tipo_id=tipo_id,
+            batallas=battles, victorias=wins, win_rate=wins / battles if battles else 0,
+        ))
+    RankingBatalla.objects.bulk_create(rows, batch_size=1000)
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Una fila por (ranking, tamaño)."""
+    rng = random.Random(0)
+    results = []
+    seeded = 0
+    for size in sorted(sizes):
+        seed_catalog(pokemons=size - seeded, movimientos=0, seed=size)
+        new = Pokemon.objects.exclude(pk__in=RankingBatalla.objects.values("pk")).values_list("pk", "tipo_id")
+        seed_rankings(list(new), rng)
+        seeded = size
+        tipo_id = Tipo.objects.get(name="fire").pk
+
+        def python_top():
+            return sorted(Pokemon.objects.select_related("tipo"), key=lambda p: -p.full_stats["total"])[:TOP]
+
+        python = measure(python_top, repeat)
+        pokemons = list(Pokemon.objects.select_related("tipo").order_by("?")[:RECORDS * 2])
+
+        started = time.perf_counter()
+        for attacker, defender in zip(pokemons[::2], pokemons[1::2]):
+            record_battle(attacker, defender, rng.choice(["attacker", "defender", None]), rng.randint(1, 30))
+        record_us = (time.perf_counter() - started) * 1_000_000 / max(1, len(pokemons) // 2)
+
+        for by in ("total_stats", "win_rate"):
+            for tipo in (None, tipo_id):
+                timing = measure(lambda: top_pokemon(by, tipo, TOP, min_battles=5), repeat)
+                queryset = ranking_queryset(by, tipo, min_battles=5)[:TOP]
+                results.append({
+                    "ranking": by if tipo is None else f"{by}/tipo",
+                    "rows": size,
+                    **plan_flags(queryset, Pokemon if by == "total_stats" else RankingBatalla),
+                    "best_ms": timing["best_ms"],
+                    "median_ms": timing["median_ms"],
+                    "python_ms": python["median_ms"] if by == "total_stats" and tipo is None else None,
+                    "record_us": record_us,
+                })
+    return results
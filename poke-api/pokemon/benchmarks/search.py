@@ -0,0 +1,110 @@
+"""
+search.py
+---------
+Latencia de ``GET /api/pokemon/search/`` con el índice de nombres en
+memoria (ver ``pokemon/services/name_index.py``) según el tamaño del
+catálogo.
+
+Los nombres sintéticos de ``seed_catalog`` comparten casi todos sus
+trigramas, así que aquí se generan nombres pronunciables a partir de
+sílabas (``"charbasaur"``, ``"pikamon"``...). Por cada tamaño se mide la
+construcción del índice y, por tipo de consulta, la búsqueda sola
+(``search``) y la petición completa (``request``):
+
+ - ``prefix``: las primeras letras de un nombre existente.
+ - ``typo``: un nombre existente sin una letra (``"charzard"``).
+ - ``miss``: una cadena que no se parece a ningún nombre.
+"""
+
+import random
+import time
+
+from django.test import modify_settings
+from rest_framework.test import APIRequestFactory
+
+from pokemon.api.search_viewset import name_search
+from pokemon.benchmarks.dataset import seed_catalog
+from pokemon.models import Pokemon, Tipo
+from pokemon.services import name_index, summarize
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+KEY_COLUMNS = ("query", "rows")
+QUERIES = 200
+SYLLABLES = (
+    "bul", "ba", "saur", "char", "man", "der", "me", "le", "on", "iz", "ard", "squir",
+    "tle", "war", "pi", "ka", "chu", "rai", "ev", "ee", "gen", "gar", "dra", "go",
+    "nite", "ly", "sna", "lax", "mew", "two", "zu", "bat", "ge", "o", "dude", "gol",
+)
+
+
+def pokemon_names(count, rng):
+    """``count`` nombres distintos de 2 a 4 sílabas (con sufijo numérico si se agotan)."""
+    names = set()
+    while len(names) < count:
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if name in names:
+            name = f"{name}-{len(names)}"
+        names.add(name)
+    return sorted(names)
+
+
+def queries(names, rng):
+    sample = rng.sample(names, min(QUERIES, len(names)))
+    typos = []
+    for name in sample:
+        position = rng.randrange(1, len(name) - 1) if len(name) > 2 else 0
+        typos.append(name[:position] + name[position + 1:])
+    return {
+        "prefix": [name[:4] for name in sample],
+        "typo": typos,
+        "miss": ["".join(rng.choice("qxzjvw") for _ in range(8)) for _ in sample],
+    }
+
+
+@modify_settings(ALLOWED_HOSTS={"append": "testserver"})
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Una fila por (tipo de consulta, tamaño) con latencias en µs."""
+    rng = random.Random(0)
+    seed_catalog(pokemons=0, movimientos=0)
+    tipo = Tipo.objects.order_by("id").first()
+    factory = APIRequestFactory()
+    results = []
+    catalog = rng.sample(pokemon_names(max(sizes), rng), max(sizes))
+    seeded = 0
+    for size in sorted(sizes):
+        Pokemon.objects.bulk_create(
+            [Pokemon(name=name, hp=50, attack=50, defense=50, tipo=tipo) for name in catalog[seeded:size]],
+            batch_size=1000,
+        )
+        seeded = size
+        names = catalog[:size]
+
+        started = time.perf_counter()
+        name_index.reload()
+        build_ms = (time.perf_counter() - started) * 1000
+
+        for kind, terms in queries(names, rng).items():
+            search, request, found = [], [], 0
+            for _ in range(repeat):
+                for term in terms:
+                    started = time.perf_counter()
+                    found += bool(name_index.search(term))
+                    search.append((time.perf_counter() - started) * 1_000_000)
+
+                    started = time.perf_counter()
+                    response = name_search(factory.get("/api/pokemon/search/", {"q": term}))
+                    request.append((time.perf_counter() - started) * 1_000_000)
+                    if response.status_code != 200:
+                        raise AssertionError(f"{term}: {response.status_code}")
+            search, request = summarize(search), summarize(request)
+            results.append({
+                "query": kind,
+                "rows": size,
+                "build_ms": build_ms,
+                "found_%": 100 * found / (len(terms) * repeat),
+                "search_p50_us": search["p50"],
+                "search_p99_us": search["p99"],
+                "request_p50_us": request["p50"],
+            })
+    name_index.invalidate()
+    return results
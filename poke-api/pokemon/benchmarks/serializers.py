@@ -0,0 +1,48 @@
+"""
+serializers.py
+--------------
+Compara los ``ModelSerializer`` de los viewsets con los ``ValuesSerializer``
+rápidos al serializar N filas (consulta incluida).
+"""
+
+from pokemon.api.movimiento_viewset import MovimientoSerializer
+from pokemon.api.pokenmon_viewset import PokemonSerializer
+from pokemon.api.tipo_viewset import TipoSerializer
+from pokemon.benchmarks.dataset import seed_catalog
+from pokemon.benchmarks.timing import measure
+from pokemon.models import Movimiento, Pokemon, Tipo
+from pokemon.serializers import (
+    FastMovimientoSerializer,
+    FastPokemonSerializer,
+    FastTipoSerializer,
+)
+
+DEFAULT_SIZES = (10, 1000, 50000)
+
+CASES = (
+    ("pokemon", Pokemon.objects.select_related("tipo"), PokemonSerializer, FastPokemonSerializer),
+    ("movimiento", Movimiento.objects.select_related("tipo"), MovimientoSerializer, FastMovimientoSerializer),
+    ("tipo", Tipo.objects.all(), TipoSerializer, FastTipoSerializer),
+)
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Devuelve una fila de resultados por (modelo, tamaño)."""
+    results = []
+    seeded = 0
+    for size in sorted(sizes):
+        seed_catalog(pokemons=size - seeded, movimientos=size - seeded, seed=size)
+        seeded = size
+
+        for name, queryset, model_serializer, fast_serializer in CASES:
+            rows = queryset.order_by("id")[:size]
+            model = measure(lambda: model_serializer(list(rows.all()), many=True).data, repeat)
+            fast = measure(lambda: fast_serializer(list(fast_serializer.values(rows.all())), many=True).data, repeat)
+            results.append({
+                "case": name,
+                "rows": min(size, rows.count()),
+                "model_serializer_ms": model["median_ms"],
+                "fast_serializer_ms": fast["median_ms"],
+                "speedup": model["median_ms"] / fast["median_ms"] if fast["median_ms"] else None,
+            })
+    return results
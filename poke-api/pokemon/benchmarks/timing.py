@@ -0,0 +1,18 @@
+"""
+timing.py
+---------
+Medición de tiempos para los benchmarks.
+"""
+
+import statistics
+import time
+
+
+def measure(fn, repeat=5):
+    """Ejecuta ``fn`` ``repeat`` veces y devuelve ``{"best_ms", "median_ms"}``."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"best_ms": min(samples), "median_ms": statistics.median(samples)}
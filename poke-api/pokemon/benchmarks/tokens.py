@@ -0,0 +1,72 @@
+"""
+tokens.py
+---------
+Coste de autenticar una lectura con JWT: ``JWTAuthentication`` (carga el
+usuario en cada petición) frente a ``StatelessJWTAuthentication`` (usuario
+desde los claims y estado cacheado, ver ``authentication/token_auth.py``).
+
+Llama a la vista de ``GET /api/pokemon/capturas/`` (el equipo del usuario)
+con cada clase de autenticación. Los tamaños son capturas en el equipo.
+"""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from authentication.api.auth_viewset import CustomTokenObtainPairSerializer
+from authentication.token_auth import StatelessJWTAuthentication
+from pokemon.api.captura_viewset import CapturaViewSet
+from pokemon.benchmarks.dataset import seed_catalog
+from pokemon.models import MAX_CAPTURAS, Pokemon
+from pokemon.services import capturar, summarize
+
+DEFAULT_SIZES = (1, MAX_CAPTURAS)
+KEY_COLUMNS = ("authentication", "capturas")
+REQUESTS = 200
+AUTHENTICATORS = (JWTAuthentication, StatelessJWTAuthentication)
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3):
+    """Una fila por (clase de autenticación, capturas)."""
+    sizes = sorted(min(size, MAX_CAPTURAS) for size in set(sizes))
+    seed_catalog(pokemons=max(sizes), movimientos=0, seed=0)
+    factory = APIRequestFactory()
+    results = []
+    for size in sizes:
+        user = get_user_model().objects.create_user(username=f"bench-tokens-{size}", password=None)
+        for pokemon in Pokemon.objects.order_by("id")[:size]:
+            capturar(user, pokemon)
+        header = f"Bearer {CustomTokenObtainPairSerializer.get_token(user).access_token}"
+
+        for authentication in AUTHENTICATORS:
+            view = CapturaViewSet.as_view({"get": "list"}, authentication_classes=[authentication])
+
+            def call():
+                response = view(factory.get("/api/pokemon/capturas/", HTTP_AUTHORIZATION=header))
+                if response.status_code != 200:
+                    raise AssertionError(f"{authentication.__name__}: {response.status_code}")
+                return response.render()
+
+            # La primera llamada guarda el estado del usuario en caché
+            call()
+            with CaptureQueriesContext(connection) as context:
+                call()
+
+            samples = []
+            for _ in range(REQUESTS * repeat):
+                started = time.perf_counter()
+                call()
+                samples.append((time.perf_counter() - started) * 1_000_000)
+            summary = summarize(samples)
+            results.append({
+                "authentication": authentication.__name__,
+                "capturas": size,
+                "queries_per_request": len(context.captured_queries),
+                "p50_us": summary["p50"],
+                "p99_us": summary["p99"],
+            })
+    return results
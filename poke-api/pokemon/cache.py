@@ -0,0 +1,182 @@
+"""
+cache.py
+--------
+Caché de lecturas del catálogo (Pokémon, Tipos y Movimientos).
+
+Guarda las respuestas de ``list`` y ``retrieve`` en el backend de Django
+configurado en ``settings.CATALOG_CACHE["ALIAS"]`` (locmem por defecto;
+archivo o Redis cambiando ``CACHES``):
+
+ - Detalle: ``catalog:<recurso>:detail:<pk>`` con la representación
+   completa del objeto. Las búsquedas por nombre pasan por un alias
+   ``catalog:<recurso>:name:<name_key>`` → pk, que se verifica contra el
+   nombre guardado (un renombrado no devuelve datos ajenos).
+ - Listados: ``catalog:<recurso>:list:<generación>:<host>:<query>``. Cada
+   recurso tiene un contador de generación; incrementarlo deja huérfanos
+   todos sus listados de una vez.
+
+La invalidación es explícita desde ``post_save``/``post_delete`` (ver
+``pokemon/signals.py``): se borra el detalle del objeto modificado y se
+incrementa la generación de los listados afectados. El TTL del backend solo
+es una red de seguridad.
+
+Los aciertos y fallos se cuentan por recurso y tipo de lectura en el
+proceso actual (``catalog_cache.stats()``, ``GET /api/pokemon/cache/``).
+"""
+
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from pokemon.models.fields import normalize_name
+
+DEFAULTS = {
+    "ALIAS": "catalog",
+    "ENABLED": True,
+    "TIMEOUT": 60 * 60,
+}
+
+HIT = "hit"
+MISS = "miss"
+
+
+class CatalogCache:
+    """Caché por recurso con invalidación explícita y contadores de aciertos."""
+
+    def __init__(self):
+        self._counters = Counter()
+        self._lock = threading.Lock()
+        self._configure()
+
+    def _configure(self):
+        config = {**DEFAULTS, **getattr(settings, "CATALOG_CACHE", {})}
+        self.alias = config["ALIAS"]
+        self.enabled = config["ENABLED"]
+        self.timeout = config["TIMEOUT"]
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    # --------------------------------------------------------
+    # 🔸 Claves
+    # --------------------------------------------------------
+    @staticmethod
+    def detail_key(resource, pk):
+        return f"catalog:{resource}:detail:{pk}"
+
+    @staticmethod
+    def name_key(resource, name):
+        return f"catalog:{resource}:name:{name}"
+
+    @staticmethod
+    def generation_key(resource):
+        return f"catalog:{resource}:generation"
+
+    def generation(self, resource):
+        key = self.generation_key(resource)
+        value = self.backend.get(key)
+        if value is None:
+            # Arrancar desde el reloj: si el contador fue desalojado, la nueva
+            # generación nunca coincide con listados viejos aún guardados.
+            self.backend.add(key, time.time_ns(), timeout=None)
+            value = self.backend.get(key)
+        return value
+
+    # --------------------------------------------------------
+    # 🔸 Detalle
+    # --------------------------------------------------------
+    def get_detail(self, resource, pk=None, name_key=None):
+        """Representación cacheada buscada por ``pk`` o por ``name_key``."""
+        if not self.enabled:
+            return None
+        if pk is None:
+            pk = self.backend.get(self.name_key(resource, name_key))
+
+        item = self.backend.get(self.detail_key(resource, pk)) if pk is not None else None
+        if item is not None and name_key is not None and normalize_name(item["name"]) != name_key:
+            item = None
+
+        self.count(resource, "detail", HIT if item is not None else MISS)
+        return item
+
+    def set_detail(self, resource, item):
+        if not self.enabled:
+            return
+        self.backend.set_many(
+            {
+                self.detail_key(resource, item["id"]): item,
+                self.name_key(resource, normalize_name(item["name"])): item["id"],
+            },
+            timeout=self.timeout,
+        )
+
+    # --------------------------------------------------------
+    # 🔸 Listados
+    # --------------------------------------------------------
+    def list_key(self, resource, request):
+        query = "&".join(sorted(request.GET.urlencode().split("&")))
+        return f"catalog:{resource}:list:{self.generation(resource)}:{request.get_host()}:{query}"
+
+    def get_list(self, resource, key):
+        if not self.enabled:
+            return None
+        data = self.backend.get(key)
+        self.count(resource, "list", HIT if data is not None else MISS)
+        return data
+
+    def set_list(self, key, data):
+        if self.enabled:
+            self.backend.set(key, data, timeout=self.timeout)
+
+    # --------------------------------------------------------
+    # 🔸 Invalidación
+    # --------------------------------------------------------
+    def invalidate(self, resource, pks=()):
+        """Borra el detalle de ``pks`` y deja obsoletos todos los listados de ``resource``."""
+        if pks:
+            self.backend.delete_many([self.detail_key(resource, pk) for pk in pks])
+        try:
+            self.backend.incr(self.generation_key(resource))
+        except ValueError:
+            self.backend.set(self.generation_key(resource), time.time_ns(), timeout=None)
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            self._counters.clear()
+
+    # --------------------------------------------------------
+    # 🔸 Contadores
+    # --------------------------------------------------------
+    def count(self, resource, kind, outcome):
+        with self._lock:
+            self._counters[(resource, kind, outcome)] += 1
+
+    def stats(self):
+        """``{recurso: {"detail": {"hit", "miss", "hit_rate"}, "list": {...}}}``."""
+        with self._lock:
+            counters = dict(self._counters)
+
+        stats = {}
+        for (resource, kind, outcome), value in sorted(counters.items()):
+            stats.setdefault(resource, {}).setdefault(kind, {HIT: 0, MISS: 0})[outcome] = value
+        for kinds in stats.values():
+            for entry in kinds.values():
+                total = entry[HIT] + entry[MISS]
+                entry["hit_rate"] = entry[HIT] / total if total else 0.0
+        return stats
+
+
+catalog_cache = CatalogCache()
+
+
+@receiver(setting_changed)
+def _reconfigure_on_setting_change(sender, setting, **kwargs):
+    if setting in ("CATALOG_CACHE", "CACHES"):
+        catalog_cache._configure()
@@ -0,0 +1,453 @@
+"""
+clients.py
+----------
+Cliente HTTP compartido para la PokeAPI v2.
+
+Todas las vistas que recurren a la PokeAPI cuando un recurso no existe
+localmente pasan por ``PokeApiClient``:
+
+ - Una única ``requests.Session`` con pool de conexiones (sin handshake
+   TCP+TLS por petición).
+ - Timeouts por endpoint (``pokemon``, ``type``, ``move``...).
+ - Reintentos con backoff exponencial ante errores 429/5xx.
+ - Caché de respuestas en memoria + disco, acotada, con TTL y desalojo LRU,
+   indexada por la ruta del recurso (``pokemon/charizard``).
+ - Cada llamada de red se registra en ``/api/metrics/`` (conteo por
+   resultado y latencia, reintentos incluidos).
+
+``AsyncPokeApiClient`` es la variante para las vistas ASGI (httpx): mismos
+timeouts, reintentos y caché, sin bloquear un hilo durante la descarga.
+
+La configuración se lee de ``settings.POKEAPI_CLIENT``. Con ``ENABLED`` en
+``False`` (modo sin red, catálogo cargado con ``load_snapshot``) ningún
+cliente sale a la PokeAPI: lo que no esté en la caché cuenta como
+inexistente y las vistas responden 404.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+
+import httpx
+import requests
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from poke_api.metrics import observe_upstream
+
+
+DEFAULTS = {
+    "ENABLED": True,
+    "BASE_URL": "https://pokeapi.co/api/v2/",
+    "TIMEOUTS": {"default": (3.05, 8)},
+    "RETRIES": 3,
+    "BACKOFF_FACTOR": 0.3,
+    "POOL_SIZE": 20,
+    "CACHE_TTL": 60 * 60 * 24,
+    "CACHE_MAX_ENTRIES": 2048,
+    "CACHE_DIR": None,
+    "ASYNC_MAX_CONNECTIONS": 200,
+}
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class PokeApiError(Exception):
+    """La PokeAPI no respondió (conexión, timeout o 5xx tras los reintentos)."""
+
+
+# ============================================================
+# 🔹 CACHÉ DE RESPUESTAS (memoria + disco)
+# ============================================================
+class ResponseCache:
+    """
+    Caché LRU con TTL en dos niveles.
+
+    El nivel en memoria es un ``OrderedDict`` acotado a ``max_entries``.
+    El nivel en disco (opcional) guarda un JSON por recurso en ``directory``
+    y se acota al mismo número de archivos, desalojando el menos usado.
+
+    ``get`` y ``set`` pueden leer y escribir en disco con el lock tomado:
+    desde un event loop solo se llama a ``peek``, que nunca espera.
+    """
+
+    def __init__(self, ttl, max_entries, directory=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self._memory = OrderedDict()
+        self._disk_index = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            entries = sorted(
+                (entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")),
+                key=lambda entry: entry.stat().st_mtime,
+            )
+            for entry in entries:
+                self._disk_index[entry.name] = None
+
+    @staticmethod
+    def _filename(key):
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json"
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            value = self._recall(key, now)
+            if value is not None or not self.directory:
+                return value
+
+            filename = self._filename(key)
+            if filename not in self._disk_index:
+                return None
+            path = self.directory / filename
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    stored = json.load(fh)
+            except (OSError, ValueError):
+                self._disk_index.pop(filename, None)
+                return None
+
+            if now - stored["stored_at"] >= self.ttl:
+                self._disk_index.pop(filename, None)
+                path.unlink(missing_ok=True)
+                return None
+
+            os.utime(path)
+            self._disk_index.move_to_end(filename)
+            self._remember(key, stored["stored_at"], stored["data"])
+            return stored["data"]
+
+    def peek(self, key):
+        """
+        Solo el nivel en memoria y sin esperar el lock: ``None`` si no está
+        o si otro hilo lo tiene (p. ej. leyendo del disco). En ese caso el
+        llamador debe recurrir a ``get`` fuera del event loop.
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            return self._recall(key, time.time())
+        finally:
+            self._lock.release()
+
+    def set(self, key, value):
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if not self.directory:
+                return
+
+            filename = self._filename(key)
+            tmp = self.directory / (filename + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({"path": key, "stored_at": now, "data": value}, fh)
+            os.replace(tmp, self.directory / filename)
+            self._disk_index[filename] = None
+            self._disk_index.move_to_end(filename)
+            while len(self._disk_index) > self.max_entries:
+                oldest, _ = self._disk_index.popitem(last=False)
+                (self.directory / oldest).unlink(missing_ok=True)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self.directory:
+                for filename in self._disk_index:
+                    (self.directory / filename).unlink(missing_ok=True)
+            self._disk_index.clear()
+
+    def _recall(self, key, now):
+        hit = self._memory.get(key)
+        if hit is None:
+            return None
+        stored_at, value = hit
+        if now - stored_at >= self.ttl:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _remember(self, key, stored_at, value):
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# ============================================================
+# 🔹 CLIENTE POKEAPI
+# ============================================================
+class PokeApiClient:
+    """Cliente con pool de conexiones, reintentos y caché para la PokeAPI."""
+
+    def __init__(
+        self,
+        base_url=DEFAULTS["BASE_URL"],
+        timeouts=None,
+        retries=DEFAULTS["RETRIES"],
+        backoff_factor=DEFAULTS["BACKOFF_FACTOR"],
+        pool_size=DEFAULTS["POOL_SIZE"],
+        cache_ttl=DEFAULTS["CACHE_TTL"],
+        cache_max_entries=DEFAULTS["CACHE_MAX_ENTRIES"],
+        cache_dir=DEFAULTS["CACHE_DIR"],
+        enabled=DEFAULTS["ENABLED"],
+    ):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.enabled = enabled
+        self.pool_size = pool_size
+        self.timeouts = {**DEFAULTS["TIMEOUTS"], **(timeouts or {})}
+        self.cache = ResponseCache(cache_ttl, cache_max_entries, cache_dir)
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+    @classmethod
+    def from_settings(cls):
+        config = {**DEFAULTS, **getattr(settings, "POKEAPI_CLIENT", {})}
+        return cls(
+            base_url=config["BASE_URL"],
+            timeouts=config["TIMEOUTS"],
+            retries=config["RETRIES"],
+            backoff_factor=config["BACKOFF_FACTOR"],
+            pool_size=config["POOL_SIZE"],
+            cache_ttl=config["CACHE_TTL"],
+            cache_max_entries=config["CACHE_MAX_ENTRIES"],
+            cache_dir=config["CACHE_DIR"],
+            enabled=config["ENABLED"],
+        )
+
+    @staticmethod
+    def resource_path(resource, identifier):
+        """Ruta normalizada del recurso, usada también como clave de caché."""
+        return f"{resource}/{str(identifier).strip().lower()}"
+
+    def get(self, resource, identifier):
+        """
+        Devuelve el JSON de ``/<resource>/<identifier>/``.
+
+        Retorna ``None`` si la PokeAPI responde 404 y lanza ``PokeApiError``
+        si no se pudo obtener una respuesta válida.
+        """
+        path = self.resource_path(resource, identifier)
+        return self._fetch(resource, path, f"{self.base_url}{path}/")
+
+    def list(self, resource, limit=2000):
+        """Devuelve ``results`` del listado ``/<resource>/?limit=N``."""
+        path = f"{resource}?limit={limit}"
+        data = self._fetch(resource, path, f"{self.base_url}{resource}/?limit={limit}")
+        return data["results"] if data else []
+
+    def _fetch(self, resource, path, url):
+        cached = self.cache.get(path)
+        if cached is not None:
+            return cached
+        if not self.enabled:
+            return None
+
+        timeout = self.timeouts.get(resource, self.timeouts["default"])
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            try:
+                response = self.session.get(url, timeout=timeout)
+            except requests.RequestException as exc:
+                raise PokeApiError(str(exc)) from exc
+
+            if response.status_code == 404:
+                outcome = "not_found"
+                return None
+            if response.status_code != 200:
+                raise PokeApiError(f"PokeAPI respondió {response.status_code} para {path}")
+
+            try:
+                data = response.json()
+            except ValueError as exc:
+                raise PokeApiError(f"Respuesta inválida de la PokeAPI para {path}") from exc
+            outcome = "ok"
+        finally:
+            observe_upstream(resource, outcome, time.perf_counter() - started)
+
+        self.cache.set(path, data)
+        return data
+
+    def pokemon(self, identifier):
+        return self.get("pokemon", identifier)
+
+    def tipo(self, identifier):
+        return self.get("type", identifier)
+
+    def movimiento(self, identifier):
+        return self.get("move", identifier)
+
+    def close(self):
+        self.session.close()
+
+
+# ============================================================
+# 🔹 CLIENTE ASÍNCRONO
+# ============================================================
+class AsyncPokeApiClient:
+    """
+    Cliente httpx para las vistas asíncronas.
+
+    Un ``AsyncClient`` con pool de conexiones por event loop; comparte la
+    ``ResponseCache`` del cliente síncrono para que ambos caminos vean las
+    mismas respuestas. Los aciertos en memoria se leen en el event loop con
+    ``peek``; el resto de lecturas y las escrituras (disco y lock compartido
+    con los hilos síncronos) van en un hilo con ``asyncio.to_thread``.
+    """
+
+    def __init__(self, base_url, timeouts, retries, backoff_factor, max_connections, cache, enabled=True):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.enabled = enabled
+        self.timeouts = {**DEFAULTS["TIMEOUTS"], **(timeouts or {})}
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.cache = cache
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            headers={"Accept": "application/json"},
+        )
+
+    @classmethod
+    def from_settings(cls):
+        config = {**DEFAULTS, **getattr(settings, "POKEAPI_CLIENT", {})}
+        return cls(
+            base_url=config["BASE_URL"],
+            timeouts=config["TIMEOUTS"],
+            retries=config["RETRIES"],
+            backoff_factor=config["BACKOFF_FACTOR"],
+            max_connections=config["ASYNC_MAX_CONNECTIONS"],
+            cache=get_client().cache,
+            enabled=config["ENABLED"],
+        )
+
+    async def get(self, resource, identifier):
+        """Igual que ``PokeApiClient.get``: JSON, ``None`` (404) o ``PokeApiError``."""
+        path = PokeApiClient.resource_path(resource, identifier)
+        cached = self.cache.peek(path)
+        if cached is None:
+            cached = await asyncio.to_thread(self.cache.get, path)
+        if cached is not None:
+            return cached
+        if not self.enabled:
+            return None
+
+        connect, read = self.timeouts.get(resource, self.timeouts["default"])
+        timeout = httpx.Timeout(read, connect=connect)
+        url = f"{self.base_url}{path}/"
+
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    response = await self.client.get(url, timeout=timeout)
+                except httpx.HTTPError as exc:
+                    if attempt == self.retries:
+                        raise PokeApiError(str(exc)) from exc
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                        break
+                await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+
+            if response.status_code == 404:
+                outcome = "not_found"
+                return None
+            if response.status_code != 200:
+                raise PokeApiError(f"PokeAPI respondió {response.status_code} para {path}")
+            try:
+                data = response.json()
+            except ValueError as exc:
+                raise PokeApiError(f"Respuesta inválida de la PokeAPI para {path}") from exc
+            outcome = "ok"
+        finally:
+            observe_upstream(resource, outcome, time.perf_counter() - started)
+
+        await asyncio.to_thread(self.cache.set, path, data)
+        return data
+
+    async def pokemon(self, identifier):
+        return await self.get("pokemon", identifier)
+
+    async def tipo(self, identifier):
+        return await self.get("type", identifier)
+
+    async def movimiento(self, identifier):
+        return await self.get("move", identifier)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+# ============================================================
+# 🔹 INSTANCIA COMPARTIDA
+# ============================================================
+_client = None
+_client_lock = threading.Lock()
+# Un AsyncClient solo puede usarse en el event loop que lo creó
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_client():
+    """Devuelve el cliente compartido del proceso (creado bajo demanda)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PokeApiClient.from_settings()
+    return _client
+
+
+def get_async_client():
+    """Cliente asíncrono del event loop actual (creado bajo demanda)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncPokeApiClient.from_settings()
+    return client
+
+
+def reset_client():
+    """Descarta los clientes compartidos (p. ej. al cambiar la configuración)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _async_clients.clear()
+
+
+@receiver(setting_changed)
+def _reset_on_setting_change(sender, setting, **kwargs):
+    if setting == "POKEAPI_CLIENT":
+        reset_client()
@@ -0,0 +1,151 @@
+"""
+filters.py
+----------
+Filtros y orden de los listados del catálogo.
+
+``CatalogFilter`` (configurado con atributos del viewset):
+
+ - ``?name_prefix=pika``: nombre que empieza por ``pika`` (sin distinguir
+   mayúsculas). Se traduce al rango ``name_key >= 'pika' AND name_key <
+   'pikb'``, que usa el índice único de ``name_key`` en cualquier backend
+   (``LIKE 'pika%'`` no lo usa en SQLite). Sin ``?ordering=`` los
+   resultados salen por ``name_key``, el orden del índice.
+ - ``?tipo=fire,water`` (nombres o IDs), si el viewset define
+   ``tipo_field``. Los nombres se traducen a IDs con la matriz de
+   efectividad en memoria (``get_type_chart``), sin join con ``tipos``;
+   los que la matriz no conoce (creados en otro proceso) se buscan en la
+   base. Un tipo inexistente no coincide con nada.
+ - ``?<campo>_min=`` / ``?<campo>_max=`` (límites incluidos) para cada
+   campo de ``range_fields``.
+
+``MoveSummaryFilter`` filtra ``/api/pokemon/pokemons/`` por el resumen
+desnormalizado de movimientos (columnas de ``Pokemon``, sin joins con la
+tabla intermedia):
+
+ - ``?min_moves=10``: al menos 10 movimientos.
+ - ``?min_move_power=90``: algún movimiento con potencia ≥ 90.
+ - ``?move_type=fire,water``: movimientos de todos esos tipos
+   (``move_types & máscara = máscara``).
+
+``CatalogOrderingFilter``: ``?ordering=-attack`` sobre ``ordering_fields``.
+
+Los filtros de ``Pokemon`` se apoyan en los índices ``(tipo, campo, id)``
+y ``(campo, id)`` de ``Pokemon.Meta``. Un valor inválido responde 400 con
+el parámetro como clave.
+"""
+
+from django.db.models import F
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from pokemon.battle.type_chart import TYPE_BITS, UNKNOWN_TYPE, get_type_chart, type_mask
+from pokemon.models import Tipo, is_numeric_id, normalize_name
+
+
+def int_param(request, name):
+    """Entero no negativo de ``?<name>=`` o ``None`` si no viene."""
+    value = request.query_params.get(name)
+    if value in (None, ""):
+        return None
+    value = value.strip()
+    # isascii(): isdigit() también acepta "²", que int() rechaza
+    if not (value.isascii() and value.isdigit()):
+        raise ValidationError({name: "Debe ser un entero no negativo."})
+    return int(value)
+
+
+def list_param(request, name):
+    """Valores no vacíos de ``?<name>=a,b``, normalizados."""
+    value = request.query_params.get(name) or ""
+    return [normalize_name(item) for item in value.split(",") if item.strip()]
+
+
+def prefix_range(prefix):
+    """``(desde, hasta)`` de las cadenas que empiezan por ``prefix`` (``hasta`` excluido)."""
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class CatalogFilter(BaseFilterBackend):
+    """``name_prefix``, ``tipo`` (con ``view.tipo_field``) y ``view.range_fields``."""
+
+    def filter_queryset(self, request, queryset, view):
+        prefix = normalize_name(request.query_params.get("name_prefix", ""))
+        if prefix:
+            start, stop = prefix_range(prefix)
+            queryset = queryset.filter(name_key__gte=start, name_key__lt=stop).order_by("name_key")
+
+        tipo_field = getattr(view, "tipo_field", None)
+        tipos = list_param(request, "tipo") if tipo_field else []
+        if tipos:
+            queryset = queryset.filter(**{f"{tipo_field}_id__in": self.tipo_ids(tipos)})
+
+        for field in getattr(view, "range_fields", ()):
+            low = int_param(request, f"{field}_min")
+            if low is not None:
+                queryset = queryset.filter(**{f"{field}__gte": low})
+            high = int_param(request, f"{field}_max")
+            if high is not None:
+                queryset = queryset.filter(**{f"{field}__lte": high})
+        return queryset
+
+    @staticmethod
+    def tipo_ids(tipos):
+        chart = get_type_chart()
+        ids = {int(tipo) if is_numeric_id(tipo) else chart.index(name=tipo) for tipo in tipos}
+        unknown = [tipo for tipo in tipos if not is_numeric_id(tipo) and chart.index(name=tipo) == UNKNOWN_TYPE]
+        if unknown:
+            ids.update(Tipo.objects.filter(name_key__in=unknown).values_list("id", flat=True))
+        ids.discard(UNKNOWN_TYPE)
+        return ids
+
+
+class MoveSummaryFilter(BaseFilterBackend):
+    """Filtros por ``move_count``, ``max_move_power`` y ``move_types``."""
+
+    def filter_queryset(self, request, queryset, view):
+        min_moves = int_param(request, "min_moves")
+        if min_moves is not None:
+            queryset = queryset.filter(move_count__gte=min_moves)
+
+        min_power = int_param(request, "min_move_power")
+        if min_power is not None:
+            queryset = queryset.filter(max_move_power__gte=min_power)
+
+        names = list_param(request, "move_type")
+        if names:
+            unknown = [name for name in names if name not in TYPE_BITS]
+            if unknown:
+                raise ValidationError({"move_type": f"Tipos desconocidos: {', '.join(unknown)}."})
+            mask = type_mask(names)
+            queryset = queryset.alias(coverage=F("move_types").bitand(mask)).filter(coverage=mask)
+        return queryset
+
+
+class CatalogOrderingFilter(OrderingFilter):
+    """
+    ``OrderingFilter`` que desempata por ``id`` en el mismo sentido que el
+    último campo pedido: el orden es estable entre páginas y los índices
+    ``(..., campo, id)`` se recorren en un solo sentido, sin ordenar en
+    memoria. Sin ``?ordering=`` se conserva el orden del queryset.
+
+    ``get_ordering`` nunca devuelve ``None``: ``CursorPagination`` lo
+    consulta y en DRF 3.14 exige un orden; sin ``?ordering=`` es ``id``.
+    """
+
+    def requested_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return None
+        ordering = list(ordering)
+        if not any(term.lstrip("-") in ("id", "pk") for term in ordering):
+            ordering.append("-id" if ordering[-1].startswith("-") else "id")
+        return ordering
+
+    def get_ordering(self, request, queryset, view):
+        return self.requested_ordering(request, queryset, view) or ["id"]
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.requested_ordering(request, queryset, view)
+        if ordering:
+            return queryset.order_by(*ordering)
+        return queryset
@@ -0,0 +1,73 @@
+"""
+backfill_name_keys
+------------------
+Rellena ``name_key`` en las filas creadas antes de que existiera la columna.
+
+Uso:
+    python manage.py backfill_name_keys
+    python manage.py backfill_name_keys --all          # recalcula todas las filas
+    python manage.py backfill_name_keys --batch-size 5000
+
+Las migraciones no se versionan en este repositorio, así que el relleno es
+un comando en lugar de una migración de datos. Ejecutarlo después de
+``migrate`` en bases existentes; es idempotente y avanza por lotes de PK.
+Si dos nombres colisionan al normalizarse (``Pikachu`` y ``pikachu``), la
+fila que ya tenía la clave (o la de menor PK) la conserva; la otra se
+reporta y queda sin clave.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from pokemon.models import Movimiento, Pokemon, Tipo, normalize_name
+
+
+class Command(BaseCommand):
+    help = "Rellena name_key (nombre normalizado) en Pokémon, Tipos y Movimientos."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Filas por bulk_update.")
+        parser.add_argument("--all", action="store_true", help="Recalcula también las filas con clave.")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        for model in (Tipo, Movimiento, Pokemon):
+            updated, collisions = self._backfill(model, batch_size, options["all"])
+            label = model._meta.verbose_name_plural
+            self.stdout.write(self.style.SUCCESS(f"✅ {label}: {updated} claves actualizadas."))
+            for name in collisions:
+                self.stdout.write(self.style.WARNING(f"   ⚠️ '{name}' colisiona con otro nombre; sin clave."))
+
+    def _backfill(self, model, batch_size, recompute):
+        queryset = model.objects.order_by("pk").only("pk", "name", "name_key")
+        if not recompute:
+            queryset = queryset.filter(name_key__isnull=True)
+
+        updated = 0
+        collisions = []
+        last_pk = 0
+        while True:
+            rows = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+            if not rows:
+                return updated, collisions
+            last_pk = rows[-1].pk
+
+            keys = {row.pk: normalize_name(row.name) for row in rows}
+            taken = dict(
+                model.objects.filter(name_key__in=keys.values())
+                .exclude(pk__in=keys.keys())
+                .values_list("name_key", "pk")
+            )
+
+            changed = []
+            for row in rows:
+                key = keys[row.pk]
+                if taken.setdefault(key, row.pk) != row.pk:
+                    collisions.append(row.name)
+                elif row.name_key != key:
+                    row.name_key = key
+                    changed.append(row)
+
+            with transaction.atomic():
+                model.objects.bulk_update(changed, ["name_key"])
+            updated += len(changed)
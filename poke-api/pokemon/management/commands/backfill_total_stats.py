@@ -0,0 +1,60 @@
+"""
+backfill_total_stats
+--------------------
+Recalcula ``Pokemon.total_stats`` (HP + ataque + defensa) en las filas
+existentes.
+
+Uso:
+    python manage.py backfill_total_stats
+    python manage.py backfill_total_stats --batch-size 5000
+
+Las migraciones no se versionan en este repositorio: al añadir la columna a
+una base con datos, todas las filas quedan con 0 y la ordenación, los
+filtros ``total_stats_min``/``_max`` y el ranking por estadísticas son
+incorrectos hasta rellenarla. Ejecutarlo después de ``migrate``; también
+corrige filas escritas con ``QuerySet.update()`` o SQL directo. Es
+idempotente, avanza por lotes de PK y solo escribe las filas que cambian
+(actualizando ``updated_at`` para que los ``ETag`` no queden obsoletos).
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from pokemon.cache import catalog_cache
+from pokemon.models import Pokemon
+
+
+class Command(BaseCommand):
+    help = "Recalcula total_stats (HP + ataque + defensa) en los Pokémon existentes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Filas por lote.")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        total = Pokemon._meta.get_field("total_stats").expression()
+        pks = Pokemon.objects.order_by("pk").values_list("pk", flat=True)
+
+        updated = 0
+        last_pk = 0
+        while True:
+            batch = list(pks.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            stale = list(
+                Pokemon.objects.filter(pk__gt=last_pk, pk__lte=batch[-1])
+                .exclude(total_stats=total)
+                .values_list("pk", flat=True)
+            )
+            last_pk = batch[-1]
+            if not stale:
+                continue
+
+            with transaction.atomic():
+                Pokemon.objects.filter(pk__in=stale).update(total_stats=total, updated_at=timezone.now())
+            # update() no emite señales
+            catalog_cache.invalidate("pokemon", stale)
+            updated += len(stale)
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Pokémon: {updated} totales actualizados."))
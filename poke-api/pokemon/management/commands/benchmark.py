@@ -0,0 +1,138 @@
+"""
+benchmark
+---------
+Ejecuta una suite de ``pokemon/benchmarks`` sobre datos sintéticos.
+
+Uso:
+    python manage.py benchmark serializers
+    python manage.py benchmark serializers --sizes 10,1000,50000 --repeat 5
+    python manage.py benchmark lookups
+    python manage.py benchmark databases --sizes 1,8,32       # hilos por perfil de BD
+    python manage.py benchmark endpoints --sizes 100 --repeat 1
+    python manage.py benchmark auth --sizes 1,4               # hilos por perfil de hash
+    python manage.py benchmark tokens                         # JWT con y sin consulta del usuario
+    python manage.py benchmark serializers --output resultados.json
+    python manage.py benchmark serializers --compare resultados.json
+
+Los datos se generan dentro de una transacción que se revierte al terminar,
+así que la base queda intacta.
+
+``--output`` guarda los resultados junto con la suite, los tamaños y la
+fecha; ``--compare`` muestra, fila a fila, el cambio de cada métrica
+numérica respecto a un archivo guardado antes.
+"""
+
+import json
+from importlib import import_module
+
+from django.utils import timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from pokemon.benchmarks import SUITES
+
+
+def parse_sizes(value):
+    try:
+        sizes = [int(size) for size in value.split(",") if size.strip()]
+    except ValueError:
+        raise CommandError(f"Tamaños inválidos: '{value}' (formato esperado: 10,1000,50000).")
+    if not sizes or min(sizes) < 1:
+        raise CommandError(f"Tamaños inválidos: '{value}'.")
+    return sizes
+
+
+def load_results(path, suite):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError) as exc:
+        raise CommandError(f"No se pudo leer '{path}': {exc}")
+    # Los archivos anteriores guardaban solo la lista de filas
+    if isinstance(data, list):
+        return data
+    if data.get("suite") != suite:
+        raise CommandError(f"'{path}' contiene resultados de '{data.get('suite')}', no de '{suite}'.")
+    return data["results"]
+
+
+def compare(results, baseline, key_columns=None):
+    """
+    Una fila por (fila, métrica) con el valor anterior, el actual y el
+    cambio en %. Las filas se emparejan por ``key_columns`` (por defecto,
+    las columnas que no son ``float``); las métricas son las ``float``.
+    """
+    if not results:
+        return []
+    if key_columns is None:
+        key_columns = [column for column, value in results[0].items() if not isinstance(value, float)]
+    previous = {tuple(row.get(column) for column in key_columns): row for row in baseline}
+    rows = []
+    for row in results:
+        old = previous.get(tuple(row[column] for column in key_columns))
+        if old is None:
+            continue
+        for metric, value in row.items():
+            if metric in key_columns or not isinstance(value, (int, float)) or not isinstance(old.get(metric), (int, float)):
+                continue
+            before = old[metric]
+            rows.append({
+                **{column: row[column] for column in key_columns},
+                "metric": metric,
+                "before": float(before),
+                "after": float(value),
+                "change_%": (value - before) / before * 100 if before else 0.0,
+            })
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Ejecuta un benchmark sobre datos sintéticos (sin modificar la base)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("suite", choices=sorted(SUITES), help="Suite a ejecutar.")
+        parser.add_argument("--sizes", help="Filas por medición (por defecto, las de la suite).")
+        parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por medición.")
+        parser.add_argument("--output", help="Guarda los resultados en un archivo JSON.")
+        parser.add_argument("--compare", help="Compara con los resultados guardados en un archivo JSON.")
+
+    def handle(self, *args, **options):
+        suite = import_module(SUITES[options["suite"]])
+        baseline = load_results(options["compare"], options["suite"]) if options["compare"] else None
+        sizes = parse_sizes(options["sizes"]) if options["sizes"] else suite.DEFAULT_SIZES
+        repeat = max(1, options["repeat"])
+        with transaction.atomic():
+            results = suite.run(sizes=sizes, repeat=repeat)
+            transaction.set_rollback(True)
+
+        self._print_table(results)
+        if baseline is not None:
+            self.stdout.write("")
+            self._print_table(compare(results, baseline, getattr(suite, "KEY_COLUMNS", None)))
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as fh:
+                json.dump({
+                    "suite": options["suite"],
+                    "sizes": list(sizes),
+                    "repeat": repeat,
+                    "created_at": timezone.now().isoformat(),
+                    "results": results,
+                }, fh, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"✅ Resultados guardados en {options['output']}"))
+
+    def _print_table(self, results):
+        if not results:
+            return
+        columns = list(results[0])
+        rows = [[self._format(row[column]) for column in columns] for row in results]
+        widths = [max(len(column), *(len(row[i]) for row in rows)) for i, column in enumerate(columns)]
+        self.stdout.write("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+        for row in rows:
+            self.stdout.write("  ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+    @staticmethod
+    def _format(value):
+        if isinstance(value, float):
+            return f"{value:.2f}"
+        return str(value)
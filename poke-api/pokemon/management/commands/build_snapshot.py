@@ -0,0 +1,36 @@
+"""
+build_snapshot
+--------------
+Exporta el catálogo local (Tipos, Movimientos, Pokémon y matriz de
+efectividad) a una instantánea versionada para ``load_snapshot``.
+
+Uso:
+    python manage.py build_snapshot                       # catalog.snapshot.jsonl.gz
+    python manage.py build_snapshot --output /tmp/catalogo.jsonl.gz
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from pokemon.services import SNAPSHOT_VERSION, build_snapshot
+
+
+class Command(BaseCommand):
+    help = "Exporta el catálogo local a una instantánea comprimida y versionada."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default="catalog.snapshot.jsonl.gz",
+            help="Archivo de salida (JSON lines con gzip).",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        counts = build_snapshot(options["output"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Instantánea v{SNAPSHOT_VERSION} escrita en {options['output']} ({elapsed:.2f}s): "
+            + ", ".join(f"{count} {model}" for model, count in counts.items())
+        ))
@@ -0,0 +1,157 @@
+"""
+import_pokedex
+--------------
+Importación masiva de la Pokédex a la base local.
+
+Uso:
+    python manage.py import_pokedex --range 1-1025 --workers 16
+    python manage.py import_pokedex --source ./api-data/data/api/v2   # espejo local
+    python manage.py import_pokedex --restart                          # ignora el checkpoint
+
+ - Descarga con concurrencia acotada (``--workers``) usando el cliente
+   compartido de la PokeAPI, o lee un directorio espejo de archivos JSON
+   (``pokemon/<id>.json`` o ``pokemon/<id>/index.json``).
+ - Resuelve todos los ``Tipo`` de cada lote en una sola consulta y escribe
+   con ``bulk_create(update_conflicts=True)`` por lotes.
+ - Guarda un checkpoint tras cada lote para poder reanudar.
+ - Reporta filas/s y percentiles de latencia de la fuente.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pokemon.clients import PokeApiError, get_client
+from pokemon.models import Tipo
+from pokemon.services import bulk_import_pokemon, summarize
+
+
+def parse_range(value):
+    """``"1-1025"`` → ``range(1, 1026)``; ``"25"`` → ``range(25, 26)``."""
+    try:
+        start, _, end = value.partition("-")
+        start, end = int(start), int(end or start)
+    except ValueError:
+        raise CommandError(f"Rango inválido: '{value}' (formato esperado: 1-1025).")
+    if start < 1 or end < start:
+        raise CommandError(f"Rango inválido: '{value}'.")
+    return range(start, end + 1)
+
+
+class Checkpoint:
+    """IDs ya procesados (importados o inexistentes), persistidos en JSON."""
+
+    def __init__(self, path, restart=False):
+        self.path = Path(path)
+        self.done = set()
+        if self.path.exists() and not restart:
+            self.done = set(json.loads(self.path.read_text())["done"])
+
+    def save(self, ids):
+        self.done.update(ids)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"done": sorted(self.done)}))
+        tmp.replace(self.path)
+
+
+class Command(BaseCommand):
+    help = "Importa en bloque Pokémon desde la PokeAPI o desde un espejo local de JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--range", default="1-1025", help="IDs a importar, p. ej. 1-151.")
+        parser.add_argument("--workers", type=int, default=16, help="Descargas simultáneas.")
+        parser.add_argument("--batch-size", type=int, default=200, help="Filas por bulk_create.")
+        parser.add_argument("--source", help="Directorio espejo con los JSON de la PokeAPI.")
+        parser.add_argument(
+            "--checkpoint",
+            default=".import_pokedex.checkpoint.json",
+            help="Archivo de checkpoint para reanudar.",
+        )
+        parser.add_argument("--restart", action="store_true", help="Ignora el checkpoint existente.")
+
+    def handle(self, *args, **options):
+        checkpoint = Checkpoint(options["checkpoint"], restart=options["restart"])
+        pending = [i for i in parse_range(options["range"]) if i not in checkpoint.done]
+        if not pending:
+            self.stdout.write("Nada que importar: el rango ya está en el checkpoint.")
+            return
+
+        fetch = self._mirror_fetcher(options["source"]) if options["source"] else self._api_fetcher()
+        batch_size = max(1, options["batch_size"])
+        self.latencies = []
+        tipos = dict(Tipo.objects.values_list("name_key", "id"))
+        imported = missing = 0
+        started = time.perf_counter()
+
+        self.stdout.write(
+            f"Importando {len(pending)} Pokémon con {options['workers']} workers "
+            f"({len(checkpoint.done)} ya en el checkpoint)..."
+        )
+        with ThreadPoolExecutor(max_workers=max(1, options["workers"])) as pool:
+            for offset in range(0, len(pending), batch_size):
+                ids = pending[offset:offset + batch_size]
+                try:
+                    payloads = list(pool.map(fetch, ids))
+                except PokeApiError as exc:
+                    raise CommandError(
+                        f"Error al conectar con la PokeAPI: {exc}. "
+                        "Vuelve a ejecutar el comando para reanudar desde el checkpoint."
+                    ) from exc
+
+                found = [data for data in payloads if data is not None]
+                missing += len(payloads) - len(found)
+                imported += len(bulk_import_pokemon(found, update_existing=True, tipos=tipos))
+                checkpoint.save(ids)
+
+                elapsed = time.perf_counter() - started
+                self.stdout.write(f"  {imported} filas · {imported / elapsed:.1f} filas/s")
+
+        self._report(imported, missing, time.perf_counter() - started)
+
+    # --------------------------------------------------------
+    # 🔸 Fuentes
+    # --------------------------------------------------------
+    def _timed(self, fn, identifier):
+        started = time.perf_counter()
+        try:
+            return fn(identifier)
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+
+    def _api_fetcher(self):
+        client = get_client()
+        if not client.enabled:
+            raise CommandError(
+                "La PokeAPI está desactivada (POKEAPI_CLIENT['ENABLED']); usa --source con un espejo local."
+            )
+        return lambda pokemon_id: self._timed(client.pokemon, pokemon_id)
+
+    def _mirror_fetcher(self, source):
+        root = Path(source)
+        if not root.is_dir():
+            raise CommandError(f"El directorio espejo '{source}' no existe.")
+
+        def read(pokemon_id):
+            for path in (root / "pokemon" / f"{pokemon_id}.json", root / "pokemon" / str(pokemon_id) / "index.json"):
+                if path.exists():
+                    return json.loads(path.read_text(encoding="utf-8"))
+            return None
+
+        return lambda pokemon_id: self._timed(read, pokemon_id)
+
+    # --------------------------------------------------------
+    # 🔸 Reporte
+    # --------------------------------------------------------
+    def _report(self, imported, missing, elapsed):
+        latency = {key: value * 1000 for key, value in summarize(self.latencies).items()}
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {imported} Pokémon importados en {elapsed:.2f}s "
+            f"({imported / elapsed if elapsed else 0:.1f} filas/s); {missing} inexistentes."
+        ))
+        self.stdout.write(
+            "   Latencia de la fuente (ms): "
+            + ", ".join(f"{key}={value:.1f}" for key, value in latency.items())
+        )
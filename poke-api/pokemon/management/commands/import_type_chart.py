@@ -0,0 +1,109 @@
+"""
+import_type_chart
+-----------------
+Importa la tabla de efectividad de tipos a la base local.
+
+Uso:
+    python manage.py import_type_chart            # desde la PokeAPI (/type/)
+    python manage.py import_type_chart --builtin  # tabla oficial incluida, sin red
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from pokemon.battle.type_chart import EFFECTIVENESS, invalidate_type_chart
+from pokemon.cache import catalog_cache
+from pokemon.clients import PokeApiError, get_client
+from pokemon.models import Efectividad, Tipo, normalize_name
+from pokemon.services.name_index import name_index
+
+# damage_relations de la PokeAPI → multiplicador
+RELATIONS = {
+    "double_damage_to": 2.0,
+    "half_damage_to": 0.5,
+    "no_damage_to": 0.0,
+}
+
+# Los tipos especiales de la PokeAPI ("unknown", "shadow") usan IDs >= 10000
+SPECIAL_TYPE_ID = 10000
+
+
+class Command(BaseCommand):
+    help = "Importa en bloque la tabla de efectividad de tipos (atacante × defensor)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--builtin",
+            action="store_true",
+            help="Usa la tabla oficial incluida en pokemon/battle/type_chart.py en lugar de la PokeAPI.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Descargas simultáneas desde la PokeAPI (por defecto 8).",
+        )
+
+    def handle(self, *args, **options):
+        if options["builtin"]:
+            relations = {
+                attacker: dict(row) for attacker, row in EFFECTIVENESS.items()
+            }
+        else:
+            relations = self._fetch_relations(options["workers"])
+
+        names = set(relations)
+        for row in relations.values():
+            names.update(row)
+
+        with transaction.atomic():
+            Tipo.objects.bulk_create(
+                [Tipo(name=name) for name in sorted(names)],
+                ignore_conflicts=True,
+            )
+            ids = dict(
+                Tipo.objects.filter(name_key__in={normalize_name(name) for name in names})
+                .values_list("name_key", "id")
+            )
+
+            Efectividad.objects.all().delete()
+            created = Efectividad.objects.bulk_create(
+                Efectividad(
+                    atacante_id=ids[normalize_name(attacker)],
+                    defensor_id=ids[normalize_name(defender)],
+                    multiplicador=multiplier,
+                )
+                for attacker, row in relations.items()
+                for defender, multiplier in row.items()
+            )
+
+        # bulk_create no emite señales
+        invalidate_type_chart()
+        name_index.invalidate()
+        catalog_cache.invalidate("tipo")
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {len(created)} relaciones importadas para {len(names)} tipos."
+        ))
+
+    def _fetch_relations(self, workers):
+        client = get_client()
+        if not client.enabled:
+            raise CommandError("La PokeAPI está desactivada (POKEAPI_CLIENT['ENABLED']).")
+        try:
+            listing = client.list("type")
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                payloads = list(pool.map(lambda item: client.tipo(item["name"]), listing))
+        except PokeApiError as exc:
+            raise CommandError(f"No se pudo conectar con la PokeAPI: {exc}") from exc
+
+        relations = {}
+        for data in payloads:
+            if data is None or data["id"] >= SPECIAL_TYPE_ID:
+                continue
+            row = relations.setdefault(data["name"], {})
+            for relation, multiplier in RELATIONS.items():
+                for target in data["damage_relations"][relation]:
+                    row[target["name"]] = multiplier
+        return relations
@@ -0,0 +1,46 @@
+"""
+load_snapshot
+-------------
+Carga una instantánea de ``build_snapshot`` en una sola transacción.
+
+Uso (en el despliegue, después de ``migrate``):
+    python manage.py load_snapshot catalog.snapshot.jsonl.gz
+    python manage.py load_snapshot catalog.snapshot.jsonl.gz --check   # solo valida
+
+Inserta o actualiza por nombre y no borra filas existentes, así que se
+puede ejecutar en cada despliegue. Para servir solo desde la instantánea,
+sin ir nunca a la PokeAPI, arrancar con ``POKEAPI_REMOTE_FALLBACK=0``.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pokemon.services import SnapshotError, load_snapshot, read_snapshot
+
+
+class Command(BaseCommand):
+    help = "Carga en bloque una instantánea del catálogo (sin acceso a la PokeAPI)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Instantánea generada con build_snapshot.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Filas por bulk_create.")
+        parser.add_argument("--check", action="store_true", help="Valida el archivo sin escribir.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            if options["check"]:
+                header, _ = read_snapshot(options["path"])
+                counts = header["counts"]
+            else:
+                counts = load_snapshot(options["path"], batch_size=max(1, options["batch_size"]))
+        except SnapshotError as exc:
+            raise CommandError(str(exc)) from exc
+
+        elapsed = time.perf_counter() - started
+        action = "válida" if options["check"] else "cargada"
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Instantánea {action} en {elapsed:.2f}s: "
+            + ", ".join(f"{count} {model}" for model, count in counts.items())
+        ))
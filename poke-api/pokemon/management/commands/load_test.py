@@ -0,0 +1,179 @@
+"""
+load_test
+---------
+Compara WSGI (gunicorn, hilos) y ASGI (uvicorn, vistas asíncronas) con
+peticiones simultáneas que fallan la caché y deben ir a la PokeAPI.
+
+Uso:
+    python manage.py load_test                          # 200 peticiones, 0.5 s de latencia
+    python manage.py load_test --concurrency 500 --delay 1.0
+    python manage.py load_test --servers asgi --threads 32
+
+ - Levanta ``StubPokeApiServer`` con ``--delay`` segundos de latencia por
+   respuesta, así que el resultado no depende de la red.
+ - Cada servidor arranca en un subproceso contra una base SQLite temporal
+   recién migrada (``POKE_API_DB_NAME``) y sin caché en disco.
+ - Dispara ``--concurrency`` GET a Pokémon distintos a la vez (todos
+   ausentes) y reporta peticiones/s, errores y percentiles de latencia.
+
+Con ``gthread`` cada descarga ocupa un hilo: el rendimiento queda acotado
+por ``--threads × --workers``. Bajo ASGI las descargas esperan en el event
+loop y se solapan todas.
+
+Con SQLite, las escrituras simultáneas de los hilos de gunicorn pueden
+fallar con ``database is locked``: se cuentan como errores y no suman al
+rendimiento (peticiones correctas por segundo).
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from pokemon.services import summarize
+from pokemon.testing import StubPokeApiServer, pokemon_payload
+
+SERVERS = ("wsgi", "asgi")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = "Compara el rendimiento WSGI y ASGI con peticiones simultáneas que van a la PokeAPI."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=200, help="Peticiones simultáneas.")
+        parser.add_argument("--delay", type=float, default=0.5, help="Latencia simulada de la PokeAPI (s).")
+        parser.add_argument("--servers", default=",".join(SERVERS), help="Servidores a medir: wsgi,asgi.")
+        parser.add_argument("--workers", type=int, default=1, help="Procesos por servidor.")
+        parser.add_argument("--threads", type=int, default=8, help="Hilos por proceso de gunicorn.")
+        parser.add_argument("--timeout", type=float, default=120.0, help="Límite por petición (s).")
+
+    def handle(self, *args, **options):
+        servers = [name.strip() for name in options["servers"].split(",") if name.strip()]
+        unknown = set(servers) - set(SERVERS)
+        if unknown:
+            raise CommandError(f"Servidores desconocidos: {', '.join(sorted(unknown))}.")
+
+        concurrency = max(1, options["concurrency"])
+        routes = {f"pokemon/{i}": pokemon_payload(f"poke-{i}", i) for i in range(1, concurrency + 1)}
+
+        self.stdout.write(
+            f"{concurrency} peticiones simultáneas, PokeAPI stub con {options['delay']}s de latencia"
+        )
+        with StubPokeApiServer(routes, delay=options["delay"]) as stub:
+            for name in servers:
+                with tempfile.TemporaryDirectory() as tmp:
+                    env = self._env(stub, Path(tmp) / "db.sqlite3", asgi=name == "asgi")
+                    result = self._measure(name, env, concurrency, options)
+                self._report(name, result)
+
+    # --------------------------------------------------------
+    # 🔸 Servidores
+    # --------------------------------------------------------
+    def _env(self, stub, db_path, asgi):
+        return {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "poke_api.settings"),
+            "POKE_API_DB_NAME": str(db_path),
+            "POKEAPI_BASE_URL": stub.base_url,
+            "POKEAPI_CACHE_DIR": "",
+            "POKE_API_ASYNC_READS": "1" if asgi else "0",
+        }
+
+    def _command(self, name, port, options):
+        bind = f"127.0.0.1:{port}"
+        if name == "wsgi":
+            return [
+                sys.executable, "-m", "gunicorn", "poke_api.wsgi:application",
+                "--bind", bind, "--worker-class", "gthread",
+                "--workers", str(options["workers"]), "--threads", str(options["threads"]),
+                "--timeout", str(int(options["timeout"])),
+            ]
+        return [
+            sys.executable, "-m", "uvicorn", "poke_api.asgi:application",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(options["workers"]), "--no-access-log",
+        ]
+
+    def _measure(self, name, env, concurrency, options):
+        cwd = settings.BASE_DIR
+        subprocess.run(
+            [sys.executable, "manage.py", "migrate", "-v0"], cwd=cwd, env=env, check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+        port = free_port()
+        process = subprocess.Popen(
+            self._command(name, port, options), cwd=cwd, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            self._wait_ready(process, base_url)
+            return asyncio.run(self._fire(base_url, concurrency, options["timeout"]))
+        finally:
+            process.terminate()
+            process.wait(10)
+
+    def _wait_ready(self, process, base_url, timeout=30.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError(f"El servidor terminó al arrancar (código {process.returncode}).")
+            try:
+                httpx.get(f"{base_url}/api/health/", timeout=1.0)
+                return
+            except httpx.TransportError:
+                time.sleep(0.2)
+        raise CommandError(f"El servidor no respondió en {timeout:.0f}s.")
+
+    # --------------------------------------------------------
+    # 🔸 Carga
+    # --------------------------------------------------------
+    async def _fire(self, base_url, concurrency, timeout):
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+
+            async def one(pokemon_id):
+                started = time.perf_counter()
+                try:
+                    response = await client.get(f"/api/pokemon/pokemons/{pokemon_id}/")
+                    ok = response.status_code in (200, 201)
+                except httpx.HTTPError:
+                    ok = False
+                return ok, time.perf_counter() - started
+
+            started = time.perf_counter()
+            results = await asyncio.gather(*(one(i) for i in range(1, concurrency + 1)))
+            elapsed = time.perf_counter() - started
+
+        return {
+            "elapsed": elapsed,
+            "ok": sum(1 for ok, _ in results if ok),
+            "errors": sum(1 for ok, _ in results if not ok),
+            "latency": summarize([latency for _, latency in results]),
+        }
+
+    # --------------------------------------------------------
+    # 🔸 Reporte
+    # --------------------------------------------------------
+    def _report(self, name, result):
+        latency = ", ".join(f"{key}={value * 1000:.0f}" for key, value in result["latency"].items())
+        self.stdout.write(self.style.SUCCESS(
+            f"{name.upper()}: {result['ok'] / result['elapsed']:.1f} req/s en {result['elapsed']:.2f}s · "
+            f"{result['ok']} OK, {result['errors']} errores"
+        ))
+        self.stdout.write(f"   Latencia (ms): {latency}")
@@ -0,0 +1,30 @@
+"""
+rebuild_rankings
+----------------
+Reconstruye la tabla materializada ``RankingBatalla`` a partir del
+registro de batallas (``Batalla``).
+
+Uso:
+    python manage.py rebuild_rankings
+    python manage.py rebuild_rankings --batch-size 5000
+
+La tabla se mantiene sola con cada batalla registrada; el comando sirve
+para poblarla en bases con batallas anteriores a la tabla o para
+corregirla tras escrituras que no pasan por el ORM (SQL directo,
+restauraciones de copias de seguridad...).
+"""
+
+from django.core.management.base import BaseCommand
+
+from pokemon.services import rebuild_battle_rankings
+
+
+class Command(BaseCommand):
+    help = "Reconstruye el ranking de batallas desde el registro de batallas."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Filas por lote.")
+
+    def handle(self, *args, **options):
+        rows = rebuild_battle_rankings(batch_size=max(1, options["batch_size"]))
+        self.stdout.write(self.style.SUCCESS(f"✅ Ranking de batallas reconstruido: {rows} Pokémon."))
@@ -1,9 +1,24 @@
 from .pokemon import Pokemon
 from .tipo import Tipo
 from .movimiento import Movimiento
+from .efectividad import Efectividad
+from .captura import Captura, MAX_CAPTURAS
+from .batalla import Batalla, RankingBatalla
+from .bloqueo import Bloqueo
+from .fields import NameKeyField, StatTotalField, is_numeric_id, normalize_name
 
 __all__ = [
     "Pokemon",
     "Tipo",
     "Movimiento",
+    "Efectividad",
+    "Captura",
+    "MAX_CAPTURAS",
+    "Batalla",
+    "RankingBatalla",
+    "Bloqueo",
+    "NameKeyField",
+    "StatTotalField",
+    "is_numeric_id",
+    "normalize_name",
 ]
@@ -0,0 +1,81 @@
+from django.db import models
+
+from pokemon.models.pokemon import Pokemon
+from pokemon.models.tipo import Tipo
+
+
+class Batalla(models.Model):
+    """
+    Resultado de una batalla simulada (``POST /api/pokemon/battles/simulate/``
+    con ``record: true``). ``ganador`` vacío es un empate.
+
+    Es el registro de origen de ``RankingBatalla``: ``rebuild_rankings``
+    reconstruye esa tabla a partir de aquí.
+    """
+
+    atacante = models.ForeignKey(
+        Pokemon,
+        on_delete=models.CASCADE,
+        related_name="batallas_ataque",
+    )
+    defensor = models.ForeignKey(
+        Pokemon,
+        on_delete=models.CASCADE,
+        related_name="batallas_defensa",
+    )
+    ganador = models.ForeignKey(
+        Pokemon,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    turnos = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.atacante.name} vs {self.defensor.name}"
+
+    class Meta:
+        db_table = 'batallas'
+        ordering = ["created_at", "id"]
+
+
+class RankingBatalla(models.Model):
+    """
+    Balance de batallas de un Pokémon, materializado para los rankings.
+
+    Cada batalla registrada suma con un ``UPDATE ... SET batallas =
+    batallas + 1`` (ver ``pokemon.services.rankings``) y recalcula
+    ``win_rate`` en la misma sentencia; ``tipo`` es una copia de
+    ``Pokemon.tipo`` que se sincroniza al guardar el Pokémon. Así el top por
+    tasa de victorias, global o por tipo, recorre un índice sin joins ni
+    ordenación. Solo tienen fila los Pokémon con alguna batalla.
+    """
+
+    pokemon = models.OneToOneField(
+        Pokemon,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="ranking_batalla",
+    )
+    tipo = models.ForeignKey(
+        Tipo,
+        on_delete=models.CASCADE,
+        related_name="+",
+        # Cubierto por el índice (tipo, win_rate, ...)
+        db_index=False,
+    )
+    batallas = models.PositiveIntegerField(default=0)
+    victorias = models.PositiveIntegerField(default=0)
+    win_rate = models.FloatField(default=0)
+
+    def __str__(self):
+        return f"{self.pokemon_id}: {self.victorias}/{self.batallas}"
+
+    class Meta:
+        db_table = 'ranking_batallas'
+        indexes = [
+            models.Index(fields=["win_rate", "batallas", "pokemon"], name="ranking_win_rate_idx"),
+            models.Index(fields=["tipo", "win_rate", "batallas", "pokemon"], name="ranking_tipo_win_rate_idx"),
+        ]
@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class Bloqueo(models.Model):
+    """
+    Lock entre procesos por clave para bases sin locks de sesión (SQLite):
+    lo usa ``pokemon.services.advisory_lock``.
+
+    La fila existe mientras un proceso tiene el lock; la clave primaria
+    impide que otro la inserte. ``expires_at`` permite recuperar los locks
+    que dejó un proceso caído sin liberarlos.
+    """
+
+    key = models.CharField(max_length=191, primary_key=True)
+    token = models.CharField(max_length=32)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return self.key
+
+    class Meta:
+        db_table = 'bloqueos'
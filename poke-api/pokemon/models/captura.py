@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.db import models
+
+from pokemon.models.pokemon import Pokemon
+
+MAX_CAPTURAS = 10
+
+
+class Captura(models.Model):
+    """
+    Pokémon capturado por un usuario.
+
+    El número de capturas de cada usuario se guarda desnormalizado en
+    ``User.capturas_count``; ``pokemon.services.capturar`` lo incrementa con
+    un ``UPDATE`` condicional para no superar ``MAX_CAPTURAS``.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="capturas",
+    )
+    pokemon = models.ForeignKey(
+        Pokemon,
+        on_delete=models.CASCADE,
+        related_name="capturas",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.user} → {self.pokemon.name}"
+
+    class Meta:
+        db_table = 'capturas'
+        ordering = ["created_at", "id"]
+        constraints = [
+            # También sirve de índice (user, pokemon) para el listado por usuario
+            models.UniqueConstraint(
+                fields=["user", "pokemon"],
+                name="captura_unica_por_usuario",
+            ),
+        ]
@@ -0,0 +1,36 @@
+from django.db import models
+
+from pokemon.models.tipo import Tipo
+
+
+class Efectividad(models.Model):
+    """
+    Multiplicador de daño de un tipo atacante sobre un tipo defensor.
+
+    Solo se guardan las relaciones distintas de ×1 (``damage_relations``
+    de la PokeAPI); cualquier par ausente vale ×1.
+    """
+
+    atacante = models.ForeignKey(
+        Tipo,
+        on_delete=models.CASCADE,
+        related_name="efectividades_ataque",
+    )
+    defensor = models.ForeignKey(
+        Tipo,
+        on_delete=models.CASCADE,
+        related_name="efectividades_defensa",
+    )
+    multiplicador = models.FloatField()
+
+    def __str__(self):
+        return f"{self.atacante} → {self.defensor}: ×{self.multiplicador}"
+
+    class Meta:
+        db_table = 'efectividades'
+        constraints = [
+            models.UniqueConstraint(
+                fields=["atacante", "defensor"],
+                name="efectividad_unica_por_par",
+            ),
+        ]
@@ -0,0 +1,78 @@
+from django.db import models
+from django.db.models import F
+
+
+def normalize_name(name):
+    """Forma canónica de un nombre para búsquedas (``" Mr-Mime "`` → ``"mr-mime"``)."""
+    return str(name).strip().lower()
+
+
+def is_numeric_id(value):
+    """
+    ``True`` si ``value`` (ya sin espacios) es un ID: solo dígitos ASCII.
+    ``str.isdigit()`` también acepta ``"²"`` o ``"٣"``, que ``int()`` rechaza.
+    """
+    value = str(value)
+    return value.isascii() and value.isdigit()
+
+
+class NameKeyField(models.CharField):
+    """
+    Copia normalizada (``normalize_name``) de otro campo, calculada al guardar.
+
+    Se rellena en ``pre_save``, que Django también ejecuta en
+    ``bulk_create``; ``QuerySet.update(name=...)`` no la actualiza. Admite
+    ``NULL`` para poder añadir la columna a tablas existentes y rellenarla
+    después con ``manage.py backfill_name_keys``.
+    """
+
+    def __init__(self, *args, source="name", **kwargs):
+        self.source = source
+        kwargs.setdefault("max_length", 100)
+        kwargs.setdefault("unique", True)
+        kwargs.setdefault("null", True)
+        kwargs.setdefault("editable", False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.source != "name":
+            kwargs["source"] = self.source
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = normalize_name(getattr(model_instance, self.source))
+        setattr(model_instance, self.attname, value)
+        return value
+
+
+class StatTotalField(models.PositiveIntegerField):
+    """
+    Suma de otros campos enteros (``sources``), calculada al guardar.
+
+    Igual que ``NameKeyField``, se rellena en ``pre_save`` (también en
+    ``bulk_create``); ``QuerySet.update()`` y ``bulk_update`` no la
+    recalculan. Guardarla permite filtrar y ordenar por el total con un
+    índice en lugar de calcularlo fila a fila. Al añadir la columna a una
+    tabla con datos queda a 0: ``manage.py backfill_total_stats`` la rellena.
+    """
+
+    def __init__(self, *args, sources=(), **kwargs):
+        self.sources = tuple(sources)
+        kwargs.setdefault("default", 0)
+        kwargs.setdefault("editable", False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["sources"] = list(self.sources)
+        return name, path, args, kwargs
+
+    def expression(self):
+        """El total como expresión SQL (para ``QuerySet.update()``)."""
+        return sum((F(source) for source in self.sources[1:]), F(self.sources[0]))
+
+    def pre_save(self, model_instance, add):
+        value = sum(getattr(model_instance, source) or 0 for source in self.sources)
+        setattr(model_instance, self.attname, value)
+        return value
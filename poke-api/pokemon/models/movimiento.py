@@ -1,10 +1,12 @@
 from django.db import models
 
+from pokemon.models.fields import NameKeyField
 from pokemon.models.tipo import Tipo
 
 
 class Movimiento(models.Model):
     name = models.CharField(max_length=50, unique=True)
+    name_key = NameKeyField(max_length=50)
     power = models.IntegerField(null=True, blank=True)
     pp = models.IntegerField()
     accuracy = models.IntegerField(null=True, blank=True)
@@ -13,5 +15,10 @@ class Movimiento(models.Model):
     def __str__(self):
         return self.name
 
+    @property
+    def type(self):
+        """Alias del nombre del tipo, como ``Pokemon.type``."""
+        return self.tipo.name if self.tipo else None
+
     class Meta:
         db_table = 'movimientos'
\ No newline at end of file
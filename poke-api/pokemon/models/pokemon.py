@@ -1,9 +1,15 @@
 # pokemon/models/pokemon.py
 
 from django.db import models
+from pokemon.models.fields import NameKeyField, StatTotalField
+from pokemon.models.movimiento import Movimiento
 from pokemon.models.tipo import Tipo
 
 
+# Campo → sufijo del nombre de sus índices
+STAT_INDEXES = (("hp", "hp"), ("attack", "attack"), ("defense", "defense"), ("total_stats", "total"))
+
+
 class Pokemon(models.Model):
     """
     Modelo principal que representa a un Pokémon dentro del sistema.
@@ -17,6 +23,11 @@ class Pokemon(models.Model):
         help_text="Nombre único del Pokémon dentro del sistema."
     )
 
+    name_key = NameKeyField(
+        verbose_name="Clave de búsqueda",
+        help_text="Nombre en minúsculas y sin espacios extremos (búsquedas por nombre)."
+    )
+
     hp = models.PositiveIntegerField(
         verbose_name="Puntos de salud (HP)",
         help_text="Cantidad de vida base del Pokémon."
@@ -32,6 +43,12 @@ class Pokemon(models.Model):
         help_text="Resistencia del Pokémon ante ataques."
     )
 
+    total_stats = StatTotalField(
+        sources=("hp", "attack", "defense"),
+        verbose_name="Estadísticas totales",
+        help_text="HP + ataque + defensa, calculado al guardar."
+    )
+
     image = models.URLField(
         max_length=300,
         verbose_name="Imagen del Pokémon",
@@ -42,10 +59,43 @@ class Pokemon(models.Model):
         Tipo,
         on_delete=models.CASCADE,
         related_name="pokemons",
+        # Los índices compuestos (tipo, ...) de Meta cubren las búsquedas por tipo
+        db_index=False,
         verbose_name="Tipo principal",
         help_text="Tipo elemental al que pertenece este Pokémon (fuego, agua, etc.)."
     )
 
+    movimientos = models.ManyToManyField(
+        Movimiento,
+        related_name="pokemons",
+        blank=True,
+        verbose_name="Movimientos",
+        help_text="Movimientos que puede aprender (lista ``moves`` de la PokeAPI)."
+    )
+
+    # 🔹 Resumen desnormalizado de los movimientos (ver services/movesets.py)
+    move_count = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Número de movimientos",
+        help_text="Cantidad de movimientos asociados; se recalcula al cambiarlos."
+    )
+
+    max_move_power = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Potencia máxima",
+        help_text="Mayor potencia entre sus movimientos (vacío si ninguno hace daño directo)."
+    )
+
+    move_types = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Cobertura de tipos",
+        help_text="Máscara de bits (``TYPE_BITS``) con los tipos de sus movimientos."
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name="Fecha de creación"
@@ -60,6 +110,21 @@ class Pokemon(models.Model):
         verbose_name = "Pokémon"
         verbose_name_plural = "Pokémon"
         ordering = ["id"]
+        # Filtros por tipo + rango de estadística y orden por estadística
+        # (ver ``pokemon/filters.py``). El ``id`` final da el desempate del
+        # orden sin ordenar en memoria.
+        indexes = [
+            *(
+                models.Index(fields=["tipo", field, "id"], name=f"pokemon_tipo_{name}_idx")
+                for field, name in STAT_INDEXES
+            ),
+            *(
+                models.Index(fields=[field, "id"], name=f"pokemon_{name}_idx")
+                for field, name in STAT_INDEXES
+            ),
+            # Última modificación del catálogo para el ETag de los listados
+            models.Index(fields=["updated_at"], name="pokemon_updated_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name.title()} ({self.tipo.name.title()})"
@@ -79,6 +144,7 @@ class Pokemon(models.Model):
         Retorna un diccionario con las estadísticas completas del Pokémon.
         Ideal para APIs o serializaciones personalizadas.
         """
+        # Calculado aquí: ``total_stats`` solo se actualiza al guardar
         total = self.hp + self.attack + self.defense
         return {
             "hp": self.hp,
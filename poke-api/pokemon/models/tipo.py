@@ -1,7 +1,11 @@
 from django.db import models
 
+from pokemon.models.fields import NameKeyField
+
+
 class Tipo(models.Model):
     name = models.CharField(max_length=50, unique=True)
+    name_key = NameKeyField(max_length=50)
 
     def __str__(self):
         return self.name
@@ -0,0 +1,73 @@
+"""
+pagination.py
+-------------
+Paginación de los listados del módulo Pokémon.
+
+Por defecto se pagina por número de página (``?page=2&page_size=100``).
+Con ``?pagination=cursor`` se activa el modo keyset: las páginas se piden
+con ``WHERE id > <último id>`` sobre la clave primaria, sin ``OFFSET`` ni
+``COUNT(*)``, así que la página 1000 cuesta lo mismo que la primera. Los
+enlaces ``next``/``previous`` conservan el modo.
+
+Si el viewset ya contó las filas filtradas (``view.list_count``, ver
+``ConditionalReadMixin``), la paginación por número reutiliza ese total
+en lugar de repetir el ``COUNT(*)``.
+"""
+
+from functools import partial
+
+from django.core.paginator import Paginator
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+MAX_PAGE_SIZE = 500
+
+
+class KeysetPagination(CursorPagination):
+    """Paginación por cursor ordenada por ``id``."""
+
+    ordering = "id"
+    page_size_query_param = "page_size"
+    max_page_size = MAX_PAGE_SIZE
+
+
+class CountedPaginator(Paginator):
+    """``Paginator`` con el total ya conocido."""
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        # ``count`` es un cached_property: se fija sin consultar
+        self.__dict__["count"] = count
+
+
+class CatalogPagination(PageNumberPagination):
+    """
+    Paginación por número de página con modo keyset opcional.
+
+    Usa ``KeysetPagination`` cuando la petición trae ``?pagination=cursor``
+    o un ``?cursor=`` de una respuesta anterior.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = MAX_PAGE_SIZE
+
+    def __init__(self):
+        self._keyset = None
+
+    @staticmethod
+    def wants_keyset(request):
+        params = request.query_params
+        return params.get("pagination") == "cursor" or KeysetPagination.cursor_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.wants_keyset(request):
+            self._keyset = KeysetPagination()
+            return self._keyset.paginate_queryset(queryset, request, view)
+        count = getattr(view, "list_count", None)
+        if count is not None:
+            self.django_paginator_class = partial(CountedPaginator, count=count)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self._keyset is not None:
+            return self._keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
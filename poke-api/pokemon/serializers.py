@@ -6,7 +6,66 @@ como campos de texto plano para el tipo.
 """
 
 from rest_framework import serializers
-from pokemon.models import Pokemon, Tipo, Movimiento
+from pokemon.battle.type_chart import mask_types
+from pokemon.models import Pokemon, Tipo, Movimiento, normalize_name
+
+
+# ✂️ Campos dispersos (?fields=id,name,image)
+class SparseFieldsetMixin:
+    """
+    Permite al cliente pedir solo algunos campos en las lecturas:
+    ``GET /api/pokemon/pokemons/?fields=id,name,image``.
+
+    Solo aplica al serializador raíz (o a cada elemento de un listado) y a
+    peticiones GET; los nombres desconocidos se ignoran.
+    """
+
+    fields_query_param = "fields"
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+
+        wanted = requested_fields(self.context.get("request"), self.fields_query_param)
+        if not wanted:
+            return fields
+        return {name: field for name, field in fields.items() if name in wanted} or fields
+
+
+# 🔑 Nombres únicos sin distinguir mayúsculas
+class UniqueNameKeyMixin:
+    """
+    Valida que ``name`` no choque con otra fila por ``name_key``.
+
+    La restricción única está en la columna normalizada: ``"FIRE"`` y
+    ``"fire"`` son el mismo tipo. El ``UniqueValidator`` que
+    ``ModelSerializer`` añade a ``name`` solo compara el texto exacto, así
+    que sin esta comprobación el choque llegaría a la base (500) en lugar
+    de responder 400.
+    """
+
+    def validate_name(self, value):
+        model = self.Meta.model
+        queryset = model.objects.filter(name_key=normalize_name(value))
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        if queryset.exists():
+            raise serializers.ValidationError(f"Ya existe un {model._meta.verbose_name} con ese nombre.")
+        return value
+
+
+def requested_fields(request, param="fields"):
+    """Conjunto de campos pedidos con ``?fields=`` en un GET (``None`` si no aplica)."""
+    if request is None or request.method != "GET":
+        return None
+    requested = request.query_params.get(param)
+    if not requested:
+        return None
+    return {name.strip() for name in requested.split(",")}
 
 
 # 🌿 TipoSerializer
@@ -72,3 +131,132 @@ class PokemonSerializer(serializers.ModelSerializer):
         data["attack_label"] = f"{instance.attack} ATK"
         data["defense_label"] = f"{instance.defense} DEF"
         return data
+
+
+# ============================================================
+# 🚀 SERIALIZADORES RÁPIDOS DE SOLO LECTURA
+# ============================================================
+class ValuesSerializer:
+    """
+    Serializador de solo lectura sobre filas de ``QuerySet.values()``.
+
+    Evita la introspección de campos de DRF y la construcción de instancias
+    del modelo: cada fila se convierte en un ``dict`` con la misma forma JSON
+    que el ``ModelSerializer`` equivalente. Solo para GET; las escrituras
+    siguen usando los ``ModelSerializer``.
+    """
+
+    columns = ()
+    fields = ()
+
+    def __init__(self, rows, many=False, context=None):
+        self.rows = rows
+        self.many = many
+        self.context = context or {}
+
+    @classmethod
+    def values(cls, queryset):
+        """``QuerySet`` de filas con exactamente las columnas necesarias."""
+        return queryset.values(*cls.columns)
+
+    def to_representation(self, row):
+        """Convierte una fila de ``values(*columns)`` en el ``dict`` de respuesta."""
+        raise NotImplementedError(
+            f"{type(self).__name__} debe implementar `to_representation(row)`, que recibe "
+            f"una fila de `values(*columns)` y devuelve un dict con las claves de `fields`."
+        )
+
+    def _kept_fields(self):
+        wanted = requested_fields(self.context.get("request"))
+        return [name for name in self.fields if name in wanted] if wanted else None
+
+    def trim(self, item):
+        """Aplica ``?fields=`` a una representación ya construida."""
+        keep = self._kept_fields()
+        # Los campos solo de detalle (p. ej. ``movimientos``) faltan en los listados
+        return {name: item[name] for name in keep if name in item} if keep else item
+
+    @property
+    def data(self):
+        keep = self._kept_fields()
+
+        def represent(row):
+            item = self.to_representation(row)
+            return {name: item[name] for name in keep if name in item} if keep else item
+
+        if self.many:
+            return [represent(row) for row in self.rows]
+        return represent(self.rows)
+
+
+def _tipo(row):
+    tipo_id = row["tipo_id"]
+    return {"id": tipo_id, "name": row["tipo__name"]} if tipo_id is not None else None
+
+
+class FastTipoSerializer(ValuesSerializer):
+    columns = ("id", "name")
+    fields = ("id", "name")
+
+    def to_representation(self, row):
+        return {"id": row["id"], "name": row["name"]}
+
+
+class FastMovimientoSerializer(ValuesSerializer):
+    columns = ("id", "name", "power", "pp", "accuracy", "tipo_id", "tipo__name")
+    fields = ("id", "name", "power", "pp", "accuracy", "tipo")
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "power": row["power"],
+            "pp": row["pp"],
+            "accuracy": row["accuracy"],
+            "tipo": _tipo(row),
+        }
+
+
+class FastPokemonSerializer(ValuesSerializer):
+    """
+    Listados y detalle de Pokémon. El listado solo lleva el resumen de
+    movimientos (columnas propias, sin joins); el detalle añade la lista
+    ``movimientos`` con ``with_movimientos``.
+    """
+
+    columns = (
+        "id", "name", "hp", "attack", "defense", "total_stats", "image", "tipo_id", "tipo__name",
+        "move_count", "max_move_power", "move_types",
+    )
+    fields = (
+        "id", "name", "hp", "attack", "defense", "total_stats", "image", "tipo",
+        "move_count", "max_move_power", "move_types", "movimientos",
+    )
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "hp": row["hp"],
+            "attack": row["attack"],
+            "defense": row["defense"],
+            "total_stats": row["total_stats"],
+            "image": row["image"],
+            "tipo": _tipo(row),
+            "move_count": row["move_count"],
+            "max_move_power": row["max_move_power"],
+            "move_types": mask_types(row["move_types"]),
+        }
+
+    @staticmethod
+    def movimientos(pokemon_id):
+        """Filas de los movimientos de un Pokémon con su tipo, en una sola consulta."""
+        return FastMovimientoSerializer.values(
+            Movimiento.objects.filter(pokemons=pokemon_id).order_by("name")
+        )
+
+    @staticmethod
+    def with_movimientos(item, rows):
+        """Añade a ``item`` los movimientos de ``movimientos()`` ya leídos."""
+        item["movimientos"] = [FastMovimientoSerializer(row).to_representation(row) for row in rows]
+        return item
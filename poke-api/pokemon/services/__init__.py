@@ -0,0 +1,101 @@
+from .capturas import (
+    CapturaDuplicadaError,
+    CapturaError,
+    LimiteCapturasError,
+    capturar,
+    liberar_contador,
+)
+from .importer import (
+    afetch_pokemon,
+    aimport_movesets,
+    aimport_movimiento,
+    aimport_tipo,
+    bulk_import_pokemon,
+    catalog_lookup,
+    fetch_movimiento_payloads,
+    fetch_pokemon,
+    fetch_pokemon_payloads,
+    find_local_pokemon,
+    get_or_create_tipo,
+    import_movesets,
+    import_movimiento,
+    import_pokemon,
+    import_tipo,
+    move_names,
+    movimiento_fields,
+    pokemon_fields,
+    pokemon_lookup,
+    resolve_tipos,
+    save_movesets,
+)
+from .movesets import link_movimientos, move_summaries, refresh_move_summaries
+from .name_index import NameSearchIndex, name_index, search_names, suggest_names, warm_name_index
+from .random_index import RandomPokemonIndex, random_index
+from .rankings import (
+    RANKINGS,
+    rebuild_battle_rankings,
+    record_battle,
+    sync_ranking_tipos,
+    top_pokemon,
+    unrecord_battle,
+)
+from .singleflight import AsyncSingleFlight, LockTimeout, SingleFlight, advisory_lock, normalize_key
+from .snapshot import SNAPSHOT_VERSION, SnapshotError, build_snapshot, load_snapshot, read_snapshot
+from .stats import percentile, summarize
+
+__all__ = [
+    "CapturaError",
+    "CapturaDuplicadaError",
+    "LimiteCapturasError",
+    "capturar",
+    "liberar_contador",
+    "afetch_pokemon",
+    "aimport_movesets",
+    "aimport_movimiento",
+    "aimport_tipo",
+    "bulk_import_pokemon",
+    "catalog_lookup",
+    "fetch_movimiento_payloads",
+    "fetch_pokemon",
+    "fetch_pokemon_payloads",
+    "find_local_pokemon",
+    "get_or_create_tipo",
+    "import_movesets",
+    "import_pokemon",
+    "import_tipo",
+    "import_movimiento",
+    "move_names",
+    "movimiento_fields",
+    "pokemon_fields",
+    "pokemon_lookup",
+    "resolve_tipos",
+    "save_movesets",
+    "link_movimientos",
+    "move_summaries",
+    "refresh_move_summaries",
+    "NameSearchIndex",
+    "name_index",
+    "search_names",
+    "suggest_names",
+    "warm_name_index",
+    "RandomPokemonIndex",
+    "random_index",
+    "RANKINGS",
+    "rebuild_battle_rankings",
+    "record_battle",
+    "sync_ranking_tipos",
+    "top_pokemon",
+    "unrecord_battle",
+    "AsyncSingleFlight",
+    "LockTimeout",
+    "SingleFlight",
+    "advisory_lock",
+    "normalize_key",
+    "SNAPSHOT_VERSION",
+    "SnapshotError",
+    "build_snapshot",
+    "load_snapshot",
+    "read_snapshot",
+    "percentile",
+    "summarize",
+]
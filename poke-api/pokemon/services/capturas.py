@@ -0,0 +1,64 @@
+"""
+capturas.py
+-----------
+Captura de Pokémon por usuario con límite de capacidad.
+
+El límite se aplica sobre ``User.capturas_count`` con un único ``UPDATE``
+condicional::
+
+    UPDATE users SET capturas_count = capturas_count + 1
+    WHERE id = %s AND capturas_count < 10
+
+Si no actualiza ninguna fila, el usuario está lleno. La base serializa los
+``UPDATE`` concurrentes sobre la misma fila, así que dos capturas
+simultáneas nunca superan el límite. La fila ``Captura`` se inserta en la
+misma transacción: si falla (duplicada), el incremento se revierte.
+
+El decremento al liberar (o al borrar en cascada un Pokémon o un usuario) lo
+hace el receptor ``post_delete`` de ``Captura`` (ver ``pokemon/signals.py``).
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from pokemon.models import MAX_CAPTURAS, Captura
+
+
+class CapturaError(Exception):
+    """La captura no se pudo registrar."""
+
+
+class LimiteCapturasError(CapturaError):
+    """El usuario ya tiene ``MAX_CAPTURAS`` Pokémon."""
+
+
+class CapturaDuplicadaError(CapturaError):
+    """El usuario ya había capturado ese Pokémon."""
+
+
+def capturar(user, pokemon, limit=MAX_CAPTURAS):
+    """Registra la captura y devuelve ``(captura, capturas_del_usuario)``."""
+    User = get_user_model()
+    with transaction.atomic():
+        reserved = User.objects.filter(pk=user.pk, capturas_count__lt=limit).update(
+            capturas_count=F("capturas_count") + 1
+        )
+        if not reserved:
+            raise LimiteCapturasError(f"Ya tienes el máximo de {limit} Pokémon capturados.")
+
+        try:
+            with transaction.atomic():
+                captura = Captura.objects.create(user=user, pokemon=pokemon)
+        except IntegrityError:
+            raise CapturaDuplicadaError(f"Ya capturaste a {pokemon.name.title()}.")
+
+        count = User.objects.values_list("capturas_count", flat=True).get(pk=user.pk)
+    return captura, count
+
+
+def liberar_contador(user_id):
+    """Descuenta una captura del usuario (sin bajar de cero)."""
+    get_user_model().objects.filter(pk=user_id, capturas_count__gt=0).update(
+        capturas_count=F("capturas_count") - 1
+    )
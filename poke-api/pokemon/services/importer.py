@@ -0,0 +1,427 @@
+"""
+importer.py
+-----------
+Conversión de respuestas de la PokeAPI v2 a modelos locales.
+
+Centraliza la lógica que antes estaba copiada en cada viewset
+(``retrieve`` de Pokémon, Tipo y Movimiento y ``random_pokemon``).
+
+``fetch_pokemon`` es el punto de entrada para importar bajo demanda: pasa
+por ``SingleFlight`` + ``advisory_lock`` para que N peticiones simultáneas
+del mismo Pokémon produzcan una sola descarga y una sola inserción.
+``bulk_import_pokemon`` inserta muchos a la vez (``import_pokedex``,
+``pokemons/batch/``). Las variantes ``a*`` son para las vistas asíncronas:
+cliente httpx y ORM asíncrono, sin ocupar un hilo durante la descarga.
+
+Toda importación de Pokémon asocia también sus movimientos (lista
+``moves`` de la respuesta): los que no existen localmente se descargan en
+paralelo y se insertan en bloque junto con la tabla intermedia (ver
+``save_movesets``). Las descargas nunca ocurren dentro de una transacción:
+en SQLite retendrían el lock de escritura de toda la base.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+
+from pokemon.battle.type_chart import invalidate_type_chart
+from pokemon.cache import catalog_cache
+from pokemon.clients import PokeApiError, get_async_client, get_client
+from pokemon.models import Movimiento, Pokemon, Tipo, is_numeric_id, normalize_name
+from pokemon.services.movesets import SUMMARY_FIELDS, link_movimientos
+from pokemon.services.name_index import name_index
+from pokemon.services.random_index import random_index
+from pokemon.services.rankings import sync_ranking_tipos
+from pokemon.services.singleflight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    advisory_lock,
+    normalize_key,
+)
+
+BULK_UPDATE_FIELDS = ["hp", "attack", "defense", "total_stats", "image", "tipo", "updated_at"]
+
+pokemon_flight = SingleFlight()
+async_pokemon_flight = AsyncSingleFlight()
+
+
+def get_or_create_tipo(name):
+    """
+    ``Tipo`` con ese nombre (sin distinguir mayúsculas), creándolo si falta.
+    Si otra petición lo inserta a la vez, ``get_or_create`` recibe el
+    ``IntegrityError`` y devuelve esa fila.
+    """
+    tipo, _ = Tipo.objects.get_or_create(name_key=normalize_name(name), defaults={"name": name})
+    return tipo
+
+
+def import_tipo(data):
+    """Crea (u obtiene) un ``Tipo`` a partir de ``/type/<id>/``."""
+    return get_or_create_tipo(data["name"])
+
+
+def resolve_tipos(names, tipos):
+    """
+    Completa ``tipos`` (``name_key`` → id) con ``names`` en una consulta,
+    creando en bloque los que falten. Si crea alguno invalida la matriz de
+    efectividad y la caché de tipos (``bulk_create`` no emite señales).
+    """
+    names = {normalize_name(name): name for name in names}
+    missing = names.keys() - tipos.keys()
+    if missing:
+        tipos.update(Tipo.objects.filter(name_key__in=missing).values_list("name_key", "id"))
+        missing -= tipos.keys()
+    if missing:
+        Tipo.objects.bulk_create([Tipo(name=names[key]) for key in sorted(missing)], ignore_conflicts=True)
+        tipos.update(Tipo.objects.filter(name_key__in=missing).values_list("name_key", "id"))
+        invalidate_type_chart()
+        name_index.invalidate()
+        catalog_cache.invalidate("tipo")
+    return tipos
+
+
+def movimiento_fields(data):
+    """Campos de ``Movimiento`` (más ``tipo_name``) a partir de ``/move/<id>/``."""
+    return {
+        "name": data["name"],
+        "power": data["power"],
+        "pp": data["pp"],
+        "accuracy": data["accuracy"],
+        "tipo_name": data["type"]["name"],
+    }
+
+
+def import_movimiento(data):
+    """
+    Crea un ``Movimiento`` (y su tipo si falta) a partir de ``/move/<id>/``.
+
+    Si otra petición lo insertó entretanto (dos lecturas que fallan a la
+    vez o un alta manual), devuelve esa fila.
+    """
+    fields = movimiento_fields(data)
+    tipo = get_or_create_tipo(fields.pop("tipo_name"))
+    try:
+        with transaction.atomic():
+            return Movimiento.objects.create(tipo=tipo, **fields)
+    except IntegrityError:
+        return Movimiento.objects.select_related("tipo").get(name_key=normalize_name(fields["name"]))
+
+
+def pokemon_fields(data):
+    """Campos de ``Pokemon`` (más ``tipo_name``) a partir de ``/pokemon/<id>/``."""
+    return {
+        "name": data["name"],
+        "hp": data["stats"][0]["base_stat"],
+        "attack": data["stats"][1]["base_stat"],
+        "defense": data["stats"][2]["base_stat"],
+        "image": data["sprites"]["front_default"] or "",
+        "tipo_name": data["types"][0]["type"]["name"],
+    }
+
+
+def move_names(data):
+    """Nombres de la lista ``moves`` de ``/pokemon/<id>/``, sin repetir."""
+    return list(dict.fromkeys(entry["move"]["name"] for entry in data.get("moves", ())))
+
+
+def import_pokemon(data):
+    """
+    Crea un ``Pokemon`` (con su tipo y movimientos) a partir de ``/pokemon/<id>/``.
+
+    Los movimientos que faltan se descargan antes de abrir la transacción,
+    que solo cubre las inserciones: no debe llamarse dentro de otra.
+    """
+    moves = fetch_movimiento_payloads(missing_movimientos(move_names(data)))
+    fields = pokemon_fields(data)
+    with transaction.atomic():
+        tipo = get_or_create_tipo(fields.pop("tipo_name"))
+        pokemon = Pokemon.objects.create(tipo=tipo, **fields)
+        if move_names(data):
+            save_movesets({pokemon.pk: data}, moves.values())
+            pokemon.refresh_from_db(fields=SUMMARY_FIELDS)
+    return pokemon
+
+
+def bulk_import_pokemon(payloads, update_existing=False, tipos=None):
+    """
+    Inserta en bloque los Pokémon de varias respuestas ``/pokemon/<id>/``.
+
+    Resuelve todos los tipos en una consulta (creando los que falten) y
+    escribe con un solo ``bulk_create``. Con ``update_existing`` los ya
+    existentes se actualizan (movimientos incluidos); si no, se conservan
+    tal cual. ``tipos`` (``name_key`` → id) puede reutilizarse entre llamadas y
+    se completa con los tipos creados. Los movimientos que faltan se
+    descargan antes de abrir la transacción.
+
+    Como ``bulk_create`` no emite señales, invalida aquí la caché de
+    lecturas, los índices aleatorio y de nombres y, si hubo tipos nuevos,
+    la matriz de efectividad. Devuelve los nombres escritos.
+    """
+    rows = [pokemon_fields(data) for data in payloads]
+    if not rows:
+        return []
+    if tipos is None:
+        tipos = {}
+    names = [data["name"] for data in payloads]
+    keys = {normalize_name(name) for name in names}
+    existing = set() if update_existing else set(
+        Pokemon.objects.filter(name_key__in=keys).values_list("name_key", flat=True)
+    )
+    new = [data for data in payloads if normalize_name(data["name"]) not in existing]
+    moves = fetch_movimiento_payloads(missing_movimientos(moveset_names(new)))
+
+    with transaction.atomic():
+        resolve_tipos({row["tipo_name"] for row in rows}, tipos)
+        options = (
+            {"update_conflicts": True, "unique_fields": ["name_key"], "update_fields": BULK_UPDATE_FIELDS}
+            if update_existing
+            else {"ignore_conflicts": True}
+        )
+        Pokemon.objects.bulk_create(
+            [Pokemon(tipo_id=tipos[normalize_name(row.pop("tipo_name"))], **row) for row in rows],
+            **options,
+        )
+        ids = dict(Pokemon.objects.filter(name_key__in=keys).values_list("name_key", "pk"))
+        save_movesets(
+            {ids[normalize_name(data["name"])]: data for data in new},
+            moves.values(),
+            replace=update_existing,
+            tipos=tipos,
+        )
+        if update_existing:
+            sync_ranking_tipos(list(ids.values()))
+
+    random_index.invalidate()
+    name_index.invalidate()
+    catalog_cache.invalidate("pokemon", list(ids.values()))
+    return names
+
+
+def _fetch_payloads(resource, keys):
+    client = get_client()
+    get = getattr(client, resource)
+
+    def fetch(key):
+        try:
+            return get(key)
+        except PokeApiError as exc:
+            return exc
+
+    if not keys:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(keys), client.pool_size)) as pool:
+        return dict(zip(keys, pool.map(fetch, keys)))
+
+
+def fetch_pokemon_payloads(keys):
+    """
+    Descarga en paralelo ``/pokemon/<key>/`` para cada clave.
+
+    Devuelve ``{clave: respuesta}``, donde la respuesta es el JSON, ``None``
+    (404) o la ``PokeApiError`` si la PokeAPI no respondió.
+    """
+    return _fetch_payloads("pokemon", keys)
+
+
+def fetch_movimiento_payloads(names):
+    """``fetch_pokemon_payloads`` para ``/move/<name>/``."""
+    return _fetch_payloads("movimiento", names)
+
+
+# ============================================================
+# 🔹 MOVIMIENTOS DE CADA POKÉMON
+# ============================================================
+def moveset_names(payloads):
+    """Nombres de movimiento de varias respuestas ``/pokemon/<id>/``, sin repetir."""
+    return list(dict.fromkeys(name for data in payloads for name in move_names(data)))
+
+
+def missing_movimientos(names):
+    """Los nombres de ``names`` que no tienen ``Movimiento`` local (una consulta)."""
+    if not names:
+        return []
+    local = set(
+        Movimiento.objects.filter(name_key__in={normalize_name(name) for name in names})
+        .values_list("name_key", flat=True)
+    )
+    return [name for name in names if normalize_name(name) not in local]
+
+
+def save_movesets(pokemon_payloads, move_payloads, replace=False, tipos=None):
+    """
+    Guarda los movimientos de ``pokemon_payloads`` (``{pokemon_id: respuesta}``).
+
+    ``move_payloads`` son las respuestas ``/move/`` de los que faltaban
+    localmente; se insertan con un ``bulk_create`` (los ``None`` o errores
+    se omiten y ese movimiento queda sin asociar). Después se asocian todos
+    en bloque con ``link_movimientos``.
+    """
+    if tipos is None:
+        tipos = {}
+    wanted = {pokemon_id: move_names(data) for pokemon_id, data in pokemon_payloads.items()}
+    if not any(wanted.values()) and not replace:
+        return
+
+    with transaction.atomic():
+        rows = [movimiento_fields(data) for data in move_payloads if isinstance(data, dict)]
+        if rows:
+            resolve_tipos({row["tipo_name"] for row in rows}, tipos)
+            Movimiento.objects.bulk_create(
+                [Movimiento(tipo_id=tipos[normalize_name(row.pop("tipo_name"))], **row) for row in rows],
+                ignore_conflicts=True,
+            )
+            catalog_cache.invalidate("movimiento")
+            name_index.invalidate()
+
+        keys = {normalize_name(name) for names in wanted.values() for name in names}
+        ids = dict(Movimiento.objects.filter(name_key__in=keys).values_list("name_key", "id")) if keys else {}
+        link_movimientos(
+            {
+                pokemon_id: [ids[key] for key in map(normalize_name, names) if key in ids]
+                for pokemon_id, names in wanted.items()
+            },
+            replace=replace,
+        )
+
+
+def import_movesets(pokemon_payloads, replace=False, tipos=None):
+    """Descarga los movimientos que faltan y guarda los de ``{pokemon_id: respuesta}``."""
+    moves = fetch_movimiento_payloads(missing_movimientos(moveset_names(pokemon_payloads.values())))
+    save_movesets(pokemon_payloads, moves.values(), replace=replace, tipos=tipos)
+
+
+def catalog_lookup(identifier):
+    """
+    Filtro para buscar un Pokémon, Tipo o Movimiento local por ID o nombre.
+
+    Los nombres se comparan con ``name_key`` (columna normalizada con
+    índice único), no con ``name__iexact``, que no puede usar el índice.
+    """
+    identifier = str(identifier).strip()
+    if is_numeric_id(identifier):
+        return {"pk": identifier}
+    return {"name_key": normalize_name(identifier)}
+
+
+pokemon_lookup = catalog_lookup
+
+
+def find_local_pokemon(identifier):
+    """Busca un Pokémon local por ID o nombre; ``None`` si no existe."""
+    try:
+        return Pokemon.objects.select_related("tipo").get(**pokemon_lookup(identifier))
+    except Pokemon.DoesNotExist:
+        return None
+
+
+def fetch_pokemon(identifier):
+    """
+    Importa un Pokémon desde la PokeAPI con deduplicación de concurrentes.
+
+    Retorna ``(pokemon, created)``; ``(None, False)`` si la PokeAPI no lo
+    conoce. Propaga ``PokeApiError`` si la PokeAPI no responde y
+    ``LockTimeout`` si otro proceso lo está importando y no termina a tiempo.
+    """
+    key = normalize_key(identifier)
+    return pokemon_flight.do(key, lambda: _fetch_pokemon_locked(key))
+
+
+def _fetch_pokemon_locked(key):
+    # La descarga va con el lock tomado pero sin transacción abierta: en
+    # SQLite una transacción retendría el lock de escritura de toda la base
+    with advisory_lock(f"pokemon:{key}"):
+        # Otro proceso pudo haberlo importado mientras esperábamos el lock
+        existing = find_local_pokemon(key)
+        if existing is not None:
+            return existing, False
+
+        data = get_client().pokemon(key)
+        if data is None:
+            return None, False
+
+        try:
+            return import_pokemon(data), True
+        except IntegrityError:
+            # Importado en paralelo bajo otra clave (p. ej. ID vs nombre)
+            return Pokemon.objects.get(name_key=normalize_name(data["name"])), False
+
+
+# ============================================================
+# 🔹 VARIANTES ASÍNCRONAS
+# ============================================================
+async def aget_or_create_tipo(name):
+    tipo, _ = await Tipo.objects.aget_or_create(name_key=normalize_name(name), defaults={"name": name})
+    return tipo
+
+
+async def aimport_tipo(data):
+    return await aget_or_create_tipo(data["name"])
+
+
+async def aimport_movimiento(data):
+    tipo = await aget_or_create_tipo(data["type"]["name"])
+    movimiento, _ = await Movimiento.objects.aget_or_create(
+        name_key=normalize_name(data["name"]),
+        defaults={
+            "name": data["name"],
+            "power": data["power"],
+            "pp": data["pp"],
+            "accuracy": data["accuracy"],
+            "tipo": tipo,
+        },
+    )
+    return movimiento
+
+
+async def afetch_movimiento_payloads(names):
+    """``fetch_movimiento_payloads`` con el cliente asíncrono (``asyncio.gather``)."""
+    client = get_async_client()
+
+    async def fetch(name):
+        try:
+            return await client.movimiento(name)
+        except PokeApiError as exc:
+            return exc
+
+    return dict(zip(names, await asyncio.gather(*(fetch(name) for name in names))))
+
+
+async def aimport_movesets(pokemon_payloads):
+    """``import_movesets``: descarga asíncrona; la escritura en bloque va en un hilo."""
+    names = moveset_names(pokemon_payloads.values())
+    moves = await afetch_movimiento_payloads(await sync_to_async(missing_movimientos)(names))
+    await sync_to_async(save_movesets)(pokemon_payloads, list(moves.values()))
+
+
+async def afetch_pokemon(identifier):
+    """
+    ``fetch_pokemon`` asíncrono: ``(pokemon, created)`` o ``(None, False)``.
+
+    Las corrutinas que piden el mismo Pokémon comparten una descarga
+    (``AsyncSingleFlight``). El ORM asíncrono no admite transacciones, así
+    que la carrera entre procesos se resuelve con el ``IntegrityError`` de
+    la restricción única, releyendo la fila.
+    """
+    key = normalize_key(identifier)
+    return await async_pokemon_flight.do(key, lambda: _afetch_pokemon(key))
+
+
+async def _afetch_pokemon(key):
+    existing = await Pokemon.objects.filter(**catalog_lookup(key)).afirst()
+    if existing is not None:
+        return existing, False
+
+    data = await get_async_client().pokemon(key)
+    if data is None:
+        return None, False
+
+    fields = pokemon_fields(data)
+    tipo = await aget_or_create_tipo(fields.pop("tipo_name"))
+    try:
+        pokemon = await Pokemon.objects.acreate(tipo=tipo, **fields)
+    except IntegrityError:
+        return await Pokemon.objects.aget(name_key=normalize_name(data["name"])), False
+    await aimport_movesets({pokemon.pk: data})
+    return pokemon, True
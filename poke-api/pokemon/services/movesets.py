@@ -0,0 +1,89 @@
+"""
+movesets.py
+-----------
+Movimientos de cada Pokémon y su resumen desnormalizado.
+
+``Pokemon.move_count``, ``max_move_power`` y ``move_types`` (máscara de
+``TYPE_BITS``) guardan lo que se obtendría agregando la tabla intermedia
+``Pokemon.movimientos``, para que los listados filtren por cobertura sin
+joins. ``refresh_move_summaries`` los recalcula y debe llamarse en cada
+escritura que cambie los movimientos de un Pokémon: las señales
+``m2m_changed`` y de ``Movimiento`` (ver ``pokemon/signals.py``) lo hacen
+por su cuenta; ``link_movimientos`` (inserción en bloque, sin señales)
+también.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.utils import timezone
+
+from pokemon.battle.type_chart import type_mask
+from pokemon.cache import catalog_cache
+from pokemon.models import Pokemon
+
+SUMMARY_FIELDS = ["move_count", "max_move_power", "move_types", "updated_at"]
+
+
+def move_summaries(pokemon_ids):
+    """``{pokemon_id: (move_count, max_move_power, move_types)}`` en una consulta."""
+    summaries = {pk: (0, None, 0) for pk in pokemon_ids}
+    links = (
+        Pokemon.movimientos.through.objects
+        .filter(pokemon_id__in=summaries)
+        .values_list("pokemon_id", "movimiento__power", "movimiento__tipo__name")
+    )
+    for pokemon_id, power, tipo in links:
+        count, max_power, mask = summaries[pokemon_id]
+        if power is not None and (max_power is None or power > max_power):
+            max_power = power
+        summaries[pokemon_id] = (count + 1, max_power, mask | type_mask([tipo]))
+    return summaries
+
+
+def refresh_move_summaries(pokemon_ids, batch_size=500):
+    """
+    Recalcula el resumen de movimientos de ``pokemon_ids``.
+
+    Escribe con ``bulk_update`` (una consulta de lectura y una de escritura
+    por lote) y actualiza ``updated_at``, así que el ``ETag`` del Pokémon
+    cambia aunque el resumen no lo haga (p. ej. al renombrar un movimiento
+    incrustado en el detalle). Devuelve los Pokémon procesados.
+    """
+    pokemon_ids = sorted(set(pokemon_ids))
+    now = timezone.now()
+    for start in range(0, len(pokemon_ids), batch_size):
+        summaries = move_summaries(pokemon_ids[start:start + batch_size])
+        Pokemon.objects.bulk_update(
+            [
+                Pokemon(pk=pk, move_count=count, max_move_power=max_power, move_types=mask, updated_at=now)
+                for pk, (count, max_power, mask) in summaries.items()
+            ],
+            SUMMARY_FIELDS,
+        )
+    if pokemon_ids:
+        transaction.on_commit(partial(catalog_cache.invalidate, "pokemon", pokemon_ids))
+    return len(pokemon_ids)
+
+
+def link_movimientos(links, replace=False, batch_size=1000):
+    """
+    Asocia movimientos en bloque: ``links`` es ``{pokemon_id: [movimiento_id]}``.
+
+    Con ``replace`` los movimientos previos de esos Pokémon se descartan;
+    si no, se añaden a los existentes. Recalcula los resúmenes.
+    """
+    through = Pokemon.movimientos.through
+    with transaction.atomic():
+        if replace:
+            through.objects.filter(pokemon_id__in=list(links)).delete()
+        through.objects.bulk_create(
+            [
+                through(pokemon_id=pokemon_id, movimiento_id=movimiento_id)
+                for pokemon_id, movimiento_ids in links.items()
+                for movimiento_id in dict.fromkeys(movimiento_ids)
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        refresh_move_summaries(links)
@@ -0,0 +1,282 @@
+"""
+name_index.py
+-------------
+Búsqueda aproximada de nombres del catálogo (Pokémon, tipos y movimientos).
+
+``NameSearchIndex`` guarda en memoria los trigramas de cada nombre (como
+``pg_trgm``: cada palabra con dos espacios delante y uno detrás), las
+listas invertidas trigrama → nombres y las claves ordenadas para buscar
+por prefijo. Una consulta:
+
+ 1. Prefijo: ``bisect`` sobre las claves ordenadas (``"char"`` →
+    ``charizard``, ``charmander``, ...), en orden alfabético.
+ 2. Trigramas: se recorren las listas de los trigramas de la consulta
+    de la menos a la más frecuente, verificando cada nombre nuevo, y se
+    para en cuanto ningún nombre sin ver puede superar al ``limit``-ésimo
+    mejor (ni a ``min_similarity``). ``"charzard"`` encuentra
+    ``charizard`` sin llegar a las listas de trigramas comunes como
+    ``"  c"``.
+
+La puntuación es la ``similarity()`` de pg_trgm (``|A ∩ B| / |A ∪ B|``);
+los que empiezan por la consulta van primero.
+
+Igual que ``random_index``: se construye al arrancar (``warm``, desde
+``wsgi.py``/``asgi.py``) o en el primer uso, y se actualiza desde las
+señales de ``pokemon/signals.py``. Cada ``max_age`` segundos (por las
+escrituras de otros procesos) o tras ``invalidate()`` (escrituras en
+bloque del importador y las instantáneas, que no emiten señales) se
+recarga completo en un hilo aparte: las búsquedas siguen usando el índice
+actual hasta que el nuevo lo reemplaza, así que ninguna petición paga la
+reconstrucción. Solo la primera carga es síncrona.
+
+Con ``NAME_SEARCH["BACKEND"] = "pg_trgm"`` (solo PostgreSQL),
+``search_names`` consulta la base con ``similarity()`` en lugar del índice
+en memoria. Requiere la extensión (``CREATE EXTENSION pg_trgm``) y
+conviene un índice ``GIN (name_key gin_trgm_ops)`` en cada tabla.
+"""
+
+import re
+from bisect import bisect_left, insort
+from heapq import heappop, heappush
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError, connection
+from django.db.models import Q
+
+from pokemon.models import Movimiento, Pokemon, Tipo, normalize_name
+from pokemon.services.reloadable import ReloadableIndex
+
+NAME_MODELS = {"pokemon": Pokemon, "tipo": Tipo, "movimiento": Movimiento}
+BACKENDS = ("memory", "pg_trgm")
+
+
+def trigrams(name):
+    """Trigramas de ``name`` al estilo de pg_trgm (palabras alfanuméricas)."""
+    grams = set()
+    for word in re.findall(r"[^\W_]+", normalize_name(name)):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(left, right):
+    """Similitud de Jaccard entre dos conjuntos de trigramas."""
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared) if shared else 0.0
+
+
+class NameSearchIndex(ReloadableIndex):
+    """Trigramas y claves ordenadas de los nombres del catálogo."""
+
+    thread_name = "name-index-reload"
+
+    def __init__(self, max_age=300):
+        super().__init__(max_age)
+        self._entries = {}
+        self._postings = {}
+        self._keys = []
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._entries)
+
+    # --------------------------------------------------------
+    # 🔸 Mantenimiento incremental
+    # --------------------------------------------------------
+    def add(self, kind, pk, name):
+        """Alta o renombrado de ``(kind, pk)``."""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._add((kind, pk), name)
+            self._record(((kind, pk), name))
+
+    def remove(self, kind, pk):
+        with self._lock:
+            self._remove((kind, pk))
+            self._record(((kind, pk), None))
+
+    def _add(self, ref, name):
+        self._remove(ref)
+        self._insert(self._entries, self._postings, ref, name)
+        insort(self._keys, (normalize_name(name), *ref))
+
+    @staticmethod
+    def _insert(entries, postings, ref, name):
+        grams = trigrams(name)
+        entries[ref] = (name, grams)
+        for gram in grams:
+            postings.setdefault(gram, set()).add(ref)
+
+    def _remove(self, ref):
+        entry = self._entries.pop(ref, None)
+        if entry is None:
+            return
+        name, grams = entry
+        for gram in grams:
+            refs = self._postings[gram]
+            refs.discard(ref)
+            if not refs:
+                del self._postings[gram]
+        item = (normalize_name(name), *ref)
+        position = bisect_left(self._keys, item)
+        if position < len(self._keys) and self._keys[position] == item:
+            del self._keys[position]
+
+    # --------------------------------------------------------
+    # 🔸 Recarga (ver ``ReloadableIndex``)
+    # --------------------------------------------------------
+    def _build(self):
+        entries, postings, keys = {}, {}, []
+        for kind, model in NAME_MODELS.items():
+            for pk, name in model.objects.values_list("pk", "name"):
+                self._insert(entries, postings, (kind, pk), name)
+                keys.append((normalize_name(name), kind, pk))
+        keys.sort()
+        return entries, postings, keys
+
+    def _install(self, index):
+        self._entries, self._postings, self._keys = index
+
+    def _replay(self, change):
+        ref, name = change
+        if name is None:
+            self._remove(ref)
+        else:
+            self._add(ref, name)
+
+    # --------------------------------------------------------
+    # 🔸 Búsqueda
+    # --------------------------------------------------------
+    def search(self, query, kinds=tuple(NAME_MODELS), limit=10, min_similarity=0.3):
+        """
+        Hasta ``limit`` coincidencias de ``query`` entre los ``kinds``
+        pedidos: ``{"kind", "id", "name", "score", "prefix"}``.
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+        grams = trigrams(key)
+        self._ensure_loaded()
+        with self._lock:
+            results = self._prefix_matches(key, grams, kinds, limit)
+            if len(results) < limit and grams:
+                seen = {(item["kind"], item["id"]) for item in results}
+                results += self._similar(grams, kinds, limit - len(results), min_similarity, seen)
+        return results
+
+    def _prefix_matches(self, key, grams, kinds, limit):
+        results = []
+        keys = self._keys
+        for position in range(bisect_left(keys, (key,)), len(keys)):
+            entry_key, kind, pk = keys[position]
+            if not entry_key.startswith(key) or len(results) >= limit:
+                break
+            if kind in kinds:
+                name, entry_grams = self._entries[kind, pk]
+                results.append(self._result(kind, pk, name, similarity(grams, entry_grams), True))
+        return results
+
+    def _similar(self, grams, kinds, limit, min_similarity, seen):
+        # Las listas se recorren de la menos a la más frecuente: un nombre que
+        # aparece por primera vez en la lista ``i`` no tiene los ``i``
+        # trigramas anteriores, así que su similitud es ``<= (n - i) / n``.
+        # Se para cuando ese tope queda por debajo del ``limit``-ésimo mejor.
+        total = len(grams)
+        ordered = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        threshold, best, results = min_similarity, [], []
+        for position, gram in enumerate(ordered):
+            if (total - position) / total < threshold:
+                break
+            for ref in self._postings.get(gram, ()):
+                if ref in seen:
+                    continue
+                seen.add(ref)
+                if ref[0] not in kinds:
+                    continue
+                name, entry_grams = self._entries[ref]
+                score = similarity(grams, entry_grams)
+                if score < threshold:
+                    continue
+                results.append(self._result(*ref, name, score, False))
+                heappush(best, score)
+                if len(best) > limit:
+                    heappop(best)
+                if len(best) == limit:
+                    threshold = max(threshold, best[0])
+        results.sort(key=lambda item: (-item["score"], item["name"]))
+        return results[:limit]
+
+    @staticmethod
+    def _result(kind, pk, name, score, prefix):
+        return {"kind": kind, "id": pk, "name": name, "score": round(score, 3), "prefix": prefix}
+
+
+name_index = NameSearchIndex()
+
+
+# ============================================================
+# 🔹 BACKEND CONFIGURADO
+# ============================================================
+def search_backend():
+    """``NAME_SEARCH["BACKEND"]``, validado contra la base en uso."""
+    backend = settings.NAME_SEARCH["BACKEND"]
+    if backend not in BACKENDS:
+        raise ImproperlyConfigured(f"NAME_SEARCH['BACKEND'] debe ser uno de {BACKENDS}, no '{backend}'.")
+    if backend == "pg_trgm" and connection.vendor != "postgresql":
+        raise ImproperlyConfigured("NAME_SEARCH['BACKEND'] = 'pg_trgm' requiere PostgreSQL.")
+    return backend
+
+
+def warm_name_index():
+    """
+    Construye el índice en memoria al arrancar el proceso, si está activo.
+    Con la base aún sin migrar se deja para el primer uso.
+    """
+    config = settings.NAME_SEARCH
+    if not config["WARM_ON_STARTUP"] or search_backend() != "memory":
+        return
+    try:
+        name_index.warm()
+    except DatabaseError:
+        pass
+
+
+def search_names(query, kinds=tuple(NAME_MODELS), limit=None):
+    """Coincidencias de ``query`` con el backend configurado (mismo formato)."""
+    config = settings.NAME_SEARCH
+    limit = limit or config["DEFAULT_LIMIT"]
+    if search_backend() == "memory":
+        return name_index.search(query, kinds, limit, config["MIN_SIMILARITY"])
+    return _pg_trgm_search(query, kinds, limit, config["MIN_SIMILARITY"])
+
+
+def suggest_names(query, kind, limit=5):
+    """Nombres de ``kind`` parecidos a ``query`` (ninguno si ``query`` es un ID)."""
+    if str(query).strip().isdigit():
+        return []
+    return [item["name"] for item in search_names(query, [kind], limit)]
+
+
+def _pg_trgm_search(query, kinds, limit, min_similarity):
+    key = normalize_name(query)
+    if not key:
+        return []
+    results = []
+    for kind in kinds:
+        rows = (
+            NAME_MODELS[kind].objects
+            .annotate(score=TrigramSimilarity("name_key", key))
+            .filter(Q(score__gte=min_similarity) | Q(name_key__startswith=key))
+            .order_by("-score", "name_key")
+            .values_list("pk", "name", "name_key", "score")[:limit]
+        )
+        results += [
+            {"kind": kind, "id": pk, "name": name, "score": round(score, 3), "prefix": name_key.startswith(key)}
+            for pk, name, name_key, score in rows
+        ]
+    # Mismo orden que el índice en memoria
+    results.sort(key=lambda item: (not item["prefix"], 0 if item["prefix"] else -item["score"], item["name"]))
+    return results[:limit]
@@ -0,0 +1,120 @@
+"""
+random_index.py
+---------------
+Selección aleatoria de Pokémon en tiempo constante.
+
+Mantiene en memoria un arreglo denso con los PKs vivos del catálogo (más un
+diccionario PK → posición) para poder elegir con ``random.sample`` sin tocar
+la base de datos y traer luego solo las filas elegidas, con su tipo, en una
+única consulta.
+
+El índice se carga la primera vez que se usa y se actualiza de forma
+incremental desde ``post_save``/``post_delete`` (ver ``pokemon/signals.py``).
+Como otros procesos también escriben, se recarga completo cada
+``max_age`` segundos, tras ``invalidate()`` o cuando un PK elegido ya no
+existe; la recarga va en un hilo aparte (``ReloadableIndex``) y mientras
+tanto se sigue eligiendo del índice actual.
+"""
+
+import random
+
+from pokemon.models import Pokemon
+from pokemon.services.reloadable import ReloadableIndex
+
+
+class RandomPokemonIndex(ReloadableIndex):
+    """Arreglo denso de PKs con altas/bajas O(1) y muestreo O(k)."""
+
+    thread_name = "random-index-reload"
+
+    def __init__(self, max_age=300):
+        super().__init__(max_age)
+        self._pks = []
+        self._positions = {}
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._pks)
+
+    # --------------------------------------------------------
+    # 🔸 Mantenimiento incremental
+    # --------------------------------------------------------
+    def add(self, pk):
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._add(pk)
+            self._record((pk, True))
+
+    def remove(self, pk):
+        with self._lock:
+            self._remove(pk)
+            self._record((pk, False))
+
+    def _add(self, pk):
+        if pk in self._positions:
+            return
+        self._positions[pk] = len(self._pks)
+        self._pks.append(pk)
+
+    def _remove(self, pk):
+        position = self._positions.pop(pk, None)
+        if position is None:
+            return
+        # Intercambiar con el último para borrar en O(1)
+        last = self._pks.pop()
+        if position < len(self._pks):
+            self._pks[position] = last
+            self._positions[last] = position
+
+    # --------------------------------------------------------
+    # 🔸 Recarga (ver ``ReloadableIndex``)
+    # --------------------------------------------------------
+    def _build(self):
+        return list(Pokemon.objects.values_list("pk", flat=True))
+
+    def _install(self, pks):
+        self._pks = pks
+        self._positions = {pk: position for position, pk in enumerate(pks)}
+
+    def _replay(self, change):
+        pk, added = change
+        if added:
+            self._add(pk)
+        else:
+            self._remove(pk)
+
+    # --------------------------------------------------------
+    # 🔸 Selección
+    # --------------------------------------------------------
+    def sample_pks(self, count=1):
+        """Hasta ``count`` PKs distintos elegidos al azar."""
+        self._ensure_loaded()
+        with self._lock:
+            return random.sample(self._pks, min(count, len(self._pks)))
+
+    def sample(self, count=1):
+        """
+        Hasta ``count`` Pokémon distintos (con ``tipo`` precargado) en una
+        sola consulta, en orden aleatorio.
+        """
+        stale = False
+        for _ in range(2):
+            pks = self.sample_pks(count)
+            if not pks:
+                break
+            rows = Pokemon.objects.select_related("tipo").in_bulk(pks)
+            if len(rows) == len(pks):
+                break
+            # Algún PK fue borrado por otro proceso: se descarta y se
+            # reintenta; el resto del índice se recarga en segundo plano
+            stale = True
+            for pk in pks:
+                if pk not in rows:
+                    self.remove(pk)
+        if stale:
+            self.invalidate()
+        return [rows[pk] for pk in pks if pk in rows] if pks else []
+
+
+random_index = RandomPokemonIndex()
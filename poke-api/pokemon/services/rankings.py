@@ -0,0 +1,155 @@
+"""
+rankings.py
+-----------
+Rankings del catálogo leídos en orden de índice, sin recorrer ni ordenar
+tablas completas.
+
+ - ``total_stats`` (global o por tipo): ``Pokemon.total_stats`` ya es la
+   columna materializada (``StatTotalField``, recalculada al guardar) y los
+   índices ``(total_stats, id)`` / ``(tipo, total_stats, id)`` de
+   ``Pokemon.Meta`` dan el top directamente.
+ - ``win_rate`` (global o por tipo): ``RankingBatalla``, actualizada de
+   forma incremental con cada batalla registrada (``record_battle``) y con
+   los índices ``(win_rate, batallas, pokemon)`` /
+   ``(tipo, win_rate, batallas, pokemon)``.
+
+Un top-N cuesta N entradas de índice más el join por PK con Pokémon y
+tipos. ``Batalla`` es el registro de origen: ``rebuild_battle_rankings``
+reconstruye ``RankingBatalla`` desde cero.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F, FloatField, OuterRef, Subquery
+from django.db.models.functions import Cast, Greatest
+
+from pokemon.models import Batalla, Pokemon, RankingBatalla
+
+RANKINGS = ("total_stats", "win_rate")
+
+
+def battle_results(atacante_id, defensor_id, ganador_id):
+    """
+    ``[(pokemon_id, ganó)]`` de una batalla, una entrada por rol. Contra sí
+    mismo cuenta como dos batallas con una victoria.
+    """
+    return [
+        (atacante_id, ganador_id == atacante_id),
+        (defensor_id, ganador_id == defensor_id and defensor_id != atacante_id),
+    ]
+
+
+def _add_results(results, sign=1):
+    """Suma (o resta, con ``sign=-1``) ``results``: un ``UPDATE`` por PK."""
+    for pokemon_id, won in results:
+        battles, wins = sign, sign * int(won)
+        RankingBatalla.objects.filter(pk=pokemon_id).update(
+            batallas=F("batallas") + battles,
+            victorias=F("victorias") + wins,
+            # El lado derecho usa los valores previos a la actualización
+            win_rate=Cast(F("victorias") + wins, FloatField()) / Greatest(F("batallas") + battles, 1),
+        )
+
+
+# ============================================================
+# 🔹 ACTUALIZACIÓN INCREMENTAL
+# ============================================================
+def record_battle(atacante, defensor, winner, turns):
+    """
+    Registra una batalla (``winner``: ``"attacker"``, ``"defender"`` o
+    ``None``) y suma el resultado al ranking de ambos Pokémon: dos
+    inserciones y un ``UPDATE`` por participante, sin leer sus filas.
+    """
+    ganador = {"attacker": atacante, "defender": defensor}.get(winner)
+    with transaction.atomic():
+        batalla = Batalla.objects.create(atacante=atacante, defensor=defensor, ganador=ganador, turnos=turns)
+        RankingBatalla.objects.bulk_create(
+            [RankingBatalla(pokemon_id=pokemon.pk, tipo_id=pokemon.tipo_id) for pokemon in {atacante, defensor}],
+            ignore_conflicts=True,
+        )
+        _add_results(battle_results(atacante.pk, defensor.pk, batalla.ganador_id))
+    return batalla
+
+
+def unrecord_battle(batalla):
+    """Descuenta del ranking una batalla borrada (ver ``pokemon/signals.py``)."""
+    _add_results(battle_results(batalla.atacante_id, batalla.defensor_id, batalla.ganador_id), sign=-1)
+
+
+def sync_ranking_tipos(pokemon_ids=None):
+    """
+    Copia ``Pokemon.tipo`` en ``RankingBatalla`` para ``pokemon_ids`` (o
+    todos). Para escrituras en bloque, que no emiten ``post_save``.
+    """
+    rows = RankingBatalla.objects.all() if pokemon_ids is None else RankingBatalla.objects.filter(pk__in=pokemon_ids)
+    return rows.exclude(tipo_id=F("pokemon__tipo_id")).update(
+        tipo_id=Subquery(Pokemon.objects.filter(pk=OuterRef("pk")).order_by().values("tipo_id")[:1]),
+    )
+
+
+def rebuild_battle_rankings(batch_size=1000):
+    """Reconstruye ``RankingBatalla`` a partir de ``Batalla``. Devuelve las filas escritas."""
+    totals = defaultdict(lambda: [0, 0])
+    battles = Batalla.objects.values_list("atacante_id", "defensor_id", "ganador_id")
+    for row in battles.iterator(chunk_size=batch_size):
+        for pokemon_id, won in battle_results(*row):
+            totals[pokemon_id][0] += 1
+            totals[pokemon_id][1] += won
+    tipos = dict(Pokemon.objects.filter(pk__in=list(totals)).values_list("pk", "tipo_id"))
+
+    with transaction.atomic():
+        RankingBatalla.objects.all().delete()
+        RankingBatalla.objects.bulk_create(
+            [
+                RankingBatalla(
+                    pokemon_id=pokemon_id, tipo_id=tipos[pokemon_id],
+                    batallas=battles, victorias=wins, win_rate=wins / battles,
+                )
+                for pokemon_id, (battles, wins) in totals.items()
+            ],
+            batch_size=batch_size,
+        )
+    return len(totals)
+
+
+# ============================================================
+# 🔹 LECTURA
+# ============================================================
+def ranking_queryset(by="total_stats", tipo_id=None, min_battles=1):
+    """Filas (``values()``) del ranking ``by`` en orden, sin ejecutar."""
+    if by == "total_stats":
+        queryset = Pokemon.objects.all()
+        if tipo_id is not None:
+            queryset = queryset.filter(tipo_id=tipo_id)
+        return queryset.order_by("-total_stats", "-id").values(
+            "id", "name", "image", "tipo_id", "tipo__name", "total_stats",
+        )
+
+    queryset = RankingBatalla.objects.filter(batallas__gte=min_battles)
+    if tipo_id is not None:
+        queryset = queryset.filter(tipo_id=tipo_id)
+    return queryset.order_by("-win_rate", "-batallas", "-pokemon_id").values(
+        "batallas", "victorias", "win_rate", "tipo_id", "tipo__name",
+        id=F("pokemon_id"), name=F("pokemon__name"), image=F("pokemon__image"),
+    )
+
+
+def top_pokemon(by="total_stats", tipo_id=None, limit=100, min_battles=1):
+    """Los ``limit`` primeros del ranking ``by``, numerados desde 1."""
+    rows = ranking_queryset(by, tipo_id, min_battles)[:limit]
+    results = []
+    for rank, row in enumerate(rows, start=1):
+        item = {
+            "rank": rank,
+            "id": row["id"],
+            "name": row["name"],
+            "image": row["image"],
+            "tipo": {"id": row["tipo_id"], "name": row["tipo__name"]},
+        }
+        if by == "total_stats":
+            item["total_stats"] = row["total_stats"]
+        else:
+            item.update(batallas=row["batallas"], victorias=row["victorias"], win_rate=round(row["win_rate"], 4))
+        results.append(item)
+    return results
@@ -0,0 +1,116 @@
+"""
+reloadable.py
+-------------
+Base de los índices en memoria del catálogo (``random_index``,
+``name_index``).
+
+El índice se construye en el primer uso (síncrono) y después se mantiene
+con altas y bajas incrementales desde las señales. Cada ``max_age``
+segundos (por las escrituras de otros procesos) o tras ``invalidate()``
+(escrituras en bloque que no emiten señales) se reconstruye completo en un
+hilo aparte: las peticiones siguen usando el índice actual hasta que el
+nuevo lo reemplaza, así que ninguna paga la consulta completa.
+"""
+
+import threading
+import time
+
+from django.db import DatabaseError, connections
+
+
+class ReloadableIndex:
+    """
+    Índice en memoria con recarga completa en segundo plano.
+
+    Las subclases implementan ``_build()`` (consulta la base, sin el lock),
+    ``_install(index)`` (reemplaza sus estructuras) y ``_replay(change)``
+    (aplica una alta o baja); las dos últimas se llaman con el lock tomado.
+    Las altas y bajas deben pasar por ``_record(change)`` para que las que
+    llegan durante una recarga se apliquen también al índice nuevo.
+    """
+
+    thread_name = "index-reload"
+
+    def __init__(self, max_age=300):
+        self.max_age = max_age
+        self._loaded_at = None
+        self._stale = False
+        # Cada recarga toma un número; solo la más reciente reemplaza el índice
+        self._generation = 0
+        self._reloading = False
+        # Altas y bajas recibidas durante una recarga
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Marca el índice para recargarlo (en segundo plano) en el próximo uso."""
+        with self._lock:
+            self._stale = True
+
+    def warm(self):
+        """Construye el índice si aún no está cargado (arranque del proceso)."""
+        self._ensure_loaded()
+
+    def reload(self):
+        """Reconstruye el índice desde la base en este hilo."""
+        self._finish_reload(self._begin_reload(), self._build())
+
+    def _record(self, change):
+        if self._reloading:
+            self._pending.append(change)
+
+    def _ensure_loaded(self):
+        if self._loaded_at is None:
+            self.reload()
+        elif self._stale or time.monotonic() - self._loaded_at >= self.max_age:
+            self._reload_in_background()
+
+    def _begin_reload(self, unless_running=False):
+        with self._lock:
+            if unless_running and self._reloading:
+                return None
+            self._generation += 1
+            self._stale = False
+            self._reloading = True
+            self._pending = []
+            return self._generation
+
+    def _finish_reload(self, generation, index):
+        with self._lock:
+            if generation != self._generation:
+                # Empezó otra recarga después: su resultado es más reciente
+                return
+            self._install(index)
+            for change in self._pending:
+                self._replay(change)
+            self._pending = []
+            self._reloading = False
+            self._loaded_at = time.monotonic()
+
+    def _reload_in_background(self):
+        generation = self._begin_reload(unless_running=True)
+        if generation is None:
+            return
+
+        def target():
+            try:
+                self._finish_reload(generation, self._build())
+            except DatabaseError:
+                # Se sigue sirviendo el índice actual; se reintenta en el próximo uso
+                with self._lock:
+                    if generation == self._generation:
+                        self._reloading = False
+                        self._stale = True
+            finally:
+                connections.close_all()
+
+        threading.Thread(target=target, name=self.thread_name, daemon=True).start()
+
+    def _build(self):
+        raise NotImplementedError
+
+    def _install(self, index):
+        raise NotImplementedError
+
+    def _replay(self, change):
+        raise NotImplementedError
@@ -0,0 +1,187 @@
+"""
+singleflight.py
+---------------
+Deduplicación de importaciones concurrentes ("single-flight").
+
+Cuando muchas peticiones piden a la vez el mismo recurso que no existe
+localmente, solo una ejecuta la descarga + inserción; el resto espera y
+reutiliza su resultado.
+
+ - Dentro de un proceso: ``SingleFlight`` coordina los hilos por clave
+   y ``AsyncSingleFlight`` las corrutinas de un event loop.
+ - Entre procesos: ``advisory_lock`` toma un lock de base de datos de
+   sesión (``pg_try_advisory_lock`` en PostgreSQL, ``GET_LOCK`` en MySQL
+   y una fila de ``Bloqueo`` en el resto, como SQLite). No depende de una
+   transacción: la descarga se hace con el lock tomado pero fuera de
+   ``transaction.atomic()``, y solo la inserción abre una transacción.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from pokemon.models import Bloqueo
+
+# Segundos entre intentos mientras otro proceso tiene el lock
+LOCK_POLL_INTERVAL = 0.05
+
+
+def normalize_key(identifier):
+    """Clave canónica de un nombre o ID (``" Charizard "`` → ``"charizard"``)."""
+    return str(identifier).strip().lower()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Ejecuta como máximo una llamada en vuelo por clave dentro del proceso."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+        Ejecuta ``fn()`` para ``key`` o espera al hilo que ya la está
+        ejecutando. Todos reciben el mismo resultado (o la misma excepción).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """``SingleFlight`` para corrutinas: una tarea por clave y event loop."""
+
+    def __init__(self):
+        self._tasks = {}
+
+    async def do(self, key, fn):
+        """Ejecuta ``await fn()`` una sola vez entre las corrutinas que piden ``key``."""
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get((loop, key))
+        if task is None:
+            task = loop.create_task(fn())
+            self._tasks[(loop, key)] = task
+            task.add_done_callback(lambda _: self._tasks.pop((loop, key), None))
+        # shield: si un cliente se desconecta, la importación sigue para el resto
+        return await asyncio.shield(task)
+
+    def in_flight(self):
+        return len(self._tasks)
+
+
+class LockTimeout(Exception):
+    """``advisory_lock`` no obtuvo el lock en el plazo indicado."""
+
+
+def _lock_id(key):
+    """Entero de 64 bits con signo derivado de la clave (para PostgreSQL)."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _poll(try_acquire, key, timeout):
+    deadline = time.monotonic() + timeout
+    while not try_acquire():
+        if time.monotonic() >= deadline:
+            raise LockTimeout(f"No se obtuvo el lock '{key}' en {timeout} s.")
+        time.sleep(LOCK_POLL_INTERVAL)
+
+
+def _scalar(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchone()[0]
+
+
+def _insert_lock_row(key, token, ttl):
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            Bloqueo.objects.create(key=key, token=token, expires_at=now + timedelta(seconds=ttl))
+        return True
+    except IntegrityError:
+        # Lo tiene otro proceso; si caducó (proceso caído), se libera y se reintenta
+        deleted, _ = Bloqueo.objects.filter(key=key, expires_at__lt=now).delete()
+        return bool(deleted) and _insert_lock_row(key, token, ttl)
+
+
+def _session_locks():
+    """``True`` si la conexión admite locks de sesión (PostgreSQL sin PgBouncer, MySQL)."""
+    if connection.vendor == "postgresql":
+        # PgBouncer en modo transacción no conserva la sesión entre
+        # transacciones (ver ``poke_api/settings/database.py``)
+        return not connection.settings_dict.get("DISABLE_SERVER_SIDE_CURSORS")
+    return connection.vendor == "mysql"
+
+
+@contextmanager
+def advisory_lock(key, timeout=10, ttl=60):
+    """
+    Lock de base de datos entre procesos para ``key``.
+
+    Es de sesión, no de transacción: debe tomarse fuera de
+    ``transaction.atomic()`` para que el trabajo lento que protege (una
+    descarga) no mantenga abierta ninguna transacción. Lanza
+    ``LockTimeout`` si no lo obtiene en ``timeout`` segundos. Con la fila
+    de ``Bloqueo`` (SQLite, PgBouncer), un lock con más de ``ttl``
+    segundos se considera abandonado.
+    """
+    if not _session_locks():
+        token = uuid.uuid4().hex
+        _poll(lambda: _insert_lock_row(key[:191], token, ttl), key, timeout)
+        try:
+            yield
+        finally:
+            Bloqueo.objects.filter(key=key[:191], token=token).delete()
+    elif connection.vendor == "postgresql":
+        lock_id = _lock_id(key)
+        _poll(lambda: _scalar("SELECT pg_try_advisory_lock(%s)", [lock_id]), key, timeout)
+        try:
+            yield
+        finally:
+            _scalar("SELECT pg_advisory_unlock(%s)", [lock_id])
+    else:
+        # 1: obtenido; 0: plazo agotado; NULL: error
+        if _scalar("SELECT GET_LOCK(%s, %s)", [key[:64], timeout]) != 1:
+            raise LockTimeout(f"No se obtuvo el lock '{key}' en {timeout} s.")
+        try:
+            yield
+        finally:
+            _scalar("SELECT RELEASE_LOCK(%s)", [key[:64]])
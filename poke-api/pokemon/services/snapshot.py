@@ -0,0 +1,242 @@
+"""
+snapshot.py
+-----------
+Instantánea versionada del catálogo (Tipos, Movimientos, Pokémon y la
+matriz de efectividad) para arrancar despliegues sin tocar la PokeAPI.
+
+Formato: JSON lines comprimido con gzip.
+
+ - Primera línea: cabecera ``{"format", "version", "created_at", "counts"}``.
+ - Resto: una fila por línea, ``{"model": "<recurso>", ...campos}``. Las
+   relaciones se guardan por nombre (``"tipo": "fire"``), no por PK, así
+   que la instantánea se puede cargar sobre una base con otros IDs.
+ - Desde la versión 2 cada Pokémon lleva ``"movimientos": [nombres]``; las
+   de la versión 1 se siguen cargando (sin movimientos).
+
+``load_snapshot`` escribe todo en una transacción con ``bulk_create``
+(insertando o actualizando por ``name_key``, el nombre normalizado) y
+rechaza archivos de otro formato, de otra versión o truncados.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from pokemon.battle.type_chart import invalidate_type_chart
+from pokemon.cache import catalog_cache
+from pokemon.models import Efectividad, Movimiento, Pokemon, Tipo, normalize_name
+from pokemon.services.movesets import link_movimientos
+from pokemon.services.name_index import name_index
+from pokemon.services.random_index import random_index
+from pokemon.services.rankings import sync_ranking_tipos
+
+SNAPSHOT_FORMAT = "poke-api-catalog"
+SNAPSHOT_VERSION = 2
+READABLE_VERSIONS = (1, SNAPSHOT_VERSION)
+
+# Orden de escritura y de carga: las dependencias primero
+MODELS = ("tipo", "movimiento", "pokemon", "efectividad")
+
+
+class SnapshotError(Exception):
+    """Instantánea ilegible, de otro formato/versión o incompleta."""
+
+
+# ============================================================
+# 🔹 EXPORTACIÓN
+# ============================================================
+def _catalog_rows():
+    yield from (
+        {"model": "tipo", "name": name}
+        for name in Tipo.objects.order_by("name").values_list("name", flat=True)
+    )
+    for row in Movimiento.objects.order_by("name").values("name", "power", "pp", "accuracy", "tipo__name"):
+        row["tipo"] = row.pop("tipo__name")
+        yield {"model": "movimiento", **row}
+    movesets = {}
+    for pokemon_id, name in (
+        Pokemon.movimientos.through.objects.order_by("movimiento__name")
+        .values_list("pokemon_id", "movimiento__name")
+    ):
+        movesets.setdefault(pokemon_id, []).append(name)
+    for row in Pokemon.objects.order_by("name").values("id", "name", "hp", "attack", "defense", "image", "tipo__name"):
+        row["tipo"] = row.pop("tipo__name")
+        row["movimientos"] = movesets.get(row.pop("id"), [])
+        yield {"model": "pokemon", **row}
+    for atacante, defensor, multiplicador in (
+        Efectividad.objects.order_by("atacante__name", "defensor__name")
+        .values_list("atacante__name", "defensor__name", "multiplicador")
+    ):
+        yield {"model": "efectividad", "atacante": atacante, "defensor": defensor, "multiplicador": multiplicador}
+
+
+def build_snapshot(path):
+    """Escribe el catálogo actual en ``path``; devuelve las filas por recurso."""
+    with transaction.atomic():
+        # Lectura consistente: las filas y los conteos de la cabecera coinciden
+        rows = list(_catalog_rows())
+
+    counts = {model: 0 for model in MODELS}
+    for row in rows:
+        counts[row["model"]] += 1
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "created_at": timezone.now().isoformat(),
+        "counts": counts,
+    }
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+        for item in [header, *rows]:
+            fh.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n")
+    os.replace(tmp, path)
+    return counts
+
+
+# ============================================================
+# 🔹 LECTURA Y VALIDACIÓN
+# ============================================================
+def read_snapshot(path):
+    """``(cabecera, {recurso: [filas]})`` o ``SnapshotError``."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            header = json.loads(fh.readline() or "null")
+            _check_header(header)
+            rows = {model: [] for model in MODELS}
+            for line in fh:
+                row = json.loads(line)
+                model = row.pop("model", None)
+                if model not in rows:
+                    raise SnapshotError(f"Recurso desconocido en la instantánea: {model!r}.")
+                rows[model].append(row)
+    except (OSError, EOFError, ValueError) as exc:
+        raise SnapshotError(f"No se pudo leer la instantánea '{path}': {exc}") from exc
+
+    found = {model: len(items) for model, items in rows.items()}
+    if found != header["counts"]:
+        raise SnapshotError(f"Instantánea incompleta: cabecera {header['counts']}, filas {found}.")
+    return header, rows
+
+
+def _check_header(header):
+    if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+        raise SnapshotError("El archivo no es una instantánea del catálogo.")
+    if header.get("version") not in READABLE_VERSIONS:
+        raise SnapshotError(
+            f"Versión de instantánea {header.get('version')} no soportada "
+            f"(se esperaba {SNAPSHOT_VERSION})."
+        )
+    if set(header.get("counts", {})) != set(MODELS):
+        raise SnapshotError("Cabecera de instantánea sin conteos por recurso.")
+
+
+# ============================================================
+# 🔹 CARGA
+# ============================================================
+def load_snapshot(path, batch_size=1000):
+    """
+    Carga la instantánea en una sola transacción.
+
+    Inserta las filas nuevas y actualiza las existentes (por ``name_key``;
+    por par atacante/defensor en la matriz). Lo que no está en la
+    instantánea no se borra; los movimientos de cada Pokémon se reemplazan
+    por los de la instantánea. Devuelve las filas escritas por recurso.
+    """
+    header, rows = read_snapshot(path)
+    _check_unique(rows)
+    movesets = {normalize_name(row["name"]): row.pop("movimientos", []) for row in rows["pokemon"]}
+
+    try:
+        with transaction.atomic():
+            Tipo.objects.bulk_create(
+                [Tipo(name=row["name"]) for row in rows["tipo"]],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+            tipos = dict(Tipo.objects.values_list("name_key", "id"))
+            _check_refs(tipos, rows)
+
+            Movimiento.objects.bulk_create(
+                [Movimiento(tipo_id=tipos[normalize_name(row.pop("tipo"))], **row) for row in rows["movimiento"]],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["name_key"],
+                update_fields=["power", "pp", "accuracy", "tipo"],
+            )
+            Pokemon.objects.bulk_create(
+                [Pokemon(tipo_id=tipos[normalize_name(row.pop("tipo"))], **row) for row in rows["pokemon"]],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["name_key"],
+                update_fields=["hp", "attack", "defense", "total_stats", "image", "tipo", "updated_at"],
+            )
+            sync_ranking_tipos()
+            if header["version"] >= 2:
+                pokemons = dict(Pokemon.objects.filter(name_key__in=movesets).values_list("name_key", "id"))
+                movimientos = dict(Movimiento.objects.values_list("name_key", "id"))
+                missing = {
+                    name for names in movesets.values() for name in names
+                    if normalize_name(name) not in movimientos
+                }
+                if missing:
+                    raise SnapshotError(
+                        f"La instantánea referencia movimientos inexistentes: {', '.join(sorted(missing))}."
+                    )
+                link_movimientos(
+                    {
+                        pokemons[key]: [movimientos[normalize_name(move)] for move in moves]
+                        for key, moves in movesets.items()
+                    },
+                    replace=True,
+                    batch_size=batch_size,
+                )
+            Efectividad.objects.bulk_create(
+                [
+                    Efectividad(
+                        atacante_id=tipos[normalize_name(row["atacante"])],
+                        defensor_id=tipos[normalize_name(row["defensor"])],
+                        multiplicador=row["multiplicador"],
+                    )
+                    for row in rows["efectividad"]
+                ],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["atacante", "defensor"],
+                update_fields=["multiplicador"],
+            )
+    except IntegrityError as exc:
+        # Filas locales sin ``name_key`` (ver ``backfill_name_keys``) u otras restricciones
+        raise SnapshotError(f"La instantánea choca con el catálogo local: {exc}") from exc
+
+    # bulk_create no emite señales
+    for resource, model in (("tipo", Tipo), ("movimiento", Movimiento), ("pokemon", Pokemon)):
+        catalog_cache.invalidate(resource, list(model.objects.values_list("pk", flat=True)))
+    random_index.invalidate()
+    name_index.invalidate()
+    invalidate_type_chart()
+    return header["counts"]
+
+
+def _check_unique(rows):
+    # Dos filas que solo difieren en mayúsculas comparten ``name_key``
+    for model in ("tipo", "movimiento", "pokemon"):
+        seen = set()
+        for row in rows[model]:
+            key = normalize_name(row["name"])
+            if key in seen:
+                raise SnapshotError(f"Nombre repetido en la instantánea ({model}): {row['name']!r}.")
+            seen.add(key)
+
+
+def _check_refs(tipos, rows):
+    referenced = {row["tipo"] for row in rows["movimiento"] + rows["pokemon"]}
+    referenced |= {row[side] for row in rows["efectividad"] for side in ("atacante", "defensor")}
+    missing = {name for name in referenced if normalize_name(name) not in tipos}
+    if missing:
+        raise SnapshotError(f"La instantánea referencia tipos inexistentes: {', '.join(sorted(missing))}.")
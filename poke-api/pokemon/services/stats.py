@@ -0,0 +1,23 @@
+"""
+stats.py
+--------
+Estadísticas simples para reportes de rendimiento (latencias, throughput).
+"""
+
+import math
+
+
+def percentile(samples, q):
+    """Percentil ``q`` (0-100) por rango más cercano; 0.0 si no hay muestras."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples, quantiles=(50, 90, 99)):
+    """``{"p50": ..., "p90": ..., "p99": ..., "max": ...}`` de una lista de muestras."""
+    summary = {f"p{q}": percentile(samples, q) for q in quantiles}
+    summary["max"] = max(samples) if samples else 0.0
+    return summary
@@ -0,0 +1,152 @@
+"""
+signals.py
+----------
+Receptores de señales del módulo Pokémon.
+
+Mantienen sincronizadas las estructuras en memoria que dependen del
+catálogo (índice de selección aleatoria, índice de búsqueda de nombres,
+matriz de efectividad, caché de lecturas, ...) y las tablas de rankings.
+Se conectan en ``PokemonConfig.ready()``.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from pokemon.battle.type_chart import invalidate_type_chart
+from pokemon.cache import catalog_cache
+from pokemon.models import Batalla, Captura, Efectividad, Movimiento, Pokemon, RankingBatalla, Tipo
+from pokemon.services.capturas import liberar_contador
+from pokemon.services.movesets import refresh_move_summaries
+from pokemon.services.name_index import name_index
+from pokemon.services.random_index import random_index
+from pokemon.services.rankings import unrecord_battle
+
+
+@receiver(post_save, sender=Pokemon, dispatch_uid="pokemon_random_index_add")
+def add_to_random_index(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(partial(random_index.add, instance.pk))
+
+
+@receiver(post_delete, sender=Pokemon, dispatch_uid="pokemon_random_index_remove")
+def remove_from_random_index(sender, instance, **kwargs):
+    random_index.remove(instance.pk)
+
+
+@receiver(post_save, sender=Pokemon, dispatch_uid="pokemon_name_index_save")
+@receiver(post_save, sender=Tipo, dispatch_uid="tipo_name_index_save")
+@receiver(post_save, sender=Movimiento, dispatch_uid="movimiento_name_index_save")
+def add_to_name_index(sender, instance, **kwargs):
+    transaction.on_commit(partial(name_index.add, sender._meta.model_name, instance.pk, instance.name))
+
+
+@receiver(post_delete, sender=Pokemon, dispatch_uid="pokemon_name_index_delete")
+@receiver(post_delete, sender=Tipo, dispatch_uid="tipo_name_index_delete")
+@receiver(post_delete, sender=Movimiento, dispatch_uid="movimiento_name_index_delete")
+def remove_from_name_index(sender, instance, **kwargs):
+    name_index.remove(sender._meta.model_name, instance.pk)
+
+
+@receiver(post_delete, sender=Captura, dispatch_uid="captura_counter_release")
+def release_captura(sender, instance, **kwargs):
+    liberar_contador(instance.user_id)
+
+
+@receiver(post_save, sender=Tipo, dispatch_uid="tipo_type_chart_save")
+@receiver(post_delete, sender=Tipo, dispatch_uid="tipo_type_chart_delete")
+@receiver(post_save, sender=Efectividad, dispatch_uid="efectividad_type_chart_save")
+@receiver(post_delete, sender=Efectividad, dispatch_uid="efectividad_type_chart_delete")
+def reset_type_chart(sender, **kwargs):
+    invalidate_type_chart()
+
+
+# ============================================================
+# 🔹 CACHÉ DE LECTURAS DEL CATÁLOGO
+# ============================================================
+# Se invalida al confirmar la transacción: si se borrara antes, una lectura
+# concurrente podría volver a cachear la fila aún sin confirmar.
+@receiver(post_save, sender=Pokemon, dispatch_uid="pokemon_catalog_cache_save")
+@receiver(post_delete, sender=Pokemon, dispatch_uid="pokemon_catalog_cache_delete")
+def invalidate_pokemon_cache(sender, instance, **kwargs):
+    transaction.on_commit(partial(catalog_cache.invalidate, "pokemon", [instance.pk]))
+
+
+@receiver(post_save, sender=Movimiento, dispatch_uid="movimiento_catalog_cache_save")
+@receiver(post_delete, sender=Movimiento, dispatch_uid="movimiento_catalog_cache_delete")
+def invalidate_movimiento_cache(sender, instance, **kwargs):
+    transaction.on_commit(partial(catalog_cache.invalidate, "movimiento", [instance.pk]))
+
+
+@receiver(post_save, sender=Tipo, dispatch_uid="tipo_catalog_cache_save")
+@receiver(post_delete, sender=Tipo, dispatch_uid="tipo_catalog_cache_delete")
+def invalidate_tipo_cache(sender, instance, **kwargs):
+    """Pokémon y movimientos incrustan el tipo: se invalidan también los de ese tipo."""
+    def invalidate():
+        catalog_cache.invalidate("tipo", [instance.pk])
+        catalog_cache.invalidate(
+            "pokemon", list(Pokemon.objects.filter(tipo_id=instance.pk).values_list("pk", flat=True))
+        )
+        catalog_cache.invalidate(
+            "movimiento", list(Movimiento.objects.filter(tipo_id=instance.pk).values_list("pk", flat=True))
+        )
+
+    transaction.on_commit(invalidate)
+
+
+# ============================================================
+# 🔹 RESUMEN DE MOVIMIENTOS
+# ============================================================
+# Se recalcula dentro de la misma transacción que cambia los movimientos;
+# la caché se invalida al confirmar (ver ``refresh_move_summaries``).
+@receiver(m2m_changed, sender=Pokemon.movimientos.through, dispatch_uid="pokemon_moves_changed")
+def refresh_moves_on_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and reverse:
+        # Desde el movimiento: después del clear ya no se sabe qué Pokémon lo tenían
+        instance._cleared_pokemon_ids = list(instance.pokemons.values_list("pk", flat=True))
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        refresh_move_summaries([instance.pk])
+    elif action == "post_clear":
+        refresh_move_summaries(instance.__dict__.pop("_cleared_pokemon_ids", ()))
+    else:
+        refresh_move_summaries(pk_set)
+
+
+@receiver(post_save, sender=Movimiento, dispatch_uid="movimiento_move_summaries_save")
+def refresh_moves_on_movimiento_save(sender, instance, created, **kwargs):
+    # Potencia o tipo nuevos; además el detalle de esos Pokémon incrusta el movimiento
+    if not created:
+        refresh_move_summaries(instance.pokemons.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Movimiento, dispatch_uid="movimiento_move_summaries_pre_delete")
+def remember_movimiento_pokemons(sender, instance, **kwargs):
+    # El borrado en cascada de la tabla intermedia no emite m2m_changed
+    instance._deleted_pokemon_ids = list(instance.pokemons.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Movimiento, dispatch_uid="movimiento_move_summaries_delete")
+def refresh_moves_on_movimiento_delete(sender, instance, **kwargs):
+    refresh_move_summaries(instance.__dict__.pop("_deleted_pokemon_ids", ()))
+
+
+# ============================================================
+# 🔹 RANKINGS DE BATALLAS
+# ============================================================
+@receiver(post_save, sender=Pokemon, dispatch_uid="pokemon_ranking_tipo")
+def sync_ranking_tipo(sender, instance, created, **kwargs):
+    # Copia del tipo para los rankings por tipo; un Pokémon nuevo no tiene fila
+    if not created:
+        RankingBatalla.objects.filter(pk=instance.pk).exclude(tipo_id=instance.tipo_id).update(
+            tipo_id=instance.tipo_id,
+        )
+
+
+@receiver(post_delete, sender=Batalla, dispatch_uid="batalla_ranking_delete")
+def discount_battle(sender, instance, **kwargs):
+    # También al borrar un Pokémon: sus batallas se borran en cascada
+    unrecord_battle(instance)
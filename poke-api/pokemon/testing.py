@@ -0,0 +1,206 @@
+"""
+testing.py
+----------
+Utilidades compartidas por las pruebas del módulo Pokémon.
+
+ - ``StubPokeApiServer``: servidor HTTP local que imita la PokeAPI v2
+   (``/pokemon/``, ``/type/``, ``/move/``) y cuenta las peticiones recibidas.
+ - Generadores de respuestas con la misma forma que la PokeAPI.
+ - ``QueryCountMixin``: aserciones de número de consultas constante por
+   endpoint (detecta regresiones N+1).
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+
+# ============================================================
+# 🔹 RESPUESTAS CON FORMA DE POKEAPI
+# ============================================================
+def pokemon_payload(name, pokemon_id=1, tipo="normal", hp=50, attack=50, defense=50, moves=()):
+    return {
+        "id": pokemon_id,
+        "name": name,
+        "types": [{"slot": 1, "type": {"name": tipo}}],
+        "stats": [
+            {"base_stat": hp, "stat": {"name": "hp"}},
+            {"base_stat": attack, "stat": {"name": "attack"}},
+            {"base_stat": defense, "stat": {"name": "defense"}},
+        ],
+        "sprites": {"front_default": f"https://img.pokeapi.local/{pokemon_id}.png"},
+        "moves": [{"move": {"name": move}} for move in moves],
+    }
+
+
+def tipo_payload(name, tipo_id=1):
+    return {"id": tipo_id, "name": name}
+
+
+def tipo_relations_payload(name, tipo_id, double=(), half=(), none=()):
+    """``/type/<name>/`` con ``damage_relations`` (solo las relaciones de ataque)."""
+    def refs(names):
+        return [{"name": target} for target in names]
+
+    return {
+        "id": tipo_id,
+        "name": name,
+        "damage_relations": {
+            "double_damage_to": refs(double),
+            "half_damage_to": refs(half),
+            "no_damage_to": refs(none),
+        },
+    }
+
+
+def movimiento_payload(name, tipo="normal", power=40, pp=35, accuracy=100, move_id=1):
+    return {
+        "id": move_id,
+        "name": name,
+        "power": power,
+        "pp": pp,
+        "accuracy": accuracy,
+        "type": {"name": tipo},
+    }
+
+
+# ============================================================
+# 🔹 SERVIDOR STUB
+# ============================================================
+class StubPokeApiServer:
+    """
+    Servidor HTTP en un hilo que responde como la PokeAPI.
+
+    ``routes`` asocia rutas (``"pokemon/pikachu"``) con el JSON a devolver;
+    cualquier otra ruta responde 404. ``delay`` simula latencia de red y
+    ``fail_first`` responde 503 a las primeras N peticiones.
+
+    Uso::
+
+        with StubPokeApiServer({"pokemon/pikachu": pokemon_payload("pikachu")}) as stub:
+            with override_settings(POKEAPI_CLIENT={"BASE_URL": stub.base_url}):
+                ...
+            assert stub.hits["pokemon/pikachu"] == 1
+    """
+
+    def __init__(self, routes=None, delay=0.0, fail_first=0):
+        self.routes = dict(routes or {})
+        self.delay = delay
+        self.fail_first = fail_first
+        self.hits = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v2/"
+
+    @property
+    def total_hits(self):
+        return sum(self.hits.values())
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0].strip("/")
+                if path.startswith("api/v2/"):
+                    path = path[len("api/v2/"):]
+
+                with stub._lock:
+                    stub.hits[path] += 1
+                    failing = stub.fail_first > 0
+                    if failing:
+                        stub.fail_first -= 1
+
+                if stub.delay:
+                    time.sleep(stub.delay)
+
+                if failing:
+                    self._send(503, {"detail": "unavailable"})
+                elif path in stub.routes:
+                    self._send(200, stub.routes[path])
+                else:
+                    self._send(404, {"detail": "Not found."})
+
+            def _send(self, code, payload):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ============================================================
+# 🔹 CONTEO DE CONSULTAS
+# ============================================================
+class QueryCountMixin:
+    """
+    Mixin para ``TestCase`` que verifica que un endpoint ejecuta el mismo
+    número de consultas sin importar cuántas filas devuelve.
+
+    Ejemplo::
+
+        self.assertConstantQueries(
+            "/api/pokemon/pokemons/",
+            populate=lambda total: crear_pokemons_hasta(total),
+            sizes=(1, 10, 100),
+            expected=1,
+        )
+    """
+
+    def count_queries(self, url, client=None):
+        client = client or APIClient()
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        return len(context.captured_queries), context.captured_queries
+
+    def assertConstantQueries(self, url, populate, sizes=(1, 10, 100), expected=None, client=None):
+        """``populate(total)`` debe dejar al menos ``total`` filas antes de cada medición."""
+        counts = {}
+        for size in sizes:
+            populate(size)
+            counts[size], queries = self.count_queries(url, client)
+
+        detail = "\n".join(query["sql"] for query in queries)
+        self.assertEqual(
+            len(set(counts.values())), 1,
+            f"{url} ejecuta un número de consultas que crece con los datos: {counts}\n{detail}",
+        )
+        if expected is not None:
+            self.assertEqual(
+                counts[sizes[-1]], expected,
+                f"{url} ejecuta {counts[sizes[-1]]} consultas (se esperaban {expected}):\n{detail}",
+            )
@@ -1,3 +1,1893 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import io
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock, skipIf
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection, connections
+from django.db.models import F
+from django.test import AsyncRequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from poke_api import metrics
+from poke_api.backends.sqlite3.base import DatabaseWrapper
+from poke_api.settings.database import database_from_env
+from pokemon.api import async_views
+from pokemon.cache import catalog_cache
+from pokemon.benchmarks import endpoints
+from pokemon.benchmarks import filters as filters_benchmark
+from pokemon.battle import (
+    Combatant,
+    effectiveness,
+    get_type_chart,
+    mask_types,
+    simulate,
+    simulate_many,
+    type_mask,
+)
+from pokemon.clients import AsyncPokeApiClient, PokeApiClient, PokeApiError, ResponseCache, reset_client
+from pokemon.filters import CatalogOrderingFilter
+from pokemon.api.battle_viewset import RecordedBattleThrottle
+from pokemon.api.movimiento_viewset import MovimientoSerializer, MovimientoViewSet
+from pokemon.api.pokenmon_viewset import PokemonSerializer, PokemonViewSet
+from pokemon.api.tipo_viewset import TipoSerializer, TipoViewSet
+from pokemon.models import (
+    MAX_CAPTURAS,
+    Batalla,
+    Bloqueo,
+    Captura,
+    Efectividad,
+    Movimiento,
+    Pokemon,
+    RankingBatalla,
+    Tipo,
+)
+from pokemon.serializers import (
+    FastMovimientoSerializer,
+    FastPokemonSerializer,
+    FastTipoSerializer,
+    ValuesSerializer,
+)
+from pokemon.services import (
+    LockTimeout,
+    NameSearchIndex,
+    RandomPokemonIndex,
+    SingleFlight,
+    SnapshotError,
+    advisory_lock,
+    build_snapshot,
+    link_movimientos,
+    load_snapshot,
+    name_index,
+    random_index,
+    record_battle,
+    resolve_tipos,
+    search_names,
+    top_pokemon,
+)
+from pokemon.services.importer import _fetch_pokemon_locked
+from pokemon.services.name_index import similarity, trigrams
+from pokemon.services.rankings import ranking_queryset
+from pokemon.urls import detail_pk
+from pokemon.testing import (
+    QueryCountMixin,
+    StubPokeApiServer,
+    movimiento_payload,
+    pokemon_payload,
+    tipo_payload,
+    tipo_relations_payload,
+)
+
+
+# La caché de lecturas se invalida en ``on_commit``, que nunca se ejecuta
+# dentro de un ``TestCase``: se desactiva para todo el módulo y solo
+# ``CatalogCacheTests`` la activa.
+_catalog_cache_disabled = override_settings(CATALOG_CACHE={"ENABLED": False})
+
+
+def setUpModule():
+    _catalog_cache_disabled.enable()
+
+
+def tearDownModule():
+    _catalog_cache_disabled.disable()
+
+
+def stub_settings(stub, **extra):
+    """Configuración del cliente apuntando al servidor stub, sin caché en disco."""
+    return override_settings(POKEAPI_CLIENT={
+        "BASE_URL": stub.base_url,
+        "BACKOFF_FACTOR": 0,
+        "CACHE_DIR": None,
+        **extra,
+    })
+
+
+# ============================================================
+# 🔹 CLIENTE POKEAPI
+# ============================================================
+class ResponseCacheTests(TestCase):
+    def test_lru_evicts_least_recently_used(self):
+        cache = ResponseCache(ttl=60, max_entries=2)
+        cache.set("pokemon/a", {"name": "a"})
+        cache.set("pokemon/b", {"name": "b"})
+        cache.get("pokemon/a")
+        cache.set("pokemon/c", {"name": "c"})
+
+        self.assertIsNotNone(cache.get("pokemon/a"))
+        self.assertIsNone(cache.get("pokemon/b"))
+        self.assertIsNotNone(cache.get("pokemon/c"))
+
+    def test_expired_entries_are_misses(self):
+        cache = ResponseCache(ttl=0, max_entries=2)
+        cache.set("pokemon/a", {"name": "a"})
+        self.assertIsNone(cache.get("pokemon/a"))
+
+    def test_disk_level_survives_new_instances_and_is_bounded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(ttl=60, max_entries=2, directory=directory)
+            for name in ("a", "b", "c"):
+                cache.set(f"pokemon/{name}", {"name": name})
+
+            reloaded = ResponseCache(ttl=60, max_entries=2, directory=directory)
+            self.assertIsNone(reloaded.get("pokemon/a"))
+            self.assertEqual(reloaded.get("pokemon/c"), {"name": "c"})
+
+
+class PokeApiClientTests(TestCase):
+    def test_repeated_lookups_hit_upstream_once(self):
+        with StubPokeApiServer({"pokemon/pikachu": pokemon_payload("pikachu")}) as stub:
+            client = PokeApiClient(base_url=stub.base_url, backoff_factor=0)
+            self.assertEqual(client.pokemon("Pikachu")["name"], "pikachu")
+            self.assertEqual(client.pokemon(" pikachu ")["name"], "pikachu")
+            self.assertEqual(stub.hits["pokemon/pikachu"], 1)
+
+    def test_retries_transient_errors(self):
+        with StubPokeApiServer({"type/fire": tipo_payload("fire")}, fail_first=2) as stub:
+            client = PokeApiClient(base_url=stub.base_url, retries=3, backoff_factor=0)
+            self.assertEqual(client.tipo("fire")["name"], "fire")
+            self.assertEqual(stub.hits["type/fire"], 3)
+
+    def test_not_found_returns_none_and_exhausted_retries_raise(self):
+        with StubPokeApiServer(fail_first=10) as stub:
+            client = PokeApiClient(base_url=stub.base_url, retries=1, backoff_factor=0)
+            with self.assertRaises(PokeApiError):
+                client.movimiento("tackle")
+
+        with StubPokeApiServer() as stub:
+            client = PokeApiClient(base_url=stub.base_url, backoff_factor=0)
+            self.assertIsNone(client.pokemon("missingno"))
+
+
+    def test_async_client_does_not_block_the_event_loop_on_the_cache(self):
+        cache = ResponseCache(ttl=60, max_entries=10)
+        cache.set("pokemon/pikachu", {"name": "pikachu"})
+
+        async def scenario():
+            client = AsyncPokeApiClient(
+                base_url="http://127.0.0.1:9/", timeouts=None, retries=0, backoff_factor=0,
+                max_connections=1, cache=cache, enabled=False,
+            )
+            self.assertEqual(await client.pokemon("pikachu"), {"name": "pikachu"})
+
+            # Otro hilo retiene el lock de la caché (p. ej. leyendo del disco)
+            cache._lock.acquire()
+            threading.Timer(0.2, cache._lock.release).start()
+            lookup = asyncio.ensure_future(client.pokemon("pikachu"))
+            ticks = 0
+            while not lookup.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            await client.aclose()
+            return ticks, lookup.result()
+
+        ticks, data = asyncio.run(scenario())
+        self.assertEqual(data, {"name": "pikachu"})
+        self.assertGreater(ticks, 5)
+
+
+class RemoteFallbackTests(TestCase):
+    def setUp(self):
+        self.api = APIClient()
+
+    def test_pokemon_retrieve_imports_from_upstream(self):
+        routes = {"pokemon/charizard": pokemon_payload("charizard", 6, "fire", 78, 84, 78)}
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            response = self.api.get("/api/pokemon/pokemons/charizard/")
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(response.data["tipo"]["name"], "fire")
+
+            Pokemon.objects.all().delete()
+            response = self.api.get("/api/pokemon/pokemons/charizard/")
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(stub.hits["pokemon/charizard"], 1)
+
+    def test_pokemon_retrieve_unknown_and_unreachable(self):
+        with StubPokeApiServer() as stub, stub_settings(stub):
+            response = self.api.get("/api/pokemon/pokemons/missingno/")
+            self.assertEqual(response.status_code, 404)
+
+        with StubPokeApiServer(fail_first=10) as stub, stub_settings(stub, RETRIES=0):
+            response = self.api.get("/api/pokemon/pokemons/missingno/")
+            self.assertEqual(response.status_code, 503)
+
+    def test_tipo_and_movimiento_retrieve_use_client(self):
+        routes = {
+            "type/water": tipo_payload("water"),
+            "move/surf": movimiento_payload("surf", "water", power=90, pp=15),
+        }
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            self.assertEqual(self.api.get("/api/pokemon/tipos/water/").status_code, 201)
+            self.assertEqual(self.api.get("/api/pokemon/movimientos/surf/").status_code, 201)
+
+        self.assertTrue(Tipo.objects.filter(name="water").exists())
+        self.assertEqual(Movimiento.objects.get(name="surf").tipo.name, "water")
+
+    def test_tipo_and_movimiento_inserted_concurrently_are_reused(self):
+        routes = {
+            "type/water": tipo_payload("water"),
+            "move/surf": movimiento_payload("surf", "water", power=90, pp=15),
+        }
+        water = Tipo.objects.create(name="Water")
+        surf = Movimiento.objects.create(name="Surf", power=90, pp=15, tipo=water)
+        # La lectura local falló antes de que otra petición insertara las filas
+        with StubPokeApiServer(routes) as stub, stub_settings(stub), \
+                mock.patch.object(TipoViewSet, "fast_detail", return_value=None), \
+                mock.patch.object(MovimientoViewSet, "fast_detail", return_value=None):
+            tipo = self.api.get("/api/pokemon/tipos/water/")
+            movimiento = self.api.get("/api/pokemon/movimientos/surf/")
+
+        self.assertEqual((tipo.status_code, tipo.data["id"]), (201, water.pk))
+        self.assertEqual((movimiento.status_code, movimiento.data["id"]), (201, surf.pk))
+        self.assertEqual((Tipo.objects.count(), Movimiento.objects.count()), (1, 1))
+
+    def test_random_imports_when_catalog_is_empty(self):
+        routes = {f"pokemon/{i}": pokemon_payload(f"poke-{i}", i) for i in range(1, 152)}
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            response = self.api.get("/api/pokemon/random/")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Pokemon.objects.count(), 1)
+
+
+# ============================================================
+# 🔹 SINGLE-FLIGHT
+# ============================================================
+class SingleFlightTests(TestCase):
+    def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "charizard"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            leader = pool.submit(flight.do, "charizard", work)
+            started.wait(5)
+            followers = [pool.submit(flight.do, "charizard", work) for _ in range(7)]
+            time.sleep(0.1)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        self.assertEqual(results, ["charizard"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_errors_propagate_to_waiters(self):
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do("x", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        self.assertEqual(flight.do("x", lambda: 1), 1)
+
+
+class AdvisoryLockTests(TransactionTestCase):
+    """En SQLite el lock entre procesos es una fila de ``Bloqueo``."""
+
+    def in_thread(self, fn):
+        def target():
+            try:
+                return fn()
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(target).result()
+
+    def try_lock(self, key, timeout=0.2):
+        try:
+            with advisory_lock(key, timeout=timeout):
+                return True
+        except LockTimeout:
+            return False
+
+    def test_other_holders_wait_until_release(self):
+        with advisory_lock("pokemon:mew"):
+            self.assertFalse(self.in_thread(lambda: self.try_lock("pokemon:mew")))
+            self.assertTrue(self.in_thread(lambda: self.try_lock("pokemon:pikachu")))
+        self.assertTrue(self.in_thread(lambda: self.try_lock("pokemon:mew")))
+        self.assertFalse(Bloqueo.objects.exists())
+
+    def test_expired_locks_are_taken_over(self):
+        Bloqueo.objects.create(key="pokemon:mew", token="x", expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertTrue(self.try_lock("pokemon:mew", timeout=0))
+
+    def test_processes_without_shared_memory_fetch_upstream_once(self):
+        # Sin SingleFlight, como dos procesos: solo el lock los coordina
+        routes = {"pokemon/charizard": pokemon_payload("charizard", 6, "fire", 78, 84, 78)}
+        barrier = threading.Barrier(2)
+
+        def fetch(_):
+            barrier.wait(5)
+            try:
+                pokemon, created = _fetch_pokemon_locked("charizard")
+                return pokemon.name, created
+            finally:
+                connection.close()
+
+        with StubPokeApiServer(routes, delay=0.3) as stub, stub_settings(stub):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = sorted(pool.map(fetch, range(2)), key=lambda result: result[1])
+
+        self.assertEqual(results, [("charizard", False), ("charizard", True)])
+        self.assertEqual(stub.hits["pokemon/charizard"], 1)
+
+
+class ConcurrentMissLoadTests(TransactionTestCase):
+    """N peticiones simultáneas de un Pokémon ausente → 1 descarga, N respuestas OK."""
+
+    concurrency = 50
+
+    def test_concurrent_misses_fetch_upstream_once(self):
+        routes = {"pokemon/charizard": pokemon_payload("charizard", 6, "fire", 78, 84, 78)}
+        barrier = threading.Barrier(self.concurrency)
+
+        def hit(_):
+            barrier.wait(5)
+            try:
+                return APIClient().get("/api/pokemon/pokemons/charizard/").status_code
+            finally:
+                connection.close()
+
+        with StubPokeApiServer(routes, delay=0.3) as stub, stub_settings(stub):
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                statuses = list(pool.map(hit, range(self.concurrency)))
+
+        self.assertEqual(stub.hits["pokemon/charizard"], 1)
+        self.assertTrue(all(code in (200, 201) for code in statuses), statuses)
+        self.assertEqual(Pokemon.objects.filter(name="charizard").count(), 1)
+
+
+# ============================================================
+# 🔹 VISTAS ASÍNCRONAS
+# ============================================================
+class AsyncViewTests(TestCase):
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+
+    async def test_pokemon_detail_imports_and_then_delegates(self):
+        routes = {"pokemon/charizard": pokemon_payload("charizard", 6, "fire", 78, 84, 78)}
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            request = self.factory.get("/api/pokemon/pokemons/charizard/")
+            response = await async_views.pokemon_detail(request, pk="charizard")
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(json.loads(response.content)["tipo"]["name"], "fire")
+
+            # Ya existe: responde el viewset síncrono, sin ir a la PokeAPI
+            request = self.factory.get("/api/pokemon/pokemons/Charizard/", {"fields": "name"})
+            response = await async_views.pokemon_detail(request, pk="Charizard")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(json.loads(response.content), {"name": "charizard"})
+            self.assertEqual(stub.hits["pokemon/charizard"], 1)
+
+    async def test_pokemon_detail_unknown_and_unreachable(self):
+        with StubPokeApiServer() as stub, stub_settings(stub):
+            response = await async_views.pokemon_detail(self.factory.get("/"), pk="missingno")
+            self.assertEqual(response.status_code, 404)
+
+        with StubPokeApiServer(fail_first=10) as stub, stub_settings(stub, RETRIES=0):
+            response = await async_views.pokemon_detail(self.factory.get("/"), pk="missingno")
+            self.assertEqual(response.status_code, 503)
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        routes = {"pokemon/mew": pokemon_payload("mew", 151, "psychic")}
+        with StubPokeApiServer(routes, delay=0.2) as stub, stub_settings(stub):
+            responses = await asyncio.gather(*(
+                async_views.pokemon_detail(self.factory.get("/"), pk="mew") for _ in range(20)
+            ))
+
+        self.assertEqual(stub.hits["pokemon/mew"], 1)
+        self.assertTrue(all(response.status_code in (200, 201) for response in responses))
+        self.assertEqual(await Pokemon.objects.filter(name="mew").acount(), 1)
+
+    async def test_tipo_and_movimiento_detail(self):
+        routes = {
+            "type/water": tipo_payload("water"),
+            "move/surf": movimiento_payload("surf", "water", power=90, pp=15),
+        }
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            response = await async_views.tipo_detail(self.factory.get("/"), pk="water")
+            self.assertEqual(response.status_code, 201)
+            response = await async_views.movimiento_detail(self.factory.get("/"), pk="surf")
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(json.loads(response.content)["tipo"]["name"], "water")
+
+        movimiento = await Movimiento.objects.select_related("tipo").aget(name="surf")
+        self.assertEqual(movimiento.tipo.name, "water")
+
+    async def test_random_imports_when_catalog_is_empty(self):
+        routes = {f"pokemon/{i}": pokemon_payload(f"poke-{i}", i) for i in range(1, 152)}
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            response = await async_views.random_pokemon(self.factory.get("/", {"count": "1"}))
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(len(json.loads(response.content)), 1)
+
+            response = await async_views.random_pokemon(self.factory.get("/"))
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(stub.total_hits, 1)
+
+    async def test_random_rejects_non_ascii_count(self):
+        response = await async_views.random_pokemon(self.factory.get("/", {"count": "²"}))
+        self.assertEqual(response.status_code, 400)
+
+    def test_detail_routes_leave_list_actions_to_the_router(self):
+        class ExtendedTipoViewSet(TipoViewSet):
+            @action(detail=False, methods=["get"], url_path="chart.v2")
+            def chart(self, request):
+                pass
+
+        for viewset, actions in ((PokemonViewSet, ("batch", "random")), (ExtendedTipoViewSet, ("matrix", "chart.v2"))):
+            pattern = re.compile(detail_pk(viewset))
+            for name in actions:
+                self.assertIsNone(pattern.fullmatch(name), name)
+                self.assertIsNone(pattern.fullmatch(f"{name}/"), name)
+            self.assertEqual(pattern.fullmatch("charizard")["pk"], "charizard")
+            self.assertEqual(pattern.fullmatch("batches")["pk"], "batches")
+        self.assertEqual(re.fullmatch(detail_pk(MovimientoViewSet), "25")["pk"], "25")
+
+
+# ============================================================
+# 🔹 SELECCIÓN ALEATORIA
+# ============================================================
+def create_pokemons(count, tipo_name="normal", start=0):
+    tipo, _ = Tipo.objects.get_or_create(name=tipo_name)
+    return Pokemon.objects.bulk_create(
+        Pokemon(
+            name=f"poke-{i}",
+            hp=40 + i % 60,
+            attack=40 + i % 70,
+            defense=40 + i % 50,
+            image=f"https://img.pokeapi.local/{i}.png",
+            tipo=tipo,
+        )
+        for i in range(start, start + count)
+    )
+
+
+class RandomPokemonIndexTests(TestCase):
+    def test_add_and_remove_keep_index_dense(self):
+        pokemons = create_pokemons(5)
+        index = RandomPokemonIndex()
+        self.assertEqual(len(index), 5)
+
+        index.remove(pokemons[1].pk)
+        index.remove(pokemons[4].pk)
+        index.add(999)
+        self.assertCountEqual(
+            index.sample_pks(10),
+            [pokemons[0].pk, pokemons[2].pk, pokemons[3].pk, 999],
+        )
+
+    def test_sample_recovers_from_stale_pks(self):
+        pokemons = create_pokemons(3)
+        index = RandomPokemonIndex()
+        index.add(pokemons[0].pk)
+        len(index)
+        Pokemon.objects.filter(pk=pokemons[0].pk).delete()
+
+        self.assertEqual(len(index.sample(3)), 2)
+        # El PK borrado sale del índice; el resto se recarga en el próximo uso
+        self.assertEqual(len(index._pks), 2)
+        self.assertTrue(index._stale)
+
+    def test_stale_index_is_served_while_reloading_in_background(self):
+        pokemons = create_pokemons(3)
+        index = RandomPokemonIndex()
+        index.reload()
+        release = threading.Event()
+
+        def slow_build():
+            release.wait(5)
+            return [pokemon.pk for pokemon in pokemons[:2]]
+
+        index.invalidate()
+        with mock.patch.object(index, "_build", slow_build):
+            with self.assertNumQueries(0):
+                self.assertEqual(len(index.sample_pks(10)), 3)
+            # Llega durante la recarga: se aplica también al índice nuevo
+            index.add(999)
+            release.set()
+            deadline = time.monotonic() + 5
+            while index._reloading and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertFalse(index._reloading)
+        self.assertCountEqual(index.sample_pks(10), [pokemons[0].pk, pokemons[1].pk, 999])
+
+
+class RandomPokemonEndpointTests(TestCase):
+    def setUp(self):
+        self.api = APIClient()
+
+    def test_single_random_is_one_query_once_index_is_warm(self):
+        create_pokemons(20)
+        # Síncrono: un hilo de recarga no vería las filas de la transacción del test
+        random_index.reload()
+        self.api.get("/api/pokemon/random/")
+
+        with self.assertNumQueries(1):
+            response = self.api.get("/api/pokemon/random/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("tipo", response.data)
+
+    def test_count_returns_distinct_pokemons(self):
+        create_pokemons(20)
+        random_index.reload()
+        response = self.api.get("/api/pokemon/random/?count=2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len({p["id"] for p in response.data}), 2)
+
+        response = self.api.get("/api/pokemon/random/?count=50")
+        self.assertEqual(len(response.data), 20)
+
+    def test_invalid_count_is_rejected(self):
+        for count in ("0", "51", "dos"):
+            response = self.api.get(f"/api/pokemon/random/?count={count}")
+            self.assertEqual(response.status_code, 400)
+
+
+# ============================================================
+# 🔹 MOTOR DE BATALLA
+# ============================================================
+class BattleEngineTests(TestCase):
+    def setUp(self):
+        call_command("import_type_chart", "--builtin", stdout=io.StringIO())
+        self.charizard = Combatant("charizard", "fire", 78, 84, 78)
+        self.venusaur = Combatant("venusaur", "grass", 80, 82, 83)
+
+    def test_type_chart_lookups(self):
+        self.assertEqual(effectiveness("fire", "grass"), 2)
+        self.assertEqual(effectiveness("water", "fire"), 2)
+        self.assertEqual(effectiveness("electric", "ground"), 0)
+        self.assertEqual(effectiveness("Fire", "unknown-type"), 1)
+
+    def test_single_battle_is_reproducible_with_seed(self):
+        first = simulate(self.charizard, self.venusaur, random.Random(7))
+        second = simulate(self.charizard, self.venusaur, random.Random(7))
+        self.assertEqual(first, second)
+        self.assertEqual(first["log"][-1]["target_hp"], 0)
+
+    def test_monte_carlo_counts_add_up(self):
+        stats = simulate_many(self.charizard, self.venusaur, 100_000, seed=1)
+        self.assertEqual(stats["attacker_wins"] + stats["defender_wins"] + stats["draws"], 100_000)
+        self.assertGreater(stats["attacker_win_rate"], 0.9)
+
+    def test_mutual_immunity_is_a_draw(self):
+        ghost = Combatant("gengar", "ghost", 60, 65, 60)
+        normal = Combatant("snorlax", "normal", 160, 110, 65)
+        self.assertEqual(simulate_many(ghost, normal, 10)["draws"], 10)
+        self.assertIsNone(simulate(ghost, normal)["winner"])
+
+
+class BattleEndpointTests(TestCase):
+    def setUp(self):
+        call_command("import_type_chart", "--builtin", stdout=io.StringIO())
+        fire = Tipo.objects.get(name="fire")
+        grass = Tipo.objects.get(name="grass")
+        Pokemon.objects.create(name="charizard", hp=78, attack=84, defense=78, image="https://x/6.png", tipo=fire)
+        Pokemon.objects.create(name="venusaur", hp=80, attack=82, defense=83, image="https://x/3.png", tipo=grass)
+        self.api = APIClient()
+
+    def test_single_run_returns_turn_log(self):
+        response = self.api.post(
+            "/api/pokemon/battles/simulate/",
+            {"attacker": "charizard", "defender": "venusaur", "seed": 3},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(response.data["winner"], ("charizard", "venusaur"))
+        self.assertTrue(response.data["log"])
+
+    def test_monte_carlo_runs(self):
+        response = self.api.post(
+            "/api/pokemon/battles/simulate/",
+            {"attacker": "venusaur", "defender": "charizard", "runs": 5000, "seed": 3},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["runs"], 5000)
+        self.assertLess(response.data["attacker_win_rate"], 0.5)
+
+    def test_unknown_pokemon_and_invalid_runs(self):
+        response = self.api.post(
+            "/api/pokemon/battles/simulate/",
+            {"attacker": "charizard", "defender": "mew"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 404)
+
+        response = self.api.post(
+            "/api/pokemon/battles/simulate/",
+            {"attacker": "charizard", "defender": "venusaur", "runs": 0},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+# ============================================================
+# 🔹 TABLA DE EFECTIVIDAD
+# ============================================================
+class TypeChartTests(TestCase):
+    def test_import_from_pokeapi(self):
+        routes = {
+            "type": {"results": [{"name": "fire"}, {"name": "water"}, {"name": "grass"}, {"name": "shadow"}]},
+            "type/fire": tipo_relations_payload("fire", 10, double=["grass"], half=["fire", "water"]),
+            "type/water": tipo_relations_payload("water", 11, double=["fire"], half=["water", "grass"]),
+            "type/grass": tipo_relations_payload("grass", 12, double=["water"], half=["fire", "grass"]),
+            "type/shadow": tipo_relations_payload("shadow", 10002),
+        }
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            call_command("import_type_chart", stdout=io.StringIO())
+
+        self.assertEqual(Efectividad.objects.count(), 9)
+        self.assertFalse(Tipo.objects.filter(name="shadow").exists())
+        self.assertEqual(effectiveness("fire", "grass"), 2)
+        self.assertEqual(effectiveness("grass", "fire"), 0.5)
+
+    def test_matrix_is_indexed_by_tipo_id_and_invalidated_on_write(self):
+        call_command("import_type_chart", "--builtin", stdout=io.StringIO())
+        fire = Tipo.objects.get(name="fire")
+        ice = Tipo.objects.get(name="ice")
+        chart = get_type_chart()
+        self.assertEqual(chart.matrix[fire.id, ice.id], 2)
+        self.assertIs(get_type_chart(), chart)
+
+        Efectividad.objects.filter(atacante=fire, defensor=ice).update(multiplicador=4)
+        Efectividad.objects.get(atacante=fire, defensor=ice).save()
+        self.assertEqual(get_type_chart().matrix[fire.id, ice.id], 4)
+
+    def test_matrix_endpoint(self):
+        call_command("import_type_chart", "--builtin", stdout=io.StringIO())
+        response = APIClient().get("/api/pokemon/tipos/matrix/")
+
+        self.assertEqual(response.status_code, 200)
+        names = [tipo["name"] for tipo in response.data["tipos"]]
+        self.assertEqual(len(response.data["matrix"]), 18)
+        row = response.data["matrix"][names.index("electric")]
+        self.assertEqual(row[names.index("ground")], 0)
+
+
+# ============================================================
+# 🔹 IMPORTACIÓN MASIVA
+# ============================================================
+class ImportPokedexTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.checkpoint = f"{self.tmp.name}/checkpoint.json"
+        self.routes = {
+            f"pokemon/{i}": pokemon_payload(f"poke-{i}", i, ("fire", "water", "grass")[i % 3], hp=i)
+            for i in range(1, 31)
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_import(self, *args):
+        out = io.StringIO()
+        call_command("import_pokedex", "--checkpoint", self.checkpoint, *args, stdout=out)
+        return out.getvalue()
+
+    def test_imports_range_concurrently_in_batches(self):
+        with StubPokeApiServer(self.routes) as stub, stub_settings(stub):
+            output = self.run_import("--range", "1-35", "--workers", "4", "--batch-size", "8")
+
+        self.assertEqual(Pokemon.objects.count(), 30)
+        self.assertEqual(Tipo.objects.count(), 3)
+        self.assertEqual(Pokemon.objects.get(name="poke-7").tipo.name, "water")
+        self.assertIn("5 inexistentes", output)
+        self.assertIn("p99=", output)
+
+    def test_resumes_from_checkpoint_and_upserts(self):
+        with StubPokeApiServer(self.routes) as stub, stub_settings(stub):
+            self.run_import("--range", "1-10")
+            self.run_import("--range", "1-20")
+            self.assertEqual(stub.hits["pokemon/5"], 1)
+            self.assertEqual(stub.total_hits, 20)
+
+            stub.routes["pokemon/5"] = pokemon_payload("poke-5", 5, "fire", hp=99)
+            reset_client()
+            self.run_import("--range", "5", "--restart")
+
+        self.assertEqual(Pokemon.objects.count(), 20)
+        self.assertEqual(Pokemon.objects.get(name="poke-5").hp, 99)
+
+    def test_imports_from_local_mirror(self):
+        mirror = Path(self.tmp.name) / "mirror"
+        (mirror / "pokemon" / "2").mkdir(parents=True)
+        (mirror / "pokemon" / "1.json").write_text(json.dumps(self.routes["pokemon/1"]))
+        (mirror / "pokemon" / "2" / "index.json").write_text(json.dumps(self.routes["pokemon/2"]))
+
+        self.run_import("--range", "1-3", "--source", str(mirror))
+        self.assertCountEqual(Pokemon.objects.values_list("name", flat=True), ["poke-1", "poke-2"])
+
+
+# ============================================================
+# 🔹 MOVIMIENTOS DE CADA POKÉMON
+# ============================================================
+class MovesetTests(TestCase):
+    def setUp(self):
+        self.api = APIClient()
+        self.routes = {
+            "pokemon/charmander": pokemon_payload(
+                "charmander", 4, "fire", moves=("scratch", "ember", "flamethrower", "missing-move"),
+            ),
+            "pokemon/squirtle": pokemon_payload("squirtle", 7, "water", moves=("scratch", "water-gun")),
+            "move/scratch": movimiento_payload("scratch", "normal", power=40),
+            "move/ember": movimiento_payload("ember", "fire", power=40),
+            "move/flamethrower": movimiento_payload("flamethrower", "fire", power=90),
+            "move/water-gun": movimiento_payload("water-gun", "water", power=40),
+        }
+
+    def test_remote_import_links_moves_and_summarizes_them(self):
+        with StubPokeApiServer(self.routes) as stub, stub_settings(stub):
+            response = self.api.get("/api/pokemon/pokemons/charmander/")
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(len(response.data["movimientos"]), 3)
+
+            response = self.api.post("/api/pokemon/pokemons/batch/", {"ids": ["squirtle"]}, format="json")
+            self.assertEqual(response.data["results"][0]["pokemon"]["move_count"], 2)
+
+        # Movimientos compartidos se descargan una vez; los inexistentes se omiten
+        self.assertEqual(stub.hits["move/scratch"], 1)
+        self.assertEqual(stub.hits["move/missing-move"], 1)
+
+        data = self.api.get("/api/pokemon/pokemons/charmander/").data
+        self.assertEqual([move["name"] for move in data["movimientos"]], ["ember", "flamethrower", "scratch"])
+        self.assertEqual(
+            (data["move_count"], data["max_move_power"], data["move_types"]), (3, 90, ["normal", "fire"]),
+        )
+        squirtle = Pokemon.objects.get(name="squirtle")
+        self.assertEqual(squirtle.move_types, type_mask(["normal", "water"]))
+
+    async def test_async_detail_includes_moves(self):
+        with StubPokeApiServer(self.routes) as stub, stub_settings(stub):
+            request = AsyncRequestFactory().get("/api/pokemon/pokemons/squirtle/")
+            response = await async_views.pokemon_detail(request, pk="squirtle")
+        data = json.loads(response.content)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([move["name"] for move in data["movimientos"]], ["scratch", "water-gun"])
+        self.assertEqual(data["move_count"], 2)
+
+    def test_summary_follows_moveset_and_move_writes(self):
+        fire = Tipo.objects.create(name="fire")
+        normal = Tipo.objects.create(name="normal")
+        ember = Movimiento.objects.create(name="ember", power=40, pp=25, tipo=fire)
+        tackle = Movimiento.objects.create(name="tackle", power=40, pp=35, tipo=normal)
+        charmander = Pokemon.objects.create(name="charmander", hp=39, attack=52, defense=43, tipo=fire)
+
+        def summary():
+            charmander.refresh_from_db()
+            return charmander.move_count, charmander.max_move_power, mask_types(charmander.move_types)
+
+        charmander.movimientos.add(ember, tackle)
+        self.assertEqual(summary(), (2, 40, ["normal", "fire"]))
+
+        ember.power = 60
+        ember.save()
+        self.assertEqual(summary(), (2, 60, ["normal", "fire"]))
+
+        tackle.pokemons.clear()
+        self.assertEqual(summary(), (1, 60, ["fire"]))
+
+        ember.delete()
+        self.assertEqual(summary(), (0, None, []))
+
+    def test_list_filters_on_the_summary_without_joins(self):
+        fire = Tipo.objects.create(name="fire")
+        normal = Tipo.objects.create(name="normal")
+        ember = Movimiento.objects.create(name="ember", power=40, pp=25, tipo=fire)
+        blast = Movimiento.objects.create(name="fire-blast", power=110, pp=5, tipo=fire)
+        tackle = Movimiento.objects.create(name="tackle", power=40, pp=35, tipo=normal)
+        pokemons = {
+            name: Pokemon.objects.create(name=name, hp=40, attack=40, defense=40, tipo=fire).pk
+            for name in ("charmander", "vulpix", "rattata")
+        }
+        link_movimientos({
+            pokemons["charmander"]: [ember.pk, blast.pk, tackle.pk],
+            pokemons["vulpix"]: [ember.pk],
+            pokemons["rattata"]: [tackle.pk],
+        })
+
+        def names(query):
+            with CaptureQueriesContext(connection) as context:
+                response = self.api.get(f"/api/pokemon/pokemons/?{query}")
+            self.assertEqual(response.status_code, 200)
+            sql = " ".join(captured["sql"] for captured in context.captured_queries)
+            self.assertNotIn(Pokemon.movimientos.through._meta.db_table, sql)
+            return [pokemon["name"] for pokemon in response.data["results"]]
+
+        self.assertEqual(names("move_type=fire"), ["charmander", "vulpix"])
+        self.assertEqual(names("move_type=fire,normal"), ["charmander"])
+        self.assertEqual(names("min_moves=2"), ["charmander"])
+        self.assertEqual(names("min_move_power=100&fields=name,movimientos"), ["charmander"])
+        for query in ("move_type=shadow", "min_moves=-1"):
+            self.assertEqual(self.api.get(f"/api/pokemon/pokemons/?{query}").status_code, 400)
+
+
+class RemoteImportTransactionTests(TransactionTestCase):
+    """Un fallo de caché descarga todo antes de abrir la transacción de escritura."""
+
+    def test_no_upstream_call_inside_a_transaction(self):
+        routes = {
+            "pokemon/charmander": pokemon_payload("charmander", 4, "fire", moves=("scratch", "ember", "missing-move")),
+            "move/scratch": movimiento_payload("scratch", "normal", power=40),
+            "move/ember": movimiento_payload("ember", "fire", power=40),
+        }
+        # Las descargas de movimientos van en otros hilos: se mira la conexión de la petición
+        request_connection = connections["default"]
+        in_transaction = []
+        fetch = PokeApiClient._fetch
+
+        def tracking_fetch(client, *args):
+            in_transaction.append(request_connection.in_atomic_block)
+            return fetch(client, *args)
+
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            with mock.patch.object(PokeApiClient, "_fetch", tracking_fetch):
+                response = APIClient().get("/api/pokemon/pokemons/charmander/")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data["movimientos"]), 2)
+        self.assertEqual(stub.total_hits, 4)
+        self.assertEqual(in_transaction, [False] * 4)
+
+
+# ============================================================
+# 🔹 CONSULTAS POR ENDPOINT (N+1)
+# ============================================================
+def fill_pokemons(total):
+    """Completa el catálogo hasta ``total`` Pokémon repartidos en varios tipos."""
+    current = Pokemon.objects.count()
+    for i in range(current, total):
+        create_pokemons(1, tipo_name=f"tipo-{i % 7}", start=i)
+
+
+def fill_movimientos(total):
+    current = Movimiento.objects.count()
+    for i in range(current, total):
+        tipo, _ = Tipo.objects.get_or_create(name=f"tipo-{i % 7}")
+        Movimiento.objects.create(name=f"move-{i}", power=40, pp=35, accuracy=100, tipo=tipo)
+
+
+class QueryCountTests(QueryCountMixin, TestCase):
+    """
+    Página por número: COUNT + página. Modo keyset: solo la página.
+    Pokémon suma la consulta de validación del ETag (max(updated_at), count),
+    cuyo conteo reutiliza la paginación por número.
+    """
+
+    def test_pokemon_list(self):
+        self.assertConstantQueries("/api/pokemon/pokemons/", fill_pokemons, expected=2)
+        self.assertConstantQueries("/api/pokemon/pokemons/?pagination=cursor", fill_pokemons, expected=2)
+
+    def test_movimiento_list(self):
+        self.assertConstantQueries("/api/pokemon/movimientos/", fill_movimientos, expected=2)
+        self.assertConstantQueries("/api/pokemon/movimientos/?pagination=cursor", fill_movimientos, expected=1)
+
+    def test_tipo_list(self):
+        self.assertConstantQueries("/api/pokemon/tipos/", fill_movimientos, expected=2)
+
+    def test_retrieve_joins_tipo(self):
+        fill_pokemons(3)
+        fill_movimientos(3)
+        # ETag + fila + movimientos del detalle
+        self.assertEqual(self.count_queries("/api/pokemon/pokemons/poke-1/")[0], 3)
+        self.assertEqual(self.count_queries("/api/pokemon/movimientos/move-1/")[0], 1)
+
+
+# ============================================================
+# 🔹 PAGINACIÓN Y CAMPOS DISPERSOS
+# ============================================================
+class PaginationTests(TestCase):
+    def setUp(self):
+        fill_pokemons(120)
+        self.api = APIClient()
+
+    def test_page_number_is_the_default(self):
+        response = self.api.get("/api/pokemon/pokemons/")
+        self.assertEqual(response.data["count"], 120)
+        self.assertEqual(len(response.data["results"]), 50)
+
+        response = self.api.get("/api/pokemon/pokemons/?page=3&page_size=50")
+        self.assertEqual(len(response.data["results"]), 20)
+
+    def test_keyset_mode_walks_every_row_once(self):
+        url = "/api/pokemon/pokemons/?pagination=cursor&page_size=40"
+        seen = []
+        while url:
+            response = self.api.get(url)
+            self.assertNotIn("count", response.data)
+            seen.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(seen, sorted(Pokemon.objects.values_list("id", flat=True)))
+
+    def test_keyset_pages_filter_on_id_without_offset(self):
+        first = self.api.get("/api/pokemon/pokemons/?pagination=cursor&page_size=100")
+        with CaptureQueriesContext(connection) as context:
+            self.api.get(first.data["next"])
+
+        sql = context.captured_queries[-1]["sql"]
+        self.assertIn('"id" >', sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_sparse_fieldsets(self):
+        response = self.api.get("/api/pokemon/pokemons/?fields=id,name,image&page_size=5")
+        self.assertEqual(set(response.data["results"][0]), {"id", "name", "image"})
+
+        pokemon_id = response.data["results"][0]["id"]
+        response = self.api.get(f"/api/pokemon/pokemons/{pokemon_id}/?fields=name,tipo")
+        self.assertEqual(set(response.data), {"name", "tipo"})
+        self.assertEqual(set(response.data["tipo"]), {"id", "name"})
+
+        response = self.api.get("/api/pokemon/tipos/?fields=name")
+        self.assertEqual(set(response.data["results"][0]), {"name"})
+
+
+# ============================================================
+# 🔹 FILTROS Y ORDEN DEL CATÁLOGO
+# ============================================================
+class FilterTests(TestCase):
+    url = "/api/pokemon/pokemons/"
+
+    def setUp(self):
+        create_pokemons(30, tipo_name="fire")
+        create_pokemons(30, tipo_name="water", start=30)
+        self.api = APIClient()
+
+    def names(self, query):
+        response = self.api.get(f"{self.url}?{query}&page_size=100")
+        self.assertEqual(response.status_code, 200, response.data)
+        return [row["name"] for row in response.data["results"]]
+
+    def test_total_stats_is_stored_on_save_and_bulk_create(self):
+        pokemon = Pokemon.objects.get(name="poke-7")
+        self.assertEqual(pokemon.total_stats, pokemon.hp + pokemon.attack + pokemon.defense)
+
+        pokemon.hp += 10
+        pokemon.save()
+        pokemon.refresh_from_db()
+        self.assertEqual(pokemon.total_stats, pokemon.hp + pokemon.attack + pokemon.defense)
+        self.assertEqual(self.api.get(f"{self.url}{pokemon.pk}/").data["total_stats"], pokemon.total_stats)
+
+        # Sin guardar: los totales en Python no dependen de la columna
+        unsaved = Pokemon(hp=100, attack=100, defense=100)
+        self.assertEqual((unsaved.full_stats["total"], unsaved.power_index()), (300, "Fuerte 🔴"))
+
+    def test_backfill_command(self):
+        Pokemon.objects.filter(name__in=["poke-1", "poke-2"]).update(total_stats=0)
+        out = io.StringIO()
+        call_command("backfill_total_stats", "--batch-size", "7", stdout=out)
+        self.assertIn("2 totales", out.getvalue())
+        self.assertFalse(Pokemon.objects.exclude(total_stats=F("hp") + F("attack") + F("defense")).exists())
+
+        out = io.StringIO()
+        call_command("backfill_total_stats", stdout=out)
+        self.assertIn("0 totales", out.getvalue())
+
+    def test_tipo_by_name_or_id_and_stat_ranges(self):
+        water = Tipo.objects.get(name="water")
+        expected = sorted(
+            Pokemon.objects.filter(tipo=water, attack__gte=80, attack__lte=100).values_list("name", flat=True)
+        )
+        self.assertTrue(expected)
+        for tipo in ("water", "WATER", str(water.pk)):
+            self.assertEqual(sorted(self.names(f"tipo={tipo}&attack_min=80&attack_max=100")), expected)
+
+        self.assertEqual(len(self.names("tipo=fire,water")), 60)
+        self.assertEqual(self.names("tipo=ghost"), [])
+        self.assertEqual(self.names("tipo=²"), [])
+
+        totals = Pokemon.objects.filter(total_stats__gte=200).values_list("name", flat=True)
+        self.assertEqual(sorted(self.names("total_stats_min=200")), sorted(totals))
+
+    def test_ordering_breaks_ties_by_id(self):
+        response = self.api.get(f"{self.url}?ordering=-total_stats&page_size=100")
+        rows = [(row["total_stats"], row["id"]) for row in response.data["results"]]
+        self.assertEqual(rows, sorted(rows, reverse=True))
+
+        response = self.api.get(f"{self.url}?tipo=fire&ordering=hp&page_size=100")
+        rows = [(row["hp"], row["id"]) for row in response.data["results"]]
+        self.assertEqual(rows, sorted(rows))
+
+        # CursorPagination (DRF 3.14) exige un orden aunque no haya ?ordering=
+        request = Request(APIRequestFactory().get(self.url))
+        ordering = CatalogOrderingFilter().get_ordering(request, Pokemon.objects.all(), PokemonViewSet())
+        self.assertEqual(ordering, ["id"])
+        names = [row["name"] for row in self.api.get(f"{self.url}?name_prefix=poke-1&pagination=cursor").data["results"]]
+        self.assertEqual(set(names), {"poke-1", *(f"poke-1{i}" for i in range(10))})
+
+    def test_name_prefix_uses_a_key_range(self):
+        with CaptureQueriesContext(connection) as context:
+            names = self.names("name_prefix=POKE-1")
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(set(names), {"poke-1", *(f"poke-1{i}" for i in range(10))})
+        self.assertIn('"name_key" >=', context.captured_queries[-1]["sql"])
+
+    def test_invalid_values(self):
+        for query in ("hp_min=x", "attack_max=-1", "defense_min=²", "move_type=shadow"):
+            response = self.api.get(f"{self.url}?{query}")
+            self.assertEqual(response.status_code, 400, query)
+            self.assertIn(query.split("=")[0], response.data)
+
+    @skipIf(connection.vendor != "sqlite", "Plan de consulta de SQLite")
+    def test_indexed_queries_neither_scan_nor_sort(self):
+        for name in ("tipo+attack", "total_range", "hp_range", "top_defense", "name_prefix"):
+            plan = filters_benchmark.plan_flags(filters_benchmark.page_queryset(filters_benchmark.QUERIES[name]))
+            self.assertEqual(plan, {"full_scan": False, "sorts": False}, name)
+
+
+# ============================================================
+# 🔹 SERIALIZADORES RÁPIDOS
+# ============================================================
+class FastSerializerTests(TestCase):
+    def test_same_json_as_model_serializers(self):
+        fill_pokemons(10)
+        fill_movimientos(10)
+        Movimiento.objects.create(name="struggle", power=None, pp=1, accuracy=None, tipo=Tipo.objects.first())
+
+        cases = (
+            (Pokemon.objects.select_related("tipo"), PokemonSerializer, FastPokemonSerializer),
+            (Movimiento.objects.select_related("tipo"), MovimientoSerializer, FastMovimientoSerializer),
+            (Tipo.objects.all(), TipoSerializer, FastTipoSerializer),
+        )
+        for queryset, model_serializer, fast_serializer in cases:
+            queryset = queryset.order_by("id")
+            expected = model_serializer(queryset, many=True).data
+            actual = fast_serializer(fast_serializer.values(queryset), many=True).data
+            self.assertEqual(json.loads(json.dumps(actual)), json.loads(json.dumps(expected)))
+
+    def test_subclasses_must_implement_to_representation(self):
+        class Incomplete(ValuesSerializer):
+            columns = fields = ("id",)
+
+        with self.assertRaisesMessage(NotImplementedError, "Incomplete debe implementar `to_representation(row)`"):
+            Incomplete({"id": 1}).data
+
+
+# ============================================================
+# 🔹 CACHÉ DE LECTURAS
+# ============================================================
+@override_settings(CATALOG_CACHE={"ENABLED": True})
+class CatalogCacheTests(QueryCountMixin, TestCase):
+    def setUp(self):
+        catalog_cache.clear()
+        fill_pokemons(3)
+        fill_movimientos(3)
+        self.api = APIClient()
+
+    def save(self, instance, **changes):
+        """Guarda ``instance`` ejecutando los ``on_commit`` (invalidación)."""
+        for field, value in changes.items():
+            setattr(instance, field, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save()
+
+    def test_second_read_is_served_from_cache(self):
+        # Pokémon conserva la consulta de validación del ETag (max(updated_at))
+        urls = {"/api/pokemon/pokemons/": 1, "/api/pokemon/pokemons/poke-1/": 1, "/api/pokemon/tipos/": 0}
+        for url, expected in urls.items():
+            first = self.api.get(url)
+            self.assertEqual(first["X-Cache"], "miss")
+            queries, _ = self.count_queries(url, self.api)
+            self.assertEqual(queries, expected)
+            self.assertEqual(self.api.get(url).data, first.data)
+
+        stats = self.api.get("/api/pokemon/cache/").data["resources"]
+        self.assertEqual(stats["pokemon"]["detail"]["hit"], 2)
+        self.assertEqual(stats["pokemon"]["list"]["miss"], 1)
+
+    def test_save_invalidates_only_the_changed_detail(self):
+        pikachu, bulbasaur = Pokemon.objects.order_by("id")[:2]
+        self.api.get(f"/api/pokemon/pokemons/{pikachu.name}/")
+        self.api.get(f"/api/pokemon/pokemons/{bulbasaur.id}/")
+        self.api.get("/api/pokemon/pokemons/")
+
+        self.save(pikachu, hp=999)
+
+        response = self.api.get(f"/api/pokemon/pokemons/{pikachu.name}/")
+        self.assertEqual((response["X-Cache"], response.data["hp"]), ("miss", 999))
+        self.assertEqual(self.api.get(f"/api/pokemon/pokemons/{bulbasaur.id}/")["X-Cache"], "hit")
+        self.assertEqual(self.api.get("/api/pokemon/pokemons/")["X-Cache"], "miss")
+
+    def test_renamed_pokemon_is_not_served_under_old_name(self):
+        pokemon = Pokemon.objects.order_by("id").first()
+        old_name = pokemon.name
+        self.api.get(f"/api/pokemon/pokemons/{old_name}/")
+        self.save(pokemon, name="renamed")
+
+        with StubPokeApiServer() as stub, stub_settings(stub):
+            self.assertEqual(self.api.get(f"/api/pokemon/pokemons/{old_name}/").status_code, 404)
+        self.assertEqual(self.api.get("/api/pokemon/pokemons/RENAMED/").data["name"], "renamed")
+
+    def test_tipo_rename_invalidates_embedding_rows(self):
+        pokemon = Pokemon.objects.select_related("tipo").order_by("id").first()
+        movimiento = Movimiento.objects.filter(tipo=pokemon.tipo).first()
+        self.api.get(f"/api/pokemon/pokemons/{pokemon.id}/")
+        self.api.get(f"/api/pokemon/movimientos/{movimiento.id}/")
+
+        self.save(pokemon.tipo, name="renombrado")
+
+        self.assertEqual(self.api.get(f"/api/pokemon/pokemons/{pokemon.id}/").data["tipo"]["name"], "renombrado")
+        self.assertEqual(self.api.get(f"/api/pokemon/movimientos/{movimiento.id}/").data["tipo"]["name"], "renombrado")
+
+
+# ============================================================
+# 🔹 GET CONDICIONAL (ETag / Last-Modified)
+# ============================================================
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        fill_pokemons(3)
+        fill_movimientos(3)
+        self.api = APIClient()
+
+    def save(self, instance, **changes):
+        for field, value in changes.items():
+            setattr(instance, field, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save()
+
+    def revalidate(self, url, response):
+        return self.api.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_not_modified_skips_the_serializer(self):
+        for url in ("/api/pokemon/pokemons/", "/api/pokemon/pokemons/poke-1/",
+                    "/api/pokemon/tipos/", "/api/pokemon/movimientos/move-1/"):
+            first = self.api.get(url)
+            self.assertEqual(first.status_code, 200)
+            self.assertIn("no-cache", first["Cache-Control"])
+
+            with CaptureQueriesContext(connection) as context:
+                second = self.revalidate(url, first)
+            self.assertEqual(second.status_code, 304)
+            self.assertEqual(second.content, b"")
+            self.assertEqual(second["ETag"], first["ETag"])
+            self.assertLessEqual(len(context.captured_queries), 1)
+
+    def test_if_modified_since(self):
+        first = self.api.get("/api/pokemon/pokemons/poke-1/")
+        response = self.api.get("/api/pokemon/pokemons/poke-1/", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_lists_are_validated_by_etag_only(self):
+        # Borrar la fila más reciente haría retroceder max(updated_at)
+        first = self.api.get("/api/pokemon/pokemons/")
+        self.assertNotIn("Last-Modified", first)
+        Pokemon.objects.order_by("-updated_at").first().delete()
+        response = self.api.get("/api/pokemon/pokemons/", HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.revalidate("/api/pokemon/pokemons/", first).status_code, 200)
+
+    def test_writes_change_the_etag(self):
+        pokemon = Pokemon.objects.select_related("tipo").get(name="poke-1")
+        movimiento = Movimiento.objects.get(name="move-1")
+        urls = ["/api/pokemon/pokemons/", f"/api/pokemon/pokemons/{pokemon.id}/", "/api/pokemon/movimientos/move-1/"]
+        first = {url: self.api.get(url) for url in urls}
+
+        Pokemon.objects.filter(pk=pokemon.pk).update(updated_at=pokemon.updated_at + timedelta(seconds=5))
+        self.save(movimiento, power=90)
+        for url in urls:
+            self.assertEqual(self.revalidate(url, first[url]).status_code, 200, url)
+
+        # Renombrar el tipo cambia el cuerpo de los Pokémon aunque no su updated_at
+        detail = self.api.get(f"/api/pokemon/pokemons/{pokemon.id}/")
+        self.save(pokemon.tipo, name="renombrado")
+        self.assertEqual(self.revalidate(f"/api/pokemon/pokemons/{pokemon.id}/", detail).status_code, 200)
+
+    def test_etag_depends_on_the_query(self):
+        page_1 = self.api.get("/api/pokemon/pokemons/?page_size=1")
+        page_2 = self.api.get("/api/pokemon/pokemons/?page_size=1&page=2")
+        self.assertNotEqual(page_1["ETag"], page_2["ETag"])
+        self.assertEqual(self.revalidate("/api/pokemon/pokemons/?page_size=1&page=2", page_1).status_code, 200)
+
+
+# ============================================================
+# 🔹 CAPTURAS POR USUARIO
+# ============================================================
+class CapturaTests(TestCase):
+    def setUp(self):
+        fill_pokemons(MAX_CAPTURAS + 2)
+        self.user = get_user_model().objects.create_user(username="ash", password="pikachu123")
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def capture(self, name, api=None):
+        return (api or self.api).post("/api/pokemon/capturar/", {"name": name}, format="json")
+
+    def test_capture_until_the_limit_per_user(self):
+        for i in range(MAX_CAPTURAS):
+            response = self.capture(f"POKE-{i}")
+            self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data["capturas"], MAX_CAPTURAS)
+        self.assertEqual(self.capture(f"poke-{MAX_CAPTURAS}").status_code, 403)
+
+        # El límite es por usuario
+        misty = get_user_model().objects.create_user(username="misty", password="starmie123")
+        other = APIClient()
+        other.force_authenticate(misty)
+        self.assertEqual(self.capture("poke-0", other).status_code, 201)
+
+    def test_duplicate_does_not_consume_capacity(self):
+        self.assertEqual(self.capture("poke-0").status_code, 201)
+        self.assertEqual(self.capture("poke-0").status_code, 409)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.capturas_count, 1)
+
+    def test_roster_in_one_query_and_release(self):
+        for i in range(3):
+            self.capture(f"poke-{i}")
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.api.get("/api/pokemon/capturas/")
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual([item["pokemon"]["name"] for item in response.data], ["poke-0", "poke-1", "poke-2"])
+        self.assertIn("tipo", response.data[0]["pokemon"])
+
+        self.assertEqual(self.api.delete(f"/api/pokemon/capturas/{response.data[0]['id']}/").status_code, 204)
+        Pokemon.objects.get(name="poke-1").delete()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.capturas_count, 1)
+
+    def test_requires_authentication(self):
+        self.assertEqual(APIClient().get("/api/pokemon/capturas/").status_code, 401)
+        self.assertEqual(self.capture("poke-0", APIClient()).status_code, 401)
+
+
+@skipIf(connection.vendor == "sqlite", "La base SQLite de pruebas bloquea tablas ante escrituras concurrentes.")
+class ConcurrentCapturaTests(TransactionTestCase):
+    def test_concurrent_captures_never_exceed_the_limit(self):
+        create_pokemons(MAX_CAPTURAS * 3)
+        user = get_user_model().objects.create_user(username="ash", password="pikachu123")
+        barrier = threading.Barrier(MAX_CAPTURAS * 3)
+
+        def capture(i):
+            api = APIClient()
+            api.force_authenticate(user)
+            barrier.wait(5)
+            try:
+                return api.post("/api/pokemon/capturar/", {"name": f"poke-{i}"}, format="json").status_code
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=MAX_CAPTURAS * 3) as pool:
+            statuses = list(pool.map(capture, range(MAX_CAPTURAS * 3)))
+
+        user.refresh_from_db()
+        self.assertEqual(statuses.count(201), MAX_CAPTURAS, statuses)
+        self.assertEqual(user.capturas_count, MAX_CAPTURAS)
+        self.assertEqual(Captura.objects.filter(user=user).count(), MAX_CAPTURAS)
+
+
+# ============================================================
+# 🔹 LECTURA EN LOTE
+# ============================================================
+class PokemonBatchTests(TestCase):
+    url = "/api/pokemon/pokemons/batch/"
+
+    def setUp(self):
+        fill_pokemons(5)
+        self.api = APIClient()
+
+    def test_local_hits_in_one_query_in_request_order(self):
+        first = Pokemon.objects.order_by("id").first()
+        ids = ["POKE-3", first.id, " poke-1 ", "poke-3"]
+        with CaptureQueriesContext(connection) as context:
+            response = self.api.post(self.url, {"ids": ids}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(context.captured_queries), 1)
+        results = response.data["results"]
+        self.assertEqual([item["status"] for item in results], ["found"] * 4)
+        self.assertEqual(
+            [item["pokemon"]["name"] for item in results],
+            ["poke-3", first.name, "poke-1", "poke-3"],
+        )
+
+    def test_misses_are_fetched_concurrently_and_bulk_inserted(self):
+        routes = {
+            "pokemon/mew": pokemon_payload("mew", 151, "psychic"),
+            "pokemon/mewtwo": pokemon_payload("mewtwo", 150, "psychic"),
+            "pokemon/9999": pokemon_payload("poke-0", 9999),
+        }
+        with StubPokeApiServer(routes, delay=0.2) as stub, stub_settings(stub):
+            started = time.perf_counter()
+            response = self.api.post(
+                self.url, {"ids": ["mew", "poke-2", "MewTwo", "missingno", 9999, "mew"]}, format="json",
+            )
+            elapsed = time.perf_counter() - started
+
+        results = response.data["results"]
+        self.assertEqual(
+            [item["status"] for item in results],
+            ["created", "found", "created", "not_found", "found", "created"],
+        )
+        self.assertEqual(results[2]["pokemon"]["tipo"]["name"], "psychic")
+        self.assertIsNone(results[3]["pokemon"])
+        self.assertEqual(results[4]["pokemon"]["name"], "poke-0")
+        self.assertEqual(stub.hits["pokemon/mew"], 1)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(Pokemon.objects.filter(name__in=["mew", "mewtwo"]).count(), 2)
+
+    def test_upstream_errors_are_reported_per_item(self):
+        with StubPokeApiServer(fail_first=100) as stub, stub_settings(stub, RETRIES=0):
+            response = self.api.post(self.url, {"ids": ["poke-1", "mew"]}, format="json")
+        self.assertEqual([item["status"] for item in response.data["results"]], ["found", "error"])
+
+    def test_unsaved_imports_are_errors(self):
+        routes = {"pokemon/mew": pokemon_payload("mew", 151, "psychic")}
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            with mock.patch("pokemon.api.pokenmon_viewset.bulk_import_pokemon"):
+                response = self.api.post(self.url, {"ids": ["mew"]}, format="json")
+        self.assertEqual(response.data["results"], [{"query": "mew", "status": "error", "pokemon": None}])
+
+    def test_non_ascii_digits_are_names(self):
+        with StubPokeApiServer() as stub, stub_settings(stub):
+            response = self.api.post(self.url, {"ids": ["²", "٣", "poke-1"]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["status"] for item in response.data["results"]], ["not_found", "not_found", "found"])
+
+    def test_validation(self):
+        self.assertEqual(self.api.post(self.url, {"ids": []}, format="json").status_code, 400)
+        self.assertEqual(self.api.post(self.url, {"ids": ["x"] * 301}, format="json").status_code, 400)
+
+
+# ============================================================
+# 🔹 BÚSQUEDA POR NOMBRE NORMALIZADO
+# ============================================================
+class NameKeyTests(TestCase):
+    def test_name_key_is_set_on_save_and_bulk_create(self):
+        create_pokemons(2, tipo_name="Fire")
+        self.assertEqual(Tipo.objects.get(name="Fire").name_key, "fire")
+        self.assertEqual(sorted(Pokemon.objects.values_list("name_key", flat=True)), ["poke-0", "poke-1"])
+
+    def test_lookups_are_case_insensitive_and_indexed(self):
+        fill_movimientos(2)
+        api = APIClient()
+        for url in ("/api/pokemon/tipos/TIPO-1/", "/api/pokemon/movimientos/Move-1/"):
+            with CaptureQueriesContext(connection) as context:
+                response = api.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('"name_key" =', context.captured_queries[-1]["sql"])
+
+    def test_non_ascii_digits_are_looked_up_as_names(self):
+        with StubPokeApiServer() as stub, stub_settings(stub):
+            for url in ("/api/pokemon/pokemons/²/", "/api/pokemon/tipos/٣/", "/api/pokemon/movimientos/²/"):
+                self.assertEqual(APIClient().get(url).status_code, 404, url)
+
+    def test_writes_reject_names_that_differ_only_in_case(self):
+        create_pokemons(1, tipo_name="fire")
+        fire = Tipo.objects.get(name="fire")
+        api = APIClient()
+
+        response = api.post("/api/pokemon/tipos/", {"name": "FIRE"}, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("name", response.data)
+        body = {"name": "Poke-0", "hp": 10, "attack": 10, "defense": 10, "image": "https://example.com/0.png"}
+        self.assertEqual(api.post("/api/pokemon/pokemons/", body, format="json").status_code, 400)
+        self.assertEqual(api.patch(f"/api/pokemon/tipos/{fire.pk}/", {"name": "Fire"}, format="json").status_code, 200)
+
+        response = api.post("/api/pokemon/pokemons/", {**body, "name": "poke-new", "tipo": "FIRE"}, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data["tipo"]["id"], fire.pk)
+        self.assertEqual(Tipo.objects.count(), 1)
+
+    def test_bulk_writes_match_tipos_by_name_key(self):
+        fire = Tipo.objects.create(name="FIRE")
+        self.assertEqual(resolve_tipos({"fire", "Water"}, {})["fire"], fire.pk)
+        call_command("import_type_chart", "--builtin", stdout=io.StringIO())
+        self.assertEqual(Tipo.objects.filter(name_key__in=["fire", "water"]).count(), 2)
+        self.assertTrue(Efectividad.objects.filter(atacante=fire).exists())
+
+    def test_backfill_command(self):
+        create_pokemons(3)
+        Pokemon.objects.filter(name="poke-2").update(name="POKE-1")
+        Pokemon.objects.update(name_key=None)
+
+        out = io.StringIO()
+        call_command("backfill_name_keys", "--batch-size", "2", stdout=out)
+
+        keys = dict(Pokemon.objects.values_list("name", "name_key"))
+        self.assertEqual(keys, {"poke-0": "poke-0", "poke-1": "poke-1", "POKE-1": None})
+        self.assertIn("colisiona", out.getvalue())
+
+
+# ============================================================
+# 🔹 BÚSQUEDA APROXIMADA DE NOMBRES
+# ============================================================
+class NameSearchTests(TestCase):
+    url = "/api/pokemon/search/"
+
+    def setUp(self):
+        fire, _ = Tipo.objects.get_or_create(name="fire")
+        for name in ("charmander", "charmeleon", "charizard", "pikachu", "mr-mime"):
+            Pokemon.objects.create(name=name, hp=50, attack=50, defense=50, tipo=fire)
+        Movimiento.objects.create(name="flamethrower", power=90, pp=15, accuracy=100, tipo=fire)
+        # Las altas por señal esperan a on_commit: el índice se recarga de la base
+        # (en este hilo: una recarga en segundo plano no vería la transacción)
+        name_index.reload()
+        self.api = APIClient()
+
+    def search(self, **params):
+        response = self.api.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data["results"]
+
+    def test_trigrams_follow_pg_trgm(self):
+        self.assertEqual(len(trigrams("charzard")), 9)
+        self.assertIn("  m", trigrams("Mr-Mime"))
+        self.assertAlmostEqual(similarity(trigrams("charzard"), trigrams("charizard")), 7 / 12)
+
+    def test_prefix_matches_first_then_similar_names(self):
+        results = self.search(q="CHAR")
+        self.assertEqual([item["name"] for item in results], ["charizard", "charmander", "charmeleon"])
+        self.assertTrue(all(item["prefix"] for item in results))
+
+        first = self.search(q="charzard")[0]
+        self.assertEqual((first["kind"], first["name"], first["prefix"]), ("pokemon", "charizard", False))
+        self.assertEqual([item["name"] for item in self.search(q="flamethrowr")], ["flamethrower"])
+        self.assertEqual([item["kind"] for item in self.search(q="fire", kind="tipo")], ["tipo"])
+        self.assertEqual(self.search(q="zzzzqx"), [])
+        self.assertEqual(len(self.search(q="char", limit=2)), 2)
+
+    def test_searches_do_not_touch_the_database_once_built(self):
+        name_index.warm()
+        with self.assertNumQueries(0):
+            self.assertEqual(name_index.search("pikchu")[0]["name"], "pikachu")
+
+    def test_stale_index_is_served_while_reloading_in_background(self):
+        index = NameSearchIndex()
+        index.reload()
+        built = index._build()
+        release = threading.Event()
+
+        def slow_build():
+            release.wait(5)
+            return built
+
+        index.invalidate()
+        with mock.patch.object(index, "_build", slow_build):
+            with self.assertNumQueries(0):
+                self.assertEqual(index.search("pikachu")[0]["name"], "pikachu")
+            # Llega durante la recarga: se aplica también al índice nuevo
+            index.add("pokemon", 999, "pichu")
+            release.set()
+            deadline = time.monotonic() + 5
+            while index._reloading and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertFalse(index._reloading)
+        self.assertEqual(index.search("pichu")[0]["id"], 999)
+
+    def test_index_follows_writes(self):
+        name_index.warm()
+        with self.captureOnCommitCallbacks(execute=True):
+            pokemon = Pokemon.objects.create(name="bulbasaur", hp=45, attack=49, defense=49, tipo=Tipo.objects.get())
+        self.assertEqual(self.search(q="bulbsaur")[0]["name"], "bulbasaur")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pokemon.name = "ivysaur"
+            pokemon.save()
+        self.assertEqual(self.search(q="bulb"), [])
+        self.assertEqual(self.search(q="ivy")[0]["id"], pokemon.pk)
+
+        pokemon.delete()
+        self.assertEqual(self.search(q="ivy"), [])
+
+    def test_validation_and_backend(self):
+        for params in ({}, {"q": " "}, {"q": "char", "kind": "item"}, {"q": "char", "limit": "0"}):
+            self.assertEqual(self.api.get(self.url, params).status_code, 400, params)
+
+        with override_settings(NAME_SEARCH={**settings.NAME_SEARCH, "BACKEND": "pg_trgm"}):
+            if connection.vendor != "postgresql":
+                with self.assertRaises(ImproperlyConfigured):
+                    search_names("char")
+
+    def test_unknown_pokemon_suggests_local_names(self):
+        with StubPokeApiServer() as stub, stub_settings(stub):
+            response = self.api.get("/api/pokemon/pokemons/charzard/")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data["suggestions"][0], "charizard")
+
+
+# ============================================================
+# 🔹 RANKINGS
+# ============================================================
+class RankingTests(TestCase):
+    url = "/api/pokemon/rankings/"
+
+    def setUp(self):
+        # Contadores de throttling de las simulaciones
+        cache.clear()
+        self.fire = create_pokemons(4, tipo_name="fire")
+        self.water = create_pokemons(4, tipo_name="water", start=4)
+        self.api = APIClient()
+
+    def fight(self, atacante, defensor, winner, times=1):
+        for _ in range(times):
+            record_battle(atacante, defensor, winner, 10)
+
+    def rankings(self, **params):
+        response = self.api.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data["results"]
+
+    def test_total_stats_ranking_reads_the_stored_column(self):
+        expected = sorted(self.fire + self.water, key=lambda p: (-p.total_stats, -p.pk))
+        results = self.rankings(limit=3)
+        self.assertEqual([row["id"] for row in results], [p.pk for p in expected[:3]])
+        self.assertEqual([row["rank"] for row in results], [1, 2, 3])
+        self.assertEqual(results[0]["total_stats"], expected[0].total_stats)
+        self.assertEqual({row["tipo"]["name"] for row in self.rankings(tipo="water")}, {"water"})
+
+    def test_only_authenticated_opt_in_simulations_are_recorded(self):
+        call_command("import_type_chart", "--builtin", stdout=io.StringIO())
+        url = "/api/pokemon/battles/simulate/"
+        body = {"attacker": "poke-0", "defender": "poke-4"}
+        response = self.api.post(url, {**body, "seed": 3}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["battle_id"])
+        self.assertEqual(self.api.post(url, {**body, "record": True}, format="json").status_code, 401)
+
+        self.api.force_authenticate(get_user_model().objects.create_user(username="ash", password="pikachu123"))
+        for extra in ({"seed": 3}, {"runs": 50}):
+            response = self.api.post(url, {**body, "record": True, **extra}, format="json")
+            self.assertEqual(response.status_code, 400, extra)
+
+        response = self.api.post(url, {**body, "record": True}, format="json")
+        self.assertEqual(response.status_code, 200)
+        batalla = Batalla.objects.get(pk=response.data["battle_id"])
+        self.assertEqual(batalla.ganador.name if batalla.ganador else None, response.data["winner"])
+        self.assertEqual(Batalla.objects.count(), 1)
+        self.assertEqual(RankingBatalla.objects.get(pk=self.fire[0].pk).batallas, 1)
+
+    def test_recorded_battles_are_throttled_per_user(self):
+        self.api.force_authenticate(get_user_model().objects.create_user(username="ash", password="pikachu123"))
+        body = {"attacker": "poke-0", "defender": "poke-4", "record": True}
+        with mock.patch.dict(RecordedBattleThrottle.THROTTLE_RATES, {"battle_record": "2/min"}):
+            statuses = [self.api.post("/api/pokemon/battles/simulate/", body, format="json").status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(Batalla.objects.count(), 2)
+
+    def test_win_rate_ranking_is_updated_incrementally(self):
+        a, b, c = self.fire[0], self.fire[1], self.water[0]
+        self.fight(a, b, "attacker", times=4)
+        self.fight(a, c, "defender", times=2)
+        self.fight(c, b, None, times=3)
+
+        rows = {row.pk: row for row in RankingBatalla.objects.all()}
+        self.assertEqual((rows[a.pk].batallas, rows[a.pk].victorias), (6, 4))
+        self.assertEqual((rows[b.pk].batallas, rows[b.pk].victorias), (7, 0))
+        self.assertEqual((rows[c.pk].batallas, rows[c.pk].victorias), (5, 2))
+        self.assertAlmostEqual(rows[a.pk].win_rate, 4 / 6)
+
+        results = self.rankings(by="win_rate", min_battles=5)
+        self.assertEqual([row["id"] for row in results], [a.pk, c.pk, b.pk])
+        self.assertEqual(results[0]["win_rate"], round(4 / 6, 4))
+        self.assertEqual([row["id"] for row in self.rankings(by="win_rate", min_battles=6)], [a.pk, b.pk])
+        self.assertEqual([row["id"] for row in self.rankings(by="win_rate", tipo="water", min_battles=1)], [c.pk])
+
+    def test_tipo_changes_and_deletions_are_followed(self):
+        a, b, c = self.fire[0], self.fire[1], self.water[0]
+        self.fight(a, b, "attacker", times=2)
+        self.fight(c, a, "attacker")
+
+        a.tipo = self.water[0].tipo
+        a.save()
+        water = top_pokemon("win_rate", a.tipo_id)
+        self.assertEqual([row["id"] for row in water], [c.pk, a.pk])
+
+        Batalla.objects.filter(atacante=c).delete()
+        self.assertEqual(RankingBatalla.objects.get(pk=a.pk).win_rate, 1)
+        self.assertEqual(RankingBatalla.objects.get(pk=c.pk).batallas, 0)
+
+        b.delete()
+        row = RankingBatalla.objects.get(pk=a.pk)
+        self.assertEqual((row.batallas, row.victorias, row.win_rate), (0, 0, 0))
+
+    def test_rebuild_command_matches_incremental_state(self):
+        rng = random.Random(7)
+        pokemons = self.fire + self.water
+        for _ in range(40):
+            self.fight(rng.choice(pokemons), rng.choice(pokemons), rng.choice(["attacker", "defender", None]))
+        incremental = list(RankingBatalla.objects.order_by("pk").values())
+
+        RankingBatalla.objects.update(batallas=0, victorias=0, win_rate=0)
+        call_command("rebuild_rankings", "--batch-size", "7", stdout=io.StringIO())
+        rebuilt = list(RankingBatalla.objects.order_by("pk").values())
+        self.assertEqual(len(rebuilt), len(incremental))
+        for before, after in zip(incremental, rebuilt):
+            self.assertEqual({**before, "win_rate": round(before["win_rate"], 9)}, {**after, "win_rate": round(after["win_rate"], 9)})
+
+    def test_validation(self):
+        for params in ({"by": "speed"}, {"limit": "0"}, {"limit": "101"}, {"tipo": "fire,water"}, {"min_battles": "x"}):
+            self.assertEqual(self.api.get(self.url, params).status_code, 400, params)
+        self.assertEqual(self.rankings(tipo="shadow"), [])
+
+    @skipIf(connection.vendor != "sqlite", "Plan de consulta de SQLite")
+    def test_top_reads_neither_scan_nor_sort(self):
+        for by, model in (("total_stats", Pokemon), ("win_rate", RankingBatalla)):
+            for tipo_id in (None, self.fire[0].tipo_id):
+                plan = filters_benchmark.plan_flags(ranking_queryset(by, tipo_id, min_battles=5)[:100], model)
+                self.assertEqual(plan, {"full_scan": False, "sorts": False}, (by, tipo_id))
+
+
+# ============================================================
+# 🔹 INSTANTÁNEAS DEL CATÁLOGO
+# ============================================================
+class SnapshotTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "catalog.jsonl.gz"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def seed(self):
+        fire = Tipo.objects.create(name="fire")
+        water = Tipo.objects.create(name="water")
+        Efectividad.objects.create(atacante=water, defensor=fire, multiplicador=2.0)
+        ember = Movimiento.objects.create(name="ember", power=40, pp=25, accuracy=100, tipo=fire)
+        Pokemon.objects.create(name="charmander", hp=39, attack=52, defense=43, tipo=fire).movimientos.add(ember)
+
+    def test_round_trip_into_empty_catalog(self):
+        self.seed()
+        counts = build_snapshot(self.path)
+        self.assertEqual(counts, {"tipo": 2, "movimiento": 1, "pokemon": 1, "efectividad": 1})
+
+        Tipo.objects.all().delete()
+        out = io.StringIO()
+        # Número fijo de consultas: un bulk_create por recurso, sin N+1
+        with self.assertNumQueries(19):
+            load_snapshot(self.path)
+        call_command("load_snapshot", str(self.path), stdout=out)
+
+        self.assertEqual(Pokemon.objects.get(name="charmander").tipo.name, "fire")
+        self.assertEqual(Movimiento.objects.get(name_key="ember").tipo.name, "fire")
+        charmander = Pokemon.objects.get(name="charmander")
+        self.assertEqual(list(charmander.movimientos.values_list("name", flat=True)), ["ember"])
+        self.assertEqual((charmander.move_count, charmander.max_move_power), (1, 40))
+        self.assertEqual(Efectividad.objects.get().atacante.name, "water")
+        self.assertEqual(Pokemon.objects.count(), 1)
+        self.assertIn("1 pokemon", out.getvalue())
+
+    def test_load_updates_existing_rows_by_name(self):
+        self.seed()
+        build_snapshot(self.path)
+        Pokemon.objects.filter(name="charmander").update(hp=1)
+        load_snapshot(self.path)
+        self.assertEqual(Pokemon.objects.get(name="charmander").hp, 39)
+
+    def test_load_matches_existing_rows_case_insensitively(self):
+        self.seed()
+        build_snapshot(self.path)
+        Tipo.objects.filter(name="fire").update(name="FIRE")
+        Movimiento.objects.filter(name="ember").update(name="Ember")
+        Pokemon.objects.filter(name="charmander").update(name="Charmander", hp=1)
+
+        load_snapshot(self.path)
+        self.assertEqual(Pokemon.objects.get(name_key="charmander").hp, 39)
+        self.assertEqual((Tipo.objects.count(), Movimiento.objects.count(), Pokemon.objects.count()), (2, 1, 1))
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as fh:
+            header, *rows = fh.read().splitlines()
+        header = json.loads(header)
+        header["counts"]["tipo"] += 1
+        with gzip.open(self.path, "wt", encoding="utf-8") as fh:
+            fh.write("\n".join([json.dumps(header), json.dumps({"model": "tipo", "name": "Water"}), *rows]) + "\n")
+        with self.assertRaisesMessage(SnapshotError, "repetido"):
+            load_snapshot(self.path)
+
+    def test_rejects_other_versions_and_truncated_files(self):
+        self.seed()
+        build_snapshot(self.path)
+        with gzip.open(self.path, "rt", encoding="utf-8") as fh:
+            header, *rows = fh.read().splitlines()
+
+        def write(lines):
+            with gzip.open(self.path, "wt", encoding="utf-8") as fh:
+                fh.write("\n".join(lines) + "\n")
+
+        write([json.dumps({**json.loads(header), "version": 99}), *rows])
+        with self.assertRaisesMessage(SnapshotError, "99"):
+            load_snapshot(self.path)
+
+        write([header, *rows[:-1]])
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+        self.path.write_bytes(b"not gzip")
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+    def test_remote_fallback_can_be_disabled(self):
+        routes = {"pokemon/mew": pokemon_payload("mew", 151, "psychic")}
+        with StubPokeApiServer(routes) as stub, stub_settings(stub, ENABLED=False):
+            response = APIClient().get("/api/pokemon/pokemons/mew/")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(stub.total_hits, 0)
+
+
+# ============================================================
+# 🔹 PERFILES DE BASE DE DATOS
+# ============================================================
+class DatabaseProfileTests(TestCase):
+    def test_profiles_from_environment(self):
+        base_dir = Path("/srv/poke-api")
+        self.assertEqual(database_from_env(base_dir, env={})["ENGINE"], "django.db.backends.sqlite3")
+
+        tuned = database_from_env(base_dir, tuned=True, env={"POKE_API_DB_NAME": "/data/poke.sqlite3"})
+        self.assertEqual(tuned["ENGINE"], "poke_api.backends.sqlite3")
+        self.assertEqual(tuned["PRAGMAS"]["journal_mode"], "WAL")
+        self.assertEqual(tuned["NAME"], "/data/poke.sqlite3")
+
+        pooled = database_from_env(base_dir, env={"POKE_API_DB_ENGINE": "postgres", "POKE_API_DB_POOLER": "pgbouncer"})
+        self.assertEqual(pooled["ENGINE"], "django.db.backends.postgresql")
+        self.assertTrue(pooled["CONN_HEALTH_CHECKS"])
+        self.assertTrue(pooled["DISABLE_SERVER_SIDE_CURSORS"])
+        self.assertEqual(pooled["PORT"], "6432")
+
+        with self.assertRaises(ImproperlyConfigured):
+            database_from_env(base_dir, env={"POKE_API_DB_ENGINE": "oracle"})
+
+    def test_tuned_sqlite_backend_applies_pragmas_and_immediate_transactions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = database_from_env(Path(tmp), tuned=True, env={})
+            config = connections.configure_settings({**connections.settings, "tuned": config})["tuned"]
+            tuned = DatabaseWrapper(config, alias="tuned")
+            try:
+                with tuned.cursor() as cursor:
+                    cursor.execute("PRAGMA journal_mode")
+                    self.assertEqual(cursor.fetchone()[0], "wal")
+                    cursor.execute("PRAGMA busy_timeout")
+                    self.assertEqual(cursor.fetchone()[0], 5000)
+
+                with CaptureQueriesContext(tuned) as context:
+                    tuned._start_transaction_under_autocommit()
+                self.assertEqual(context.captured_queries[-1]["sql"], "BEGIN IMMEDIATE")
+                self.assertTrue(tuned.connection.in_transaction)
+                tuned.connection.rollback()
+            finally:
+                tuned.close()
+
+
+# ============================================================
+# 🔹 BENCHMARKS
+# ============================================================
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class BenchmarkTests(TestCase):
+    def test_endpoints_suite_covers_every_scenario_and_transport(self):
+        results = endpoints.run(sizes=(20,), repeat=1)
+
+        self.assertEqual(
+            {(row["transport"], row["scenario"]) for row in results},
+            {(transport, name) for transport, _ in endpoints.TRANSPORTS for name, _, _ in endpoints.SCENARIOS},
+        )
+        for row in results:
+            self.assertEqual(row["errors"], 0, row)
+            self.assertGreater(row["p99_ms"], 0)
+            self.assertGreater(row["alloc_kib"], 0)
+        by_scenario = {(row["transport"], row["scenario"]): row for row in results}
+        # Las consultas del servidor HTTP (otro hilo) también se cuentan
+        self.assertEqual(by_scenario["http", "login"]["queries_per_request"], by_scenario["client", "login"]["queries_per_request"])
+        self.assertGreater(by_scenario["http", "retrieve-miss"]["queries_per_request"], 1)
+
+    def test_command_saves_and_compares_results(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "lookups.json"
+            call_command("benchmark", "lookups", "--sizes", "10", "--repeat", "1", "--output", str(path), stdout=io.StringIO())
+            saved = json.loads(path.read_text())
+            self.assertEqual((saved["suite"], saved["sizes"]), ("lookups", [10]))
+
+            out = io.StringIO()
+            call_command("benchmark", "lookups", "--sizes", "10", "--repeat", "1", "--compare", str(path), stdout=out)
+            self.assertIn("change_%", out.getvalue())
+            with self.assertRaises(CommandError):
+                call_command("benchmark", "serializers", "--sizes", "10", "--compare", str(path), stdout=io.StringIO())
+
+
+# ============================================================
+# 🔹 MÉTRICAS Y HEALTH CHECK
+# ============================================================
+class MetricsTests(TestCase):
+    def setUp(self):
+        self.api = APIClient()
+
+    def test_requests_and_queries_are_recorded_per_route(self):
+        fill_pokemons(3)
+        before = metrics.http_requests.value("pokemon-list", "GET", "200")
+        queries_before = metrics.db_queries.value("pokemon-list")
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.api.get("/api/pokemon/pokemons/").status_code, 200)
+        executed = len(context.captured_queries)
+        self.assertEqual(metrics.db_queries.value("pokemon-list") - queries_before, executed)
+        self.api.get("/no/existe/")
+
+        self.assertEqual(metrics.http_requests.value("pokemon-list", "GET", "200"), before + 1)
+        self.assertGreaterEqual(metrics.http_requests.value(metrics.UNMATCHED_ROUTE, "GET", "404"), 1)
+
+        body = self.api.get("/api/metrics/").content.decode()
+        self.assertIn('poke_api_http_requests_total{route="pokemon-list",method="GET",status="200"}', body)
+        self.assertIn('poke_api_http_request_duration_seconds_bucket{route="pokemon-list",method="GET",le="+Inf"}', body)
+        self.assertIn("# TYPE poke_api_db_queries_per_request histogram", body)
+        self.assertNotIn("/no/existe/", body)
+
+    def test_upstream_calls_and_cache_ratio_are_exposed(self):
+        before = metrics.upstream_requests.value("pokemon", "ok")
+        routes = {"pokemon/charizard": pokemon_payload("charizard", 6, "fire")}
+        with StubPokeApiServer(routes) as stub, stub_settings(stub):
+            self.api.get("/api/pokemon/pokemons/charizard/")
+            self.api.get("/api/pokemon/pokemons/missingno/")
+        self.assertEqual(metrics.upstream_requests.value("pokemon", "ok"), before + 1)
+        self.assertGreaterEqual(metrics.upstream_requests.value("pokemon", "not_found"), 1)
+
+        catalog_cache.count("pokemon", "detail", "hit")
+        body = self.api.get("/api/metrics/").content.decode()
+        self.assertIn('poke_api_upstream_request_duration_seconds_count{resource="pokemon"}', body)
+        self.assertIn('poke_api_catalog_cache_hit_ratio{resource="pokemon",kind="detail"}', body)
+
+    def test_histogram_exposition_is_cumulative(self):
+        histogram = metrics.Histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3):
+            histogram.observe(value, "x")
+        self.assertEqual(list(histogram.samples()), [
+            'demo_seconds_bucket{route="x",le="0.1"} 1',
+            'demo_seconds_bucket{route="x",le="1.0"} 3',
+            'demo_seconds_bucket{route="x",le="+Inf"} 4',
+            'demo_seconds_sum{route="x"} 4.05',
+            'demo_seconds_count{route="x"} 4',
+        ])
+
+    def test_health_check_reports_real_liveness(self):
+        response = self.api.get("/api/health/")
+        self.assertEqual(response.status_code, 200)
+        checks = response.json()["checks"]
+        self.assertEqual(checks["database"]["status"], "ok")
+        self.assertEqual(checks["cache:catalog"]["status"], "ok")
+
+        with mock.patch("poke_api.views._check_database", side_effect=DatabaseError("caída")):
+            response = self.api.get("/api/health/")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["checks"]["database"]["status"], "error")
@@ -6,26 +6,46 @@ Incluye:
 - /api/pokemon/movimientos/   → CRUD de Movimientos
 - /api/pokemon/tipos/         → CRUD de Tipos
 - /api/pokemon/random/        → Obtiene un Pokémon aleatorio
-- /api/pokemon/capturar/      → Captura un Pokémon (POST)
+- /api/pokemon/capturas/      → Equipo del usuario (GET), captura (POST), liberar (DELETE)
+- /api/pokemon/capturar/      → Captura un Pokémon (POST, alias de /capturas/)
+- /api/pokemon/battles/simulate/ → Simula batallas en el servidor (POST)
+- /api/pokemon/cache/         → Aciertos/fallos de la caché de lecturas
+- /api/pokemon/search/?q=     → Sugerencias de nombres (tolera errores de escritura)
+- /api/pokemon/rankings/      → Top por estadísticas totales o tasa de victorias
+
+Con ``settings.POKEMON_ASYNC_READS`` (activo bajo ASGI), el detalle de
+pokemons/tipos/movimientos y /random/ se sirven con las vistas asíncronas
+de ``pokemon/api/async_views.py``, que delegan en los viewsets.
 
 Autor: Equipo Pokémon Project
 Fecha: 2025-10-23
 """
 
-from django.urls import path, include
+import re
+
+from django.conf import settings
+from django.urls import path, include, re_path
 from rest_framework.routers import DefaultRouter
 
 # 🔹 Importación de viewsets y vistas personalizadas
+from pokemon.api import async_views
+from pokemon.api.battle_viewset import BattleViewSet
+from pokemon.api.cache_viewset import cache_stats
+from pokemon.api.captura_viewset import CapturaViewSet
 from pokemon.api.movimiento_viewset import MovimientoViewSet
+from pokemon.api.ranking_viewset import RankingViewSet
+from pokemon.api.search_viewset import name_search
 from pokemon.api.tipo_viewset import TipoViewSet
 from pokemon.api.pokenmon_viewset import PokemonViewSet
-from pokemon.views import capturar_pokemon  # ✅ vista creada en pokemon/views.py
 
 # ⚙️ Router principal (DRF)
 router = DefaultRouter()
 router.register(r"pokemons", PokemonViewSet, basename="pokemon")
 router.register(r"movimientos", MovimientoViewSet, basename="movimiento")
 router.register(r"tipos", TipoViewSet, basename="tipo")
+router.register(r"battles", BattleViewSet, basename="battle")
+router.register(r"capturas", CapturaViewSet, basename="captura")
+router.register(r"rankings", RankingViewSet, basename="ranking")
 
 # 🧭 Definición de rutas principales
 urlpatterns = [
@@ -36,8 +56,48 @@ urlpatterns = [
     path("random/", PokemonViewSet.as_view({"get": "random_pokemon"}), name="pokemon-random"),
 
     # 🔹 Endpoint para capturar Pokémon
-    path("capturar/", capturar_pokemon, name="pokemon-capturar"),
+    path("capturar/", CapturaViewSet.as_view({"post": "create"}), name="pokemon-capturar"),
+
+    # 🔹 Estadísticas de la caché de lecturas
+    path("cache/", cache_stats, name="pokemon-cache-stats"),
+
+    # 🔹 Búsqueda aproximada de nombres
+    path("search/", name_search, name="pokemon-search"),
 ]
 
+
+def detail_pk(viewset):
+    """
+    Patrón del ``pk`` de detalle de ``viewset`` que excluye sus acciones de
+    lista (``@action(detail=False)``), para que las sigan atendiendo el router.
+    """
+    paths = sorted(re.escape(extra.url_path) for extra in viewset.get_extra_actions() if not extra.detail)
+    if not paths:
+        return r"(?P<pk>[^/.]+)"
+    return rf"(?P<pk>(?!(?:{'|'.join(paths)})/?$)[^/.]+)"
+
+
+# ⚡ Lecturas asíncronas (ASGI): van antes que el router para tener prioridad.
+if settings.POKEMON_ASYNC_READS:
+    urlpatterns = [
+        re_path(
+            rf"^pokemons/{detail_pk(PokemonViewSet)}/$",
+            async_views.pokemon_detail,
+            name="pokemon-detail-async",
+        ),
+        re_path(
+            rf"^tipos/{detail_pk(TipoViewSet)}/$",
+            async_views.tipo_detail,
+            name="tipo-detail-async",
+        ),
+        re_path(
+            rf"^movimientos/{detail_pk(MovimientoViewSet)}/$",
+            async_views.movimiento_detail,
+            name="movimiento-detail-async",
+        ),
+        path("pokemons/random/", async_views.random_pokemon, name="pokemon-random-async"),
+        path("random/", async_views.random_pokemon, name="pokemon-random"),
+    ] + urlpatterns
+
 # 💬 Mensaje de consola al cargar el módulo
-print("✅ Rutas del módulo Pokémon cargadas: /pokemons/, /movimientos/, /tipos/, /random/, /capturar/")
+print("✅ Rutas del módulo Pokémon cargadas: /pokemons/, /movimientos/, /tipos/, /random/, /capturas/, /capturar/, /battles/, /cache/, /search/, /rankings/")
@@ -5,14 +5,15 @@ Incluye:
 - PokemonViewSet: CRUD completo + endpoint /random/
 - TipoViewSet: CRUD de Tipos
 - MovimientoViewSet: CRUD de Movimientos
-- capturar_pokemon: endpoint personalizado para capturar Pokémon
+
+La captura de Pokémon vive en ``pokemon/api/captura_viewset.py``.
 
 Autor: Equipo Pokémon Project
 Fecha: 2025-10-23
 """
 
 from rest_framework import viewsets, status
-from rest_framework.decorators import action, api_view
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db.models import Count
 from django.utils.decorators import method_decorator
@@ -67,58 +68,3 @@ class MovimientoViewSet(viewsets.ModelViewSet):
     """
     queryset = Movimiento.objects.all()
     serializer_class = MovimientoSerializer
-
-
-# 🎯 Endpoint personalizado: Capturar Pokémon
-@api_view(["POST"])
-def capturar_pokemon(request):
-    """
-    Captura un Pokémon por nombre.
-    Simula un límite máximo de 10 capturas totales.
-
-    Request:
-    {
-        "name": "Pikachu"
-    }
-
-    Response (201 Created):
-    {
-        "message": "🎯 ¡Has capturado a Pikachu!",
-        "pokemon": { ...datos del Pokémon... }
-    }
-    """
-    nombre = request.data.get("name")
-
-    # ⚠️ Validación básica
-    if not nombre:
-        return Response(
-            {"error": "Falta el nombre del Pokémon."},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    # 🔎 Buscar Pokémon
-    try:
-        pokemon = Pokemon.objects.get(name__iexact=nombre.strip())
-    except Pokemon.DoesNotExist:
-        return Response(
-            {"error": f"Pokémon '{nombre}' no encontrado."},
-            status=status.HTTP_404_NOT_FOUND,
-        )
-
-    # 🚫 Simulación de límite máximo de 10 capturas
-    total_capturados = Pokemon.objects.count()
-    if total_capturados >= 10:
-        return Response(
-            {"error": "Ya tienes el máximo de 10 Pokémon capturados."},
-            status=status.HTTP_403_FORBIDDEN,
-        )
-
-    # ✅ Captura exitosa
-    serializer = PokemonSerializer(pokemon)
-    return Response(
-        {
-            "message": f"🎯 ¡Has capturado a {pokemon.name.title()}!",
-            "pokemon": serializer.data,
-        },
-        status=status.HTTP_201_CREATED,
-    )
@@ -49,20 +49,19 @@ export default function Battle() {
   const getRandomPokemons = useCallback(async () => {
     try {
       setLoading(true);
-      const [res1, res2] = await Promise.all([
-        api.get("/pokemon/random/"),
-        api.get("/pokemon/random/"),
-      ]);
+      // Una sola petición para ambos combatientes
+      const res = await api.get("/pokemon/random/", { params: { count: 2 } });
+      const [first, second = first] = res.data;
 
       const playerData = {
-        ...res1.data,
-        hp: res1.data.hp * 5,
-        max_hp: res1.data.hp * 5,
+        ...first,
+        hp: first.hp * 5,
+        max_hp: first.hp * 5,
       };
       const enemyData = {
-        ...res2.data,
-        hp: res2.data.hp * 5,
-        max_hp: res2.data.hp * 5,
+        ...second,
+        hp: second.hp * 5,
+        max_hp: second.hp * 5,
       };
 
       setPlayer(playerData);
@@ -148,7 +147,7 @@ export default function Battle() {
       const res = await api.post("/pokemon/capturar/", { name: enemy.name });
       if (res.status === 201 || res.status === 200) {
         setCaptured(true);
-        setCapturedCount((prev) => prev + 1);
+        setCapturedCount(res.data.capturas);
         setLog((prev) => [...prev, `🎯 ¡Has capturado a ${enemy.name}!`]);
       } else {
         setLog((prev) => [...prev, "⚠️ No se pudo capturar el Pokémon."]);
@@ -167,6 +166,14 @@ export default function Battle() {
     getRandomPokemons();
   }, [getRandomPokemons]);
 
+  // 🎒 Capturas ya registradas del usuario
+  useEffect(() => {
+    api
+      .get("/pokemon/capturas/")
+      .then((res) => setCapturedCount(res.data.length))
+      .catch(() => {});
+  }, []);
+
   // 🕓 Pantalla de carga
   if (loading || !player || !enemy) {
     return (
@@ -11,6 +11,15 @@ export const api = axios.create({
   timeout: 10000, // 10 segundos de límite de espera
 });
 
+// 🔐 Adjuntar el token JWT (las capturas son por usuario)
+api.interceptors.request.use((config) => {
+  const token = localStorage.getItem("token");
+  if (token) {
+    config.headers.Authorization = `Bearer ${token}`;
+  }
+  return config;
+});
+
 // 🧠 Interceptor de errores global (para debugging y control central)
 api.interceptors.response.use(
   (response) => response,
@@ -31,7 +40,8 @@ api.interceptors.response.use(
 export async function getPokemons() {
   try {
     const res = await api.get("pokemon/");
-    return res.data;
+    // Los listados vienen paginados: { count, next, previous, results }
+    return res.data.results ?? res.data;
   } catch (error) {
     console.error("⚠️ Error al obtener los Pokémon:", error);
     return [];
@@ -73,7 +83,7 @@ export async function getRandomPokemon() {
 export async function getTipos() {
   try {
     const res = await api.get("pokemon/tipos/");
-    return res.data;
+    return res.data.results ?? res.data;
   } catch (error) {
     console.error("⚠️ Error al obtener los tipos:", error);
     return [];